@@ -0,0 +1,67 @@
+from contextlib import redirect_stdout
+from io import StringIO
+from os import path
+from sys import argv, path as sys_path
+from time import perf_counter
+
+sys_path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+import PyLang as pl
+
+##################
+# ! BENCHMARKS ! #
+##################
+
+# python Benchmarks/bench.py [script.pyl ...] [-repeat=N]
+# Runs every script with every engine, prints the best time of each and checks that their outputs are the same
+
+ENGINES = [pl.ENGINE_TREE, pl.ENGINE_CLOSURE, pl.ENGINE_VM, pl.ENGINE_EXCEPTIONS]
+SCRIPTS = ['loops.pyl', 'calls.pyl', 'lists.pyl', 'fib.pyl', 'strings.pyl', 'arithmetic.pyl', 'guards.pyl', 'counted.pyl', 'signals.pyl']
+
+def run_script(file_name : str, text : str, engine : str) -> tuple[float, str]:
+    pl.GLOBAL_ENGINE = engine
+    output = StringIO()
+
+    start = perf_counter()
+    with redirect_stdout(output):
+        _, error = pl._run(file_name, text, pl.SymbolTable(pl.global_symbol_table))
+    duration = perf_counter() - start
+
+    if error: output.write(str(error))
+    return duration, output.getvalue()
+
+def bench(file_name : str, repeat : int) -> bool:
+    with open(file_name) as f:
+        text = f.read()
+
+    print(path.basename(file_name))
+    outputs = {}
+    baseline = None
+
+    for engine in ENGINES:
+        times = []
+        for _ in range(repeat):
+            duration, outputs[engine] = run_script(file_name, text, engine)
+            times.append(duration)
+        best = min(times)
+        baseline = baseline or best
+        print(f'  {engine:<10} {best * 1000:>9.1f} ms   x{baseline / best:.2f}')
+
+    same = len(set(outputs.values())) == 1
+    if not same:
+        print('  ! outputs differ between engines')
+        for engine, output in outputs.items():
+            print(f'  --- {engine}\n{output}')
+    return same
+
+if __name__ == '__main__':
+    args = argv[1:]
+    repeat = 3
+    for arg in args[:]:
+        if arg.startswith('-repeat='):
+            repeat = int(arg.split('=')[1])
+            args.remove(arg)
+
+    scripts = args or [path.join(path.dirname(path.abspath(__file__)), script) for script in SCRIPTS]
+    results = [bench(script, repeat) for script in scripts]
+    if not all(results): exit(1)
@@ -0,0 +1,94 @@
+from os import path
+from sys import argv, path as sys_path
+
+sys_path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+import PyLang as pl
+
+from bench import ENGINES, run_script
+
+############################
+# ! CALL SITE BENCHMARKS ! #
+############################
+
+# python Benchmarks/callsite.py [-repeat=N]
+# Runs CALLS calls of each kind of PROGRAMS on every engine and prints the best cost of a call,
+# the time of the same loop without the call taken off, then checks that CHECKS print what they should on every engine
+
+CALLS = 20000
+
+FUNCS = 'func f(a, b) {\n    return a\n}\nfunc g(a, b = 1, c = 2) {\n    return a\n}\n'
+
+GENERATORS = (
+    'func count(n, by) {\n    var i = 0\n    while i < n {\n        yield i * by\n        var i = i + 1\n    }\n}\n'
+    'func wrap(n) {\n    var local = n\n    return count(n, by = 2)\n}\n'
+    'func reader() {\n    yield seen\n    yield seen + 1\n}\nfunc holder(seen) {\n    return reader()\n}\n'
+)
+
+# The loop body of each kind of call, the empty one is the loop alone
+PROGRAMS = {
+    'empty'      : 'var x = i',
+    'positional' : 'var x = f(i, 1)',
+    'keyword'    : 'var x = f(b = 1, a = i)',
+    'defaults'   : 'var x = g(i)',
+    'builtin'    : 'var x = len("pylang")',
+}
+
+# Programs and their outputs, or a part of their error : plans bind every arg as check_populate_args did,
+# and contexts go back to the pool only when nothing can reach them any more
+CHECKS = [
+    (FUNCS + 'println(f(1, 2))\nprintln(f(b = 2, a = 1))\nprintln(g(3, c = 4))\nprintln(g(a = 5))', '1\n1\n3\n5\n'),
+    ('func h(a, b = 2, c = 3) {\n    return a + b * 10 + c * 100\n}\nprintln(h(1))\nprintln(h(1, c = 7))\nprintln(h(c = 1, a = 2))', '321\n721\n122\n'),
+    # The same site calling functions of other signatures
+    ('func h(a, b = 2) {\n    return a + b\n}\nfunc k(b, a = 5) {\n    return a - b\n}\nfor func_value in [k, h] {\n    println(func_value(1, a = 3))\n}',
+     "Multiple values for arg 'a' passed into 'h'!"),
+    ('func h(a, b = 2) {\n    return a + b\n}\nfunc k(b, a = 5) {\n    return a - b\n}\nfor func_value in [h, k, h] {\n    println(func_value(b = 1, a = 3))\n}',
+     '4\n2\n4\n'),
+    (FUNCS + 'f(1, 2, 3)', "Too many args passed into 'f'!\nNeeded 2, given 3"),
+    (FUNCS + 'f(1)', "Too few args passed into 'f'!\nNeeded at least 2, given 1"),
+    (FUNCS + 'g(b = 1)', "Too few args passed into 'g'!\nNeeded at least 1, given 1"),
+    (FUNCS + 'f(1, c = 2)', "Unexpected arg 'c' passed into 'f'!"),
+    (FUNCS + 'f(1, a = 2)', "Multiple values for arg 'a' passed into 'f'!"),
+    ('len("a", "b")', "Too many args passed into 'len'!\nNeeded 1, given 2"),
+    # Generators keep the contexts of their calls and callers out of the pool, the calls made meanwhile can't reuse them
+    (FUNCS + GENERATORS + 'var g = wrap(3)\nfor i = 0 to 20 {\n    f(i, i)\n}\nfor v in g {\n    println(v)\n}', '0\n2\n4\n'),
+    (FUNCS + GENERATORS + 'var r = holder(40)\nfor i = 0 to 20 {\n    f(i, holder(i))\n}\nfor v in r {\n    println(v)\n}', '40\n41\n'),
+    (FUNCS + 'func h(n) {\n    if n == 0 { return 1 / 0 }\n    var k = f(n, 1)\n    return h(n - 1) + 1\n}\nh(2)', '  File <check>, line 10, in h\n  File <check>, line 10, in h\n  File <check>, line 8, in h'),
+]
+
+def program(body : str) -> str:
+    return FUNCS + f'for i = 0 to {CALLS} {{\n    {body}\n}}\nprintln(x)'
+
+def bench(engine : str, repeat : int) -> bool:
+    times = {}
+    outputs = set()
+    for name, body in PROGRAMS.items():
+        runs = [run_script(name, program(body), engine) for _ in range(repeat)]
+        times[name] = min(duration for duration, _ in runs)
+        if name != 'empty': outputs.add(runs[0][1])
+
+    costs = [f'{name} {(times[name] - times["empty"]) / CALLS * 1e6:>5.1f}' for name in PROGRAMS if name != 'empty']
+    print(f'{engine:<10} µs per call : {"   ".join(costs)}')
+
+    # Every call gives back i but the builtin
+    if len(outputs - {'6\n'}) != 1: print(f'  ! {outputs!r}')
+    return len(outputs - {'6\n'}) == 1
+
+def check(text : str, expected : str) -> bool:
+    outputs = {run_script('<check>', text, engine)[1] for engine in ENGINES}
+    if expected.endswith('\n'): return outputs == {expected}
+    return len(outputs) == 1 and expected in outputs.pop()
+
+if __name__ == '__main__':
+    repeat = 3
+    for arg in argv[1:]:
+        if arg.startswith('-repeat='):
+            repeat = int(arg.split('=')[1])
+
+    results = [bench(engine, repeat) for engine in ENGINES]
+
+    failed = [text for text, expected in CHECKS if not check(text, expected)]
+    print(f'{len(CHECKS)} checks')
+    for text in failed:
+        print(f'  ! {text!r}')
+    if failed or not all(results): exit(1)
@@ -0,0 +1,76 @@
+from os import path
+from sys import argv, path as sys_path
+
+sys_path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+import PyLang as pl
+
+from bench import ENGINES, run_script
+
+###############################
+# ! COUNTED LOOP BENCHMARKS ! #
+###############################
+
+# python Benchmarks/counted.py [script.pyl ...] [-repeat=N]
+# Runs the counted loop heavy scripts on every engine and prints the best times,
+# then checks that CHECKS print what they should on every engine, with and without the Folder
+
+SCRIPTS = ['counted.pyl']
+
+# Programs and their outputs : the variable of a loop holds its last value once the loop ends, breaks or returns,
+# whether or not its body can see it
+CHECKS = [
+    ('for i = 0 to 5 { var x = 1 }\nprintln(i)', '4\n'),
+    ('for i = 0 to 10 {\n    if i == 3 { break }\n}\nprintln(i)', '3\n'),
+    ('for i = 0 to 3 { var i = 10 }\nprintln(i)', '10\n'),
+    ('var i = 7\nfor i = 5 to 5 { var x = 1 }\nprintln(i)', '7\n'),
+    ('for i = 5 to 0 { var x = 1 }\nprintln(i)', '1\n'),
+    ('for i = 0 to 1 step 0.25 { var x = 1 }\nprintln(i)', '0.75\n'),
+    ('func f() {\n    return i\n}\nfor i = 0 to 3 { println(f()) }', '0\n1\n2\n'),
+    # A generator made before the loop reads it when the body pulls its values
+    ('func gen() {\n    while true {\n        yield i\n    }\n}\nvar g = gen()\nvar total = 0\nfor i = 0 to 4 {\n    for v in g {\n        var total += v\n        break\n    }\n}\nprintln(total)', '6\n'),
+    ('func f() {\n    for i = 0 to 10 {\n        if i == 4 { return i }\n    }\n}\nprintln(f())', '4\n'),
+    ('var xs = for i = 0 to 4 { i * 2 }\nprintln(xs)\nprintln(i)', '[0, 2, 4, 6]\n3\n'),
+    ('var n = 0\nfor i = 0 to 4 {\n    if i == 1 { continue }\n    var n += 1\n}\nprintln(n)\nprintln(i)', '3\n3\n'),
+]
+
+def bench(name : str, text : str, repeat : int) -> bool:
+    print(path.basename(name))
+    outputs = set()
+    baseline = None
+    for engine in ENGINES:
+        runs = [run_script(name, text, engine) for _ in range(repeat)]
+        outputs.add(runs[0][1])
+        best = min(duration for duration, _ in runs)
+        baseline = baseline or best
+        print(f'  {engine:<10} {best * 1000:>9.1f} ms   x{baseline / best:.2f}')
+
+    if len(outputs) != 1: print('  ! outputs differ between engines')
+    return len(outputs) == 1
+
+def check(text : str, expected : str) -> bool:
+    outputs = set()
+    for fold in (True, False):
+        pl.GLOBAL_FOLD = fold
+        try:
+            outputs |= {run_script('<check>', text, engine)[1] for engine in ENGINES}
+        finally:
+            pl.GLOBAL_FOLD = True
+    return outputs == {expected}
+
+if __name__ == '__main__':
+    args = argv[1:]
+    repeat = 3
+    for arg in args[:]:
+        if arg.startswith('-repeat='):
+            repeat = int(arg.split('=')[1])
+            args.remove(arg)
+
+    scripts = args or [path.join(path.dirname(path.abspath(__file__)), script) for script in SCRIPTS]
+    results = [bench(script, open(script).read(), repeat) for script in scripts]
+
+    failed = [text for text, expected in CHECKS if not check(text, expected)]
+    print(f'{len(CHECKS)} checks')
+    for text in failed:
+        print(f'  ! {text!r}')
+    if failed or not all(results): exit(1)
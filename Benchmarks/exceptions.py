@@ -0,0 +1,69 @@
+from os import path
+from sys import argv, path as sys_path
+
+sys_path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+import PyLang as pl
+
+from bench import SCRIPTS, run_script
+
+#############################
+# ! EXCEPTIONS BENCHMARKS ! #
+#############################
+
+# python Benchmarks/exceptions.py [script.pyl ...] [-repeat=N]
+# Runs the scripts with the ClosureCompiler (an RTResult per node) and the ExceptionCompiler (signals raised),
+# prints the best times and checks that the outputs, and the errors of ERRORS, are the same
+
+ENGINES = [pl.ENGINE_CLOSURE, pl.ENGINE_EXCEPTIONS]
+
+# Errors, return, break and continue through loops, functions and generators
+ERRORS = [
+    'var a = 1\nprintln(a + "b")',
+    'func f(x) {\n    return x / 0\n}\nfor i = 0 to 3 {\n    f(i)\n}',
+    'func f(x) {\n    if x == 0 { return undefined }\n    return f(x - 1)\n}\nf(5)',
+    'var a = [1, 2, 3]\nprintln(a[1:9])',
+    'for i in 5 {\n    println(i)\n}',
+    'func g() {\n    yield 1\n    yield 1 - "a"\n}\nfor value in g() {\n    println(value)\n}',
+    'var total = 0\nfor i = 0 to 10 {\n    if i == 3 { continue }\n    if i == 7 { break }\n    var total += i\n}\nprintln(total)',
+    'func f() {\n    while true {\n        return [1, 2]\n    }\n}\nprintln(f()[0])',
+    'println("{1 + [1]}")',
+    'import "missing"',
+]
+
+def bench(name : str, text : str, repeat : int) -> bool:
+    times = {}
+    outputs = {}
+    for engine in ENGINES:
+        runs = [run_script(name, text, engine) for _ in range(repeat)]
+        times[engine] = min(duration for duration, _ in runs)
+        outputs[engine] = runs[0][1]
+
+    results, exceptions = times[pl.ENGINE_CLOSURE], times[pl.ENGINE_EXCEPTIONS]
+    print(path.basename(name))
+    print(f'  RTResult    {results * 1000:>9.1f} ms')
+    print(f'  exceptions  {exceptions * 1000:>9.1f} ms   x{results / exceptions:.2f}')
+
+    same = len(set(outputs.values())) == 1
+    if not same: print('  ! outputs differ')
+    return same
+
+def check_errors() -> bool:
+    different = [text for text in ERRORS if len({run_script('<check>', text, engine)[1] for engine in ENGINES}) != 1]
+    print(f'errors ({len(ERRORS)} programs)')
+    for text in different:
+        print(f'  ! {text!r} differs')
+    return not different
+
+if __name__ == '__main__':
+    args = argv[1:]
+    repeat = 3
+    for arg in args[:]:
+        if arg.startswith('-repeat='):
+            repeat = int(arg.split('=')[1])
+            args.remove(arg)
+
+    scripts = args or [path.join(path.dirname(path.abspath(__file__)), script) for script in SCRIPTS]
+    results = [bench(script, open(script).read(), repeat) for script in scripts]
+    results.append(check_errors())
+    if not all(results): exit(1)
@@ -0,0 +1,77 @@
+from os import path
+from sys import argv, path as sys_path
+
+sys_path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+import PyLang as pl
+
+from bench import ENGINES, run_script
+
+##########################
+# ! FOLDING BENCHMARKS ! #
+##########################
+
+# python Benchmarks/folding.py [script.pyl ...] [-repeat=N]
+# Runs the scripts and CHECKS with and without the Folder on every engine, prints the best times
+# and checks that the outputs (errors included) are the same
+
+SCRIPTS = ['constants.pyl', 'loops.pyl', 'calls.pyl', 'lists.pyl', 'fib.pyl']
+
+# Programs whose folded operations or cases must behave as when they are run
+CHECKS = [
+    'println(60 * 60 * 24)\nprintln("ab" * 3 + "c")\nprintln(-"abc")\nprintln(-(3 - 5) ** 2)\nprintln(7 // 2 % 5 / 4)',
+    'println("before")\nvar a = 1 / 0\nprintln("after")',
+    'func f() {\n    return 5 % (2 - 2)\n}\nprintln(f())',
+    'var a = 10 // (3 - 3)',
+    'var a = (2 * 3) + "a"',
+    'var a = 2 ** 1000\nprintln(a % 7)',
+    'if 1 == 2 { println(1) } elif 2 == 2 { println(2) } else { println(3) }',
+    'if "a" == "b" { println(1) } elif 1 { println(2) }\nprintln([if 1 == 2 { 3 }])',
+    'if !(1 == 2) && 2 < 3 { println(1) } else { println(2) }',
+    'func f(a = 2 * 3) {\n    return a * 2\n    println("never")\n}\nprintln(f())',
+    'for i = 0 to 3 {\n    if i == 1 {\n        continue\n        println("never")\n    }\n    println(i)\n}',
+    'var day = 60 * 60 * 24\nprintln("{day} seconds")',
+]
+
+def run_folded(file_name : str, text : str, engine : str, fold : bool) -> tuple[float, str]:
+    pl.GLOBAL_FOLD = fold
+    try:
+        return run_script(file_name, text, engine)
+    finally:
+        pl.GLOBAL_FOLD = True
+
+def check(file_name : str, text : str, repeat : int, show : bool) -> bool:
+    same = True
+    if show: print(path.basename(file_name))
+
+    for engine in ENGINES:
+        times = {}
+        outputs = {}
+        for fold in (False, True):
+            durations = []
+            for _ in range(repeat):
+                duration, outputs[fold] = run_folded(file_name, text, engine, fold)
+                durations.append(duration)
+            times[fold] = min(durations)
+
+        if show: print(f'  {engine:<10} {times[False] * 1000:>9.1f} ms   folded {times[True] * 1000:>9.1f} ms   x{times[False] / times[True]:.2f}')
+        if outputs[False] != outputs[True]:
+            same = False
+            print(f'  ! {engine} output differs once folded : {file_name}')
+            print(f'  --- not folded\n{outputs[False]}\n  --- folded\n{outputs[True]}')
+    return same
+
+if __name__ == '__main__':
+    args = argv[1:]
+    repeat = 3
+    for arg in args[:]:
+        if arg.startswith('-repeat='):
+            repeat = int(arg.split('=')[1])
+            args.remove(arg)
+
+    folder = path.dirname(path.abspath(__file__))
+    scripts = args or [path.join(folder, script) for script in SCRIPTS]
+    results = [check(script, open(script).read(), repeat, True) for script in scripts]
+    results += [check('<check>', text, 1, False) for text in CHECKS]
+    print(f'{len(CHECKS)} checks')
+    if not all(results): exit(1)
@@ -0,0 +1,99 @@
+from os import path
+from sys import argv, path as sys_path
+
+sys_path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+import PyLang as pl
+
+from bench import ENGINES, run_script
+
+############################
+# ! GENERATOR BENCHMARKS ! #
+############################
+
+# python Benchmarks/generators.py [-repeat=N]
+# Sums SIZE numbers pulled from a generator and the same numbers counted by a while loop on every engine,
+# in turn so that a slower moment of the machine slows them both, and fails when the generator is more than
+# MAX_SLOWDOWN times slower. Then runs many generators at once and checks that CHECKS print what they should on every engine
+
+SIZE = 100000
+MAX_SLOWDOWN = 2.5
+
+COUNT = 'func count(n) {\n    var i = 0\n    while i < n {\n        yield i\n        var i = i + 1\n    }\n}\n'
+
+YIELD_SUM = COUNT + f'var total = 0\nfor i in count({SIZE}) {{\n    var total = total + i\n}}\nprintln(total)'
+WHILE_SUM = f'var total = 0\nvar i = 0\nwhile i < {SIZE} {{\n    var total = total + i\n    var i = i + 1\n}}\nprintln(total)'
+# Generators are only stopped frames, making thousands of them holds no thread
+MANY = COUNT + 'var generators = for k = 0 to 5000 { count(3) }\nvar total = 0\nfor generator in generators {\n    for x in generator { var total = total + x }\n}\nprintln(total)'
+
+# Programs and their outputs
+CHECKS = [
+    # Yields in ifs and nested loops, break, continue and return in the body
+    (COUNT + 'func pick(n) {\n    for i = 0 to n {\n        if i == 1 {\n            continue\n        } elif i % 2 == 0 {\n            yield i\n        } else {\n'
+     '            for j in count(i) {\n                yield [i, j]\n                if j == 1 { break }\n            }\n        }\n        if i == 5 { return }\n    }\n    yield -1\n}\n'
+     'for x in pick(10) { println(x) }',
+     '0\n2\n[3, 0]\n[3, 1]\n4\n[5, 0]\n[5, 1]\n'),
+    # The error of the body stops the loop pulling its values
+    ('func failing() {\n    yield 1\n    yield 1 / 0\n    yield 2\n}\nfor x in failing() { println(x) }',
+     '1\nTraceback (most recent call last):\n  File <check>, line 6, in <program>\n  File <check>, line 3, in failing\nRuntime Error: Division by zero\n\n\n\n    yield 1 / 0\n              ^\n    yield 2\n^^^^^^^^^^^\n}\n^\nfor x in failing() { println(x) }\n^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^'),
+    # A generator is pulled once, the values of a loop are kept in a list
+    (COUNT + 'var g = count(3)\nprintln([for x in g { x * 2 }])\nprintln([for x in g { x }])\nfunc lists() {\n    yield for x in count(2) { x }\n    yield\n}\nfor x in lists() { println(x) }',
+     '[[0, 2, 4]]\n[[]]\n[0, 1]\nNone\n'),
+    # The body reads the variables its caller changed while it was stopped
+    ('var size = 1\nfunc sizes() {\n    yield size\n    yield size\n}\nfor x in sizes() {\n    println(x)\n    var size = 10\n}',
+     '1\n10\n'),
+    # Only statements can stop the generator, not the values they compute
+    ('func f() {\n    var x = if true { yield 1 }\n}',
+     "Invalid Syntax: 'yield' can't be inside a value, only in the statements of the function and of its ifs and loops\nFile <check>, line 2\n\n\n    var x = if true { yield 1 }\n                      ^^^^^^^^^"),
+]
+
+def bench(repeat : int) -> bool:
+    print(f'sum of {SIZE} numbers')
+    passed = True
+    for engine in ENGINES:
+        yield_times, while_times, outputs = [], [], set()
+        for _ in range(repeat):
+            duration, output = run_script('<yield>', YIELD_SUM, engine)
+            yield_times.append(duration)
+            outputs.add(output)
+            duration, output = run_script('<while>', WHILE_SUM, engine)
+            while_times.append(duration)
+            outputs.add(output)
+
+        slowdown = min(yield_times) / min(while_times)
+        print(f'  {engine:<10} yield {min(yield_times) * 1000:>8.1f} ms   while {min(while_times) * 1000:>8.1f} ms   x{slowdown:.2f}')
+        if len(outputs) != 1:
+            print('  ! the sums differ')
+            passed = False
+        if slowdown > MAX_SLOWDOWN:
+            print(f'  ! more than x{MAX_SLOWDOWN} slower than the while loop')
+            passed = False
+    return passed
+
+def bench_many(repeat : int) -> bool:
+    print('5000 generators')
+    outputs = set()
+    for engine in ENGINES:
+        runs = [run_script('<many>', MANY, engine) for _ in range(repeat)]
+        outputs.add(runs[0][1])
+        print(f'  {engine:<10} {min(duration for duration, _ in runs) * 1000:>9.1f} ms')
+
+    if outputs != {'15000\n'}: print('  ! wrong total')
+    return outputs == {'15000\n'}
+
+def check(text : str, expected : str) -> bool:
+    return {run_script('<check>', text, engine)[1] for engine in ENGINES} == {expected}
+
+if __name__ == '__main__':
+    repeat = 3
+    for arg in argv[1:]:
+        if arg.startswith('-repeat='):
+            repeat = int(arg.split('=')[1])
+
+    results = [bench(repeat), bench_many(repeat)]
+
+    failed = [text for text, expected in CHECKS if not check(text, expected)]
+    print(f'{len(CHECKS)} checks')
+    for text in failed:
+        print(f'  ! {text!r}')
+    if failed or not all(results): exit(1)
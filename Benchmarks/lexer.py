@@ -0,0 +1,85 @@
+from os import path
+from sys import argv, path as sys_path
+from time import perf_counter
+
+sys_path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+from Core.Lexer import Lexer
+from Core.FastLexer import FastLexer
+
+########################
+# ! LEXER BENCHMARKS ! #
+########################
+
+# python Benchmarks/lexer.py [script.pyl ...] [-size=MB] [-repeat=N]
+# Lexes the scripts (or a generated program of the given size) with the Lexer and the FastLexer,
+# checks that they produce the same tokens and that the FastLexer is at least MIN_SPEEDUP times faster on texts of a megabyte or more,
+# the time the Parser takes to read all its tokens included
+
+MIN_SPEEDUP = 10
+SCRIPTS = ['loops.pyl', 'calls.pyl', 'lists.pyl', 'fib.pyl']
+
+def generated_text(size : int) -> str:
+    # Benchmark scripts, usage examples and a data table, repeated up to size bytes
+    folder = path.dirname(path.abspath(__file__))
+    parts = [open(path.join(folder, script)).read() for script in SCRIPTS]
+    parts.append(open(path.join(path.dirname(folder), 'Usage.pyl')).read())
+    parts.append('var table = [' + ', '.join(f'[{i}, {i * 0.5}, "row {i}"]' for i in range(200)) + ']\n')
+    block = '\n'.join(parts) + '\n'
+    return block * (size // len(block) + 1)
+
+def token_key(tokens : list) -> list:
+    return [(token.type, token.value, token.pos_start.index, token.pos_start.line, token.pos_start.column) for token in tokens]
+
+def timed(lexer_class, text : str) -> tuple[float, list]:
+    start = perf_counter()
+    tokens, error = lexer_class('<bench>', text).make_tokens()
+    duration = perf_counter() - start
+    if error: raise Exception(str(error))
+    return duration, tokens
+
+def bench(name : str, text : str, repeat : int) -> bool:
+    # The lexers run in turn, a slower moment of the machine slows them both
+    slow = fast = read = float('inf')
+    slow_tokens = fast_tokens = None
+    for _ in range(repeat):
+        # The tokens of the last run are freed before timing the next one
+        slow_tokens = None
+        duration, slow_tokens = timed(Lexer, text)
+        slow = min(slow, duration)
+
+        fast_tokens = None
+        duration, fast_tokens = timed(FastLexer, text)
+        fast = min(fast, duration)
+
+        start = perf_counter()
+        for token in fast_tokens: pass
+        read = min(read, perf_counter() - start)
+    same = token_key(slow_tokens) == token_key(fast_tokens)
+
+    print(f'{name} ({len(text) / 1e6:.1f} MB, {len(slow_tokens)} tokens)')
+    print(f'  Lexer      {slow * 1000:>9.1f} ms')
+    print(f'  FastLexer  {fast * 1000:>9.1f} ms   x{slow / fast:.2f}')
+    print(f'  + reading  {read * 1000:>9.1f} ms   x{slow / (fast + read):.2f}')
+    if not same: print('  ! tokens differ')
+    fast_enough = slow / (fast + read) >= MIN_SPEEDUP or len(text) < 1e6
+    if not fast_enough: print(f'  ! less than x{MIN_SPEEDUP} faster')
+    return same and fast_enough
+
+if __name__ == '__main__':
+    args = argv[1:]
+    repeat = 5
+    size = 4
+    for arg in args[:]:
+        if arg.startswith('-repeat='):
+            repeat = int(arg.split('=')[1])
+            args.remove(arg)
+        elif arg.startswith('-size='):
+            size = float(arg.split('=')[1])
+            args.remove(arg)
+
+    if args:
+        results = [bench(path.basename(script), open(script).read(), repeat) for script in args]
+    else:
+        results = [bench('generated', generated_text(int(size * 1e6)), repeat)]
+    if not all(results): exit(1)
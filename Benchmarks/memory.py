@@ -0,0 +1,181 @@
+from contextlib import redirect_stdout
+from io import StringIO
+from json import dumps, loads
+from os import path
+from subprocess import run, PIPE
+from sys import argv, executable, path as sys_path
+from tempfile import TemporaryDirectory
+import tracemalloc
+
+# The tree whose values are measured, the old one is taken out of git and measured by a process of its own (-root=)
+ROOT = next((arg.split('=', 1)[1] for arg in argv[1:] if arg.startswith('-root=')), path.dirname(path.dirname(path.abspath(__file__))))
+sys_path.insert(0, ROOT)
+
+import PyLang as pl
+
+from Values.Number import Number
+from Values.String import String
+from Values.List import List
+from Values.Boolean import Boolean
+
+#########################
+# ! MEMORY BENCHMARKS ! #
+#########################
+
+# python Benchmarks/memory.py [-count=N] [-old=REV]
+# Prints the bytes of each kind of value object, made around a Python value that already exists. Then keeps count results
+# of each kind of operation, as the engines make them, and prints the bytes each one takes, and the tracemalloc peak
+# of a program keeping PROGRAM_ROWS rows of values. Each is printed for the values of REV (OLD_LAYOUT by default,
+# the last tree before the values were slotted, shared and kept without positions) next to the ones of this tree.
+# The number layouts part what __slots__, the side table of the positions and the numbers shared by Number.of each saved.
+# Checks that a number result stays under MAX_NUMBER_BYTES (the object and its Python int)
+# and that programs, failed operations included, leave no positions in the side table of the values
+
+MAX_NUMBER_BYTES = 80
+OLD_LAYOUT = 'd60db67'
+
+PROGRAM_ROWS = 20000
+PROGRAM = f'var rows = for i = 0 to {PROGRAM_ROWS} {{ [i * 1000, "row " + str(i), i < 5, i % 100] }}'
+# The engines of both trees
+PROGRAM_ENGINES = [pl.ENGINE_TREE, pl.ENGINE_CLOSURE, pl.ENGINE_VM]
+
+LOCATED_PROGRAMS = [
+    'var a = 0\nfor i = 0 to 100 { var a = a + i * 2 }\nvar b = [a, "x" + "y", a < 5]',
+    'var a = [1, 2]\nprintln(a[5])',
+    'func f(x) {\n    return x + "a"\n}\nf(1)',
+]
+
+def number_result(i : int):
+    return Number(1000).add(Number(i))[0]
+
+def small_number_result(i : int):
+    return Number(i % 100).add(Number(1))[0]
+
+def boolean_result(i : int):
+    return Number(i).get_comparison_lt(Number(5))[0]
+
+def string_result(i : int):
+    return String('row ').add(String('abcd'))[0]
+
+def list_result(i : int):
+    return List([]).add(List([]))[0]
+
+KINDS = [
+    ('number', number_result),
+    ('small number', small_number_result),
+    ('boolean', boolean_result),
+    ('string', string_result),
+    ('list', list_result),
+]
+
+# The objects alone : the Python value they hold is made once
+HELD_INT, HELD_STR, HELD_LIST = 10 ** 6, 'row abcd', []
+OBJECTS = [
+    ('number', lambda i: Number(HELD_INT)),
+    ('boolean', lambda i: Boolean(True)),
+    ('string', lambda i: String(HELD_STR)),
+    ('list', lambda i: List(HELD_LIST)),
+]
+
+# The attributes of the old Number in slots, with the positions and the context still on each number
+class SlottedNumber:
+    __slots__ = ('value', 'pos_start', 'pos_end', 'context')
+
+    def __init__(self, value : int) -> None:
+        self.value = value
+        self.pos_start = self.pos_end = self.context = None
+
+def bytes_per_value(make, count : int) -> float:
+    values = [None] * count
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    for i in range(count):
+        values[i] = make(i)
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (end - start) / count
+
+def program_peak(engine : str) -> int:
+    pl.GLOBAL_ENGINE = engine
+    # The first run imports and caches what the program needs
+    for traced in (False, True):
+        if traced: tracemalloc.start()
+        with redirect_stdout(StringIO()):
+            pl._run('<memory>', PROGRAM, pl.SymbolTable(pl.global_symbol_table))
+        if traced:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+    return peak
+
+def measure(count : int) -> dict:
+    return {
+        'objects'   : {name : bytes_per_value(make, count) for name, make in OBJECTS},
+        'kept'      : {name : bytes_per_value(make, count) for name, make in KINDS},
+        'peaks'     : {engine : program_peak(engine) for engine in PROGRAM_ENGINES},
+    }
+
+# Measures of the values of rev, None when its tree can't be taken out of git
+def measure_old(rev : str, count : int) -> dict:
+    with TemporaryDirectory() as root:
+        archive = run(['git', '-C', ROOT, 'archive', rev], stdout=PIPE)
+        if archive.returncode != 0: return None
+        if run(['tar', '-x', '-C', root], input=archive.stdout).returncode != 0: return None
+
+        measured = run([executable, path.abspath(__file__), '-measure', f'-count={count}', f'-root={root}'], stdout=PIPE, text=True)
+        if measured.returncode != 0: return None
+        return loads(measured.stdout)
+
+def print_sizes(title : str, old : dict, new : dict, unit : str, scale : float = 1) -> None:
+    print(f'{title:<16} {"old":>10} {"new":>10}')
+    for name, size in new.items():
+        old_size = f'{old[name] / scale:>10.1f}' if old else f'{"-":>10}'
+        print(f'  {name:<14} {old_size} {size / scale:>10.1f} {unit}')
+
+if __name__ == '__main__':
+    count = 100000
+    old_layout = OLD_LAYOUT
+    for arg in argv[1:]:
+        if arg.startswith('-count='):
+            count = int(arg.split('=')[1])
+        elif arg.startswith('-old='):
+            old_layout = arg.split('=')[1]
+
+    if '-measure' in argv:
+        print(dumps(measure(count)))
+        exit(0)
+
+    from Values.Value import LOCATIONS
+    from bench import ENGINES, run_script
+
+    new = measure(count)
+    old = measure_old(old_layout, count)
+    if old is None: print(f'  ! the values of {old_layout} could not be measured')
+
+    print_sizes('value object', old and old['objects'], new['objects'], 'bytes')
+    print_sizes('kept result', old and old['kept'], new['kept'], 'bytes')
+
+    layouts = {
+        'attribute dict, positions' : old and old['objects']['number'],
+        'slots, positions'          : bytes_per_value(lambda i: SlottedNumber(HELD_INT), count),
+        'slots, side table'         : new['objects']['number'],
+        'shared by Number.of'       : new['kept']['small number'],
+    }
+    print('number layout')
+    for name, size in layouts.items():
+        print(f'  {name:<27} {f"{size:.1f}" if size != None else "-":>10} bytes')
+
+    print_sizes(f'{PROGRAM_ROWS} rows peak', old and old['peaks'], new['peaks'], 'KB', 1024)
+
+    for engine in ENGINES:
+        for program in LOCATED_PROGRAMS:
+            run_script('<memory>', program, engine)
+    print(f'{"located values":<16} {len(LOCATIONS):>21}')
+
+    failed = False
+    if new['kept']['number'] > MAX_NUMBER_BYTES:
+        print(f'  ! a number takes more than {MAX_NUMBER_BYTES} bytes')
+        failed = True
+    if LOCATIONS:
+        print(f'  ! values kept their positions')
+        failed = True
+    if failed: exit(1)
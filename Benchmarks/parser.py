@@ -0,0 +1,142 @@
+from os import path
+from sys import argv, path as sys_path
+from time import perf_counter
+
+sys_path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+from Core.Constants import Boolean
+from Core.FastLexer import FastLexer
+from Core.Parser import Parser
+from Core.PrattParser import PrattParser
+
+from Utils.Position import Position
+from Utils.Token import Token
+
+#########################
+# ! PARSER BENCHMARKS ! #
+#########################
+
+# python Benchmarks/parser.py [script.pyl ...] [-size=MB] [-repeat=N]
+# Parses the scripts (or a generated program of the given size) with the Parser and the PrattParser, prints their best times
+# and how many times faster the PrattParser is, and checks that they make the same AST, with the same positions,
+# and the same errors on SYNTAX_ERRORS.
+# The PrattParser is about x1.5 to x1.7 faster on the generated program, not more : it drops the ParseResults and the backtracking,
+# but each operand still goes down statement, expression, binary, factor, call and atom, and the positions and nodes it makes
+# and the loops it marks cost what they cost in the Parser
+
+SCRIPTS = ['loops.pyl', 'calls.pyl', 'lists.pyl', 'fib.pyl']
+
+SYNTAX_ERRORS = [
+    '', '\n', ')', '1 +', '1 + * 2', '!', '! )', '1 == !2', '-', '(1', '(1 2)', '1 2',
+    'var', 'var 1', 'var a', 'var a ==', 'var a = ', 'var a += )', 'var a++ 1',
+    'f(', 'f(1', 'f(1,', 'f(,)', 'f(a = )', 'f(1 2)', 'a[', 'a[1', 'a[:', 'a[1:', 'a[1:2', 'a[1:2:3]',
+    '[', '[)', '[1', '[1,', '[1 2]', '[1, )',
+    'if', 'if 1', 'if 1 {', 'if 1 { 2', 'if 1 { 2 } else', 'if 1 { 2 } else {', 'if 1 { 2 } else { 3',
+    'if 1 {\n2\n', 'if 1 {\n2\n} elif', 'if 1 {\n2\n} elif 2 {\n3\n} else {\n4\n', 'if 1 { return } else { break',
+    'for', 'for 1', 'for i', 'for i =', 'for i = 1', 'for i = 1 to', 'for i = 1 to 2', 'for i = 1 to 2 step',
+    'for i = 1 to 2 {', 'for i = 1 to 2 { 3', 'for i = 1 to 2 {\n3\n', 'for i in', 'for i in a', 'for i in a {\n',
+    'while', 'while 1', 'while 1 {', 'while 1 { 2', 'while 1 {\n2',
+    'import', 'import 1', 'import "a" 1',
+    'func', 'func 1', 'func f', 'func f 1', 'func (', 'func f(1', 'func f(a', 'func f(a,', 'func f(a, 1)',
+    'func f(a = 1, b)', 'func f(a) 1', 'func f(a) {', 'func f(a) { 1', 'func f(a) {\n1\n', 'func f() {\nyield\n',
+    'yield 1', 'func f() { yield 1 }', 'return', 'return )', '1\n\n)', '1\nvar\n2', 'var a = 1\nvar b = (2\n',
+    'continue 1', 'break\nbreak', '1 + (2 * 3', '2 ** ** 3', '2 ** -3 ** 4', 'a && || b', '!!a || !b && c',
+]
+
+def generated_text(size : int) -> str:
+    # Benchmark scripts and usage examples, repeated up to size bytes
+    folder = path.dirname(path.abspath(__file__))
+    parts = [open(path.join(folder, script)).read() for script in SCRIPTS]
+    parts.append(open(path.join(path.dirname(folder), 'Usage.pyl')).read())
+    block = '\n'.join(parts) + '\n'
+    return block * (size // len(block) + 1)
+
+def ast_key(value):
+    # The nodes as nested tuples of their class, attributes, tokens and positions
+    if value is Boolean.null:
+        return 'null'
+    if isinstance(value, Position):
+        return (value.index, value.line, value.column)
+    if isinstance(value, Token) or hasattr(value, 'matches'):
+        return ('token', value.type, value.value, ast_key(value.pos_start), ast_key(value.pos_end))
+    if isinstance(value, (list, tuple)):
+        return tuple(ast_key(element) for element in value)
+    if isinstance(value, dict):
+        return ('dict', tuple((ast_key(key), ast_key(element)) for key, element in value.items()))
+    if hasattr(value, '__dict__'):
+        return (type(value).__name__, tuple((name, ast_key(attribute)) for name, attribute in sorted(vars(value).items())))
+    # Objects without a __dict__ kept by the nodes (the CallSite of a CallNode)
+    if hasattr(value, '__slots__'):
+        return (type(value).__name__, tuple((name, ast_key(getattr(value, name))) for name in value.__slots__))
+    return value
+
+def parse_key(parser_class, text : str):
+    tokens, error = FastLexer('<bench>', text).make_tokens()
+    if error: return ('lexer', repr(error))
+    try:
+        ast = parser_class(tokens).parse()
+    except AttributeError:
+        # The Parser fails on some unclosed lists
+        return None
+    if ast.error: return ('error', repr(ast.error))
+    return ast_key(ast.node)
+
+def timed(parser_class, tokens) -> float:
+    start = perf_counter()
+    ast = parser_class(tokens).parse()
+    duration = perf_counter() - start
+    if ast.error: raise Exception(repr(ast.error))
+    return duration
+
+def bench(name : str, text : str, repeat : int) -> bool:
+    tokens, error = FastLexer('<bench>', text).make_tokens()
+    if error: raise Exception(repr(error))
+    # Made once, the parsers only read them
+    tokens = list(tokens)
+
+    # The parsers run in turn, a slower moment of the machine slows them both
+    slow_times, fast_times = [], []
+    for _ in range(repeat):
+        slow_times.append(timed(Parser, tokens))
+        fast_times.append(timed(PrattParser, tokens))
+    slow, fast = min(slow_times), min(fast_times)
+    same = parse_key(Parser, text) == parse_key(PrattParser, text)
+
+    print(f'{name} ({len(text) / 1e6:.1f} MB, {len(tokens)} tokens)')
+    print(f'  Parser       {slow * 1000:>9.1f} ms   {slow / len(tokens) * 1e6:.2f} us per token')
+    print(f'  PrattParser  {fast * 1000:>9.1f} ms   {fast / len(tokens) * 1e6:.2f} us per token')
+    print(f'  the PrattParser is x{slow / fast:.2f} faster than the Parser')
+    if not same: print('  ! ASTs differ')
+    return same
+
+def same_error(text : str) -> bool:
+    expected = parse_key(Parser, text)
+    result = parse_key(PrattParser, text)
+    if expected is None: return result is not None and result[0] == 'error'
+    return result == expected
+
+def check_errors() -> bool:
+    different = [text for text in SYNTAX_ERRORS if not same_error(text)]
+    print(f'syntax errors ({len(SYNTAX_ERRORS)} texts)')
+    for text in different:
+        print(f'  ! {text!r} differs')
+    return not different
+
+if __name__ == '__main__':
+    args = argv[1:]
+    repeat = 3
+    size = 1
+    for arg in args[:]:
+        if arg.startswith('-repeat='):
+            repeat = int(arg.split('=')[1])
+            args.remove(arg)
+        elif arg.startswith('-size='):
+            size = float(arg.split('=')[1])
+            args.remove(arg)
+
+    if args:
+        results = [bench(path.basename(script), open(script).read(), repeat) for script in args]
+    else:
+        results = [bench('generated', generated_text(int(size * 1e6)), repeat)]
+    results.append(check_errors())
+    if not all(results): exit(1)
@@ -0,0 +1,62 @@
+from os import path
+from sys import argv, path as sys_path
+
+sys_path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+import PyLang as pl
+
+from bench import ENGINES, run_script
+
+########################
+# ! RANGE BENCHMARKS ! #
+########################
+
+# python Benchmarks/ranges.py [-repeat=N]
+# Runs the range() heavy programs of PROGRAMS on every engine and prints the best times,
+# then checks that CHECKS print what they should on every engine
+
+SIZE = 200000
+
+PROGRAMS = {
+    'iterate'   : f'var total = 0\nfor i in range({SIZE}) {{\n    var total += i\n}}\nprintln(total)',
+    'index'     : f'var r = range(0, {SIZE * 3}, 3)\nvar total = 0\nfor i = 0 to 1000 {{\n    var total += r[i * 100]\n}}\nprintln(total)\nprintln(len(r))',
+    'float'     : f'var total = 0\nfor x in range(0, {SIZE // 10}, 0.5) {{\n    var total += x\n}}\nprintln(total)',
+}
+
+# Programs and their outputs : the numbers of a float range are made by adding the step, as a float for loop makes them
+CHECKS = [
+    ('println(range(5))\nprintln(range(2, 10, 3))\nprintln(range(3, 0, -1))', '[0, 1, 2, 3, 4]\n[2, 5, 8]\n[3, 2, 1]\n'),
+    ('var r = range(10)\nprintln(r[-1])\nprintln(r[2:5])\nprintln(len(r))', '9\n[2, 3, 4]\n10\n'),
+    ('var r = range(0, 1, 0.1)\nprintln(len(r))\nprintln(r[10])', '11\n0.9999999999999999\n'),
+    ('var r = range(0, 1, 0.1)\nvar xs = for x = 0 to 1 step 0.1 { x }\nprintln(len(xs) == len(r))\nfor i = 0 to len(r) {\n    if r[i] != xs[i] { println(i) }\n}',
+     'True\n'),
+    ('println(range(1, 0, -0.25))\nprintln(range(0.5, 3))', '[1, 0.75, 0.5, 0.25]\n[0.5, 1.5, 2.5]\n'),
+]
+
+def bench(name : str, text : str, repeat : int) -> bool:
+    print(name)
+    outputs = set()
+    for engine in ENGINES:
+        runs = [run_script(name, text, engine) for _ in range(repeat)]
+        outputs.add(runs[0][1])
+        print(f'  {engine:<10} {min(duration for duration, _ in runs) * 1000:>9.1f} ms')
+
+    if len(outputs) != 1: print('  ! outputs differ between engines')
+    return len(outputs) == 1
+
+def check(text : str, expected : str) -> bool:
+    return {run_script('<check>', text, engine)[1] for engine in ENGINES} == {expected}
+
+if __name__ == '__main__':
+    repeat = 3
+    for arg in argv[1:]:
+        if arg.startswith('-repeat='):
+            repeat = int(arg.split('=')[1])
+
+    results = [bench(name, text, repeat) for name, text in PROGRAMS.items()]
+
+    failed = [text for text, expected in CHECKS if not check(text, expected)]
+    print(f'{len(CHECKS)} checks')
+    for text in failed:
+        print(f'  ! {text!r}')
+    if failed or not all(results): exit(1)
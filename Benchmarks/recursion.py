@@ -0,0 +1,80 @@
+from os import path
+from sys import argv, path as sys_path
+
+sys_path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+import PyLang as pl
+
+from bench import ENGINES, run_script
+
+############################
+# ! RECURSION BENCHMARKS ! #
+############################
+
+# python Benchmarks/recursion.py [-repeat=N]
+# Runs a deep recursion and a tail recursion on the VM and prints the best times,
+# then checks that CHECKS print what they should on the VM with VM.max_depth set to MAX_DEPTH,
+# and that the engines nesting python calls stop a deep recursion with a PyLang error.
+# Only the VM (-vm) runs calls on a frame stack of its own : the default closure engine, -exc and -tree nest several python frames
+# per PyLang call and reach python's recursion limit after about 80 to 140 calls, deep recursions need -vm
+
+DEPTH = 50000
+TAIL_CALLS = 200000
+MAX_DEPTH = 100
+
+DEEP = 'func deep(n) {\n    if n == 0 { return 0 }\n    return 1 + deep(n - 1)\n}\n'
+TAIL = 'func count(n, total) {\n    if n == 0 { return total }\n    return count(n - 1, total + 1)\n}\n'
+EVEN = 'func even(n) {\n    if n == 0 { return true }\n    return odd(n - 1)\n}\nfunc odd(n) {\n    if n == 0 { return false }\n    return even(n - 1)\n}\n'
+
+PROGRAMS = {
+    'deep'  : (DEEP + f'println(deep({DEPTH}))', f'{DEPTH}\n'),
+    'tail'  : (TAIL + f'println(count({TAIL_CALLS}, 0))', f'{TAIL_CALLS}\n'),
+}
+
+# Programs and their outputs, or a part of their error : tail calls don't go deeper, other calls stop at the limit
+CHECKS = [
+    (TAIL + f'println(count({TAIL_CALLS}, 0))', f'{TAIL_CALLS}\n'),
+    (EVEN + 'println(even(10001))\nprintln(odd(10001))', 'False\nTrue\n'),
+    (DEEP + f'println(deep({MAX_DEPTH - 1}))', f'{MAX_DEPTH - 1}\n'),
+    (DEEP + f'println(deep({MAX_DEPTH}))', f'Call depth limit reached ({MAX_DEPTH} calls)'),
+    # A tail call still reads the locals of the function it replaces through its callers
+    ('func g() {\n    return x + y\n}\nfunc h(x) {\n    var y = 2\n    return g()\n}\nprintln(h(40))', '42\n'),
+    ('func f(n) {\n    if n == 0 { return 1 / 0 }\n    return f(n - 1)\n}\nf(3)', 'Division by zero'),
+]
+
+def bench(name : str, text : str, expected : str, repeat : int) -> bool:
+    runs = [run_script(name, text, pl.ENGINE_VM) for _ in range(repeat)]
+    print(f'{name:<6} {pl.ENGINE_VM:<10} {min(duration for duration, _ in runs) * 1000:>9.1f} ms')
+
+    same = runs[0][1] == expected
+    if not same: print(f'  ! {runs[0][1][-200:]!r}')
+    return same
+
+def check(text : str, expected : str) -> bool:
+    max_depth = pl.VM.max_depth
+    pl.VM.max_depth = MAX_DEPTH
+    try:
+        output = run_script('<check>', text, pl.ENGINE_VM)[1]
+    finally:
+        pl.VM.max_depth = max_depth
+    return output == expected or (not expected.endswith('\n') and expected in output)
+
+# The other engines report the python recursion limit as an error of the call
+def check_engine(engine : str) -> bool:
+    output = run_script('<check>', DEEP + f'println(deep({DEPTH}))', engine)[1]
+    return 'Python recursion limit reached' in output
+
+if __name__ == '__main__':
+    repeat = 3
+    for arg in argv[1:]:
+        if arg.startswith('-repeat='):
+            repeat = int(arg.split('=')[1])
+
+    results = [bench(name, text, expected, repeat) for name, (text, expected) in PROGRAMS.items()]
+
+    failed = [text for text, expected in CHECKS if not check(text, expected)]
+    failed += [engine for engine in ENGINES if engine != pl.ENGINE_VM and not check_engine(engine)]
+    print(f'{len(CHECKS)} checks')
+    for text in failed:
+        print(f'  ! {text!r}')
+    if failed or not all(results): exit(1)
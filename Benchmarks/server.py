@@ -0,0 +1,93 @@
+import subprocess
+import tempfile
+from os import path
+from sys import argv, executable
+from time import perf_counter, sleep
+
+#########################
+# ! SERVER BENCHMARKS ! #
+#########################
+
+# python Benchmarks/server.py [script.pyl ...] [-repeat=N]
+# Runs short scripts repeat times with python PyLang.py script.pyl and with python client.py on a server
+# started with python PyLang.py -serve=SOCKET, prints the time of a run of each and checks that the outputs are the same,
+# then checks that the requests of LIMITED_REQUESTS, run one after the other on the server, print what they should
+
+ROOT = path.dirname(path.dirname(path.abspath(__file__)))
+
+# Programs run thousands of times a minute, their own run is short next to starting the interpreter
+SCRIPTS = {
+    'hello.pyl'     : 'println("Hello, World!")',
+    'list.pyl'      : 'var a = []\nfor i = 0 to 50 { var a = a + [i * i] }\nprintln(a[49])',
+    'function.pyl'  : 'func f(x) {\n    if x < 2 { return x }\n    return f(x - 1) + f(x - 2)\n}\nprintln(f(12))',
+}
+
+# Script, flags of the request and a part of its output : a memory limit is on what its own request allocates,
+# not on the peak of the server nor on what the requests before it allocated
+LIMITED_SCRIPTS = {
+    'large.pyl'     : 'var a = for i = 0 to 300000 { [i, "x" + str(i)] }\nprintln(len(a))',
+    'steps.pyl'     : 'var total = 0\nfor i = 0 to 5000 {\n    var total += i\n}\nprintln(total)',
+}
+LIMITED_REQUESTS = [
+    ('steps.pyl', ['-max-memory=5'], '12497500'),
+    ('large.pyl', [], '300000'),
+    ('steps.pyl', ['-max-memory=5'], '12497500'),
+    ('large.pyl', ['-max-memory=5'], 'Memory limit reached (5 MB)'),
+    ('steps.pyl', ['-max-memory=5'], '12497500'),
+]
+
+def run(command : list[str], repeat : int) -> tuple[float, str]:
+    outputs = set()
+    start = perf_counter()
+    for _ in range(repeat):
+        outputs.add(subprocess.run(command, capture_output=True, text=True).stdout)
+    duration = (perf_counter() - start) / repeat
+    return duration, outputs.pop() if len(outputs) == 1 else None
+
+def bench(script : str, server_address : str, repeat : int) -> bool:
+    direct, direct_output = run([executable, path.join(ROOT, 'PyLang.py'), script], repeat)
+    client, client_output = run([executable, path.join(ROOT, 'client.py'), server_address, script], repeat)
+
+    print(path.basename(script))
+    print(f'  PyLang.py   {direct * 1000:>9.1f} ms')
+    print(f'  client.py   {client * 1000:>9.1f} ms   x{direct / client:.2f}')
+
+    same = direct_output is not None and direct_output == client_output
+    if not same: print('  ! outputs differ')
+    return same
+
+if __name__ == '__main__':
+    args = argv[1:]
+    repeat = 20
+    for arg in args[:]:
+        if arg.startswith('-repeat='):
+            repeat = int(arg.split('=')[1])
+            args.remove(arg)
+
+    with tempfile.TemporaryDirectory() as directory:
+        scripts = [path.abspath(script) for script in args]
+        if not scripts:
+            for name, text in SCRIPTS.items():
+                scripts.append(path.join(directory, name))
+                with open(scripts[-1], 'w') as f:
+                    f.write(text)
+
+        server_address = path.join(directory, 'server.sock')
+        server = subprocess.Popen([executable, path.join(ROOT, 'PyLang.py'), f'-serve={server_address}'], stdout=subprocess.DEVNULL)
+        try:
+            while not path.exists(server_address) and server.poll() is None: sleep(0.01)
+            results = [bench(script, server_address, repeat) for script in scripts]
+
+            for name, text in LIMITED_SCRIPTS.items():
+                with open(path.join(directory, name), 'w') as f:
+                    f.write(text)
+            for name, flags, expected in LIMITED_REQUESTS:
+                output = subprocess.run([executable, path.join(ROOT, 'client.py'), server_address, path.join(directory, name), *flags], capture_output=True, text=True).stdout
+                if expected not in output:
+                    print(f'  ! {name} {" ".join(flags)} : {output!r}')
+                    results.append(False)
+        finally:
+            server.terminate()
+            server.wait()
+
+    if not all(results): exit(1)
@@ -0,0 +1,75 @@
+from os import path
+from sys import argv, path as sys_path
+
+sys_path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+import PyLang as pl
+
+from bench import ENGINES, run_script
+
+################################
+# ! SHORT CIRCUIT BENCHMARKS ! #
+################################
+
+# python Benchmarks/shortcircuit.py [script.pyl ...] [-repeat=N]
+# Runs the guard heavy scripts on every engine and prints the best times,
+# then checks that CHECKS print what they should on every engine, with and without the Folder
+
+SCRIPTS = ['guards.pyl']
+
+CALLS = 'func f() {\n    println("called")\n    return true\n}\n'
+
+# Programs and their outputs : the right operand of a && after false or of a || after true is never run
+CHECKS = [
+    (CALLS + 'println(false && f())\nprintln(true || f())', 'False\nTrue\n'),
+    (CALLS + 'println(true && f())\nprintln(false || f())', 'called\nTrue\ncalled\nTrue\n'),
+    (CALLS + 'for i = 0 to 5 {\n    if i > 2 && f() { println(i) }\n}', 'called\n3\ncalled\n4\n'),
+    ('var xs = [1, 2]\nvar i = 5\nprintln(i < len(xs) && xs[i] > 0)\nprintln(i >= len(xs) || xs[i] > 0)', 'False\nTrue\n'),
+    ('println(false && 1 / 0)\nprintln(1 == 1 || undefined)', 'False\nTrue\n'),
+    ('println(0 && "a")\nprintln(3 || "a")', '0\n3\n'),
+    ('if 0 && undefined { println(1) } else { println(2) }', '2\n'),
+    # Operands that don't decide are still checked by get_and and get_or
+    ('println(true && "a")', None),
+    ('println("a" && false)', None),
+]
+
+def bench(name : str, text : str, repeat : int) -> bool:
+    print(path.basename(name))
+    outputs = set()
+    for engine in ENGINES:
+        runs = [run_script(name, text, engine) for _ in range(repeat)]
+        outputs.add(runs[0][1])
+        print(f'  {engine:<10} {min(duration for duration, _ in runs) * 1000:>9.1f} ms')
+
+    if len(outputs) != 1: print('  ! outputs differ between engines')
+    return len(outputs) == 1
+
+def check(text : str, expected : str) -> bool:
+    outputs = set()
+    for fold in (True, False):
+        pl.GLOBAL_FOLD = fold
+        try:
+            outputs |= {run_script('<check>', text, engine)[1] for engine in ENGINES}
+        finally:
+            pl.GLOBAL_FOLD = True
+
+    # None for an error, the same on every engine
+    if expected is None: return len(outputs) == 1 and 'Illegal operation' in outputs.pop()
+    return outputs == {expected}
+
+if __name__ == '__main__':
+    args = argv[1:]
+    repeat = 3
+    for arg in args[:]:
+        if arg.startswith('-repeat='):
+            repeat = int(arg.split('=')[1])
+            args.remove(arg)
+
+    scripts = args or [path.join(path.dirname(path.abspath(__file__)), script) for script in SCRIPTS]
+    results = [bench(script, open(script).read(), repeat) for script in scripts]
+
+    failed = [text for text, expected in CHECKS if not check(text, expected)]
+    print(f'{len(CHECKS)} checks')
+    for text in failed:
+        print(f'  ! {text!r}')
+    if failed or not all(results): exit(1)
@@ -0,0 +1,87 @@
+import os
+import subprocess
+import tempfile
+from os import path
+from sys import argv, executable
+from time import perf_counter
+
+##########################
+# ! STARTUP BENCHMARKS ! #
+##########################
+
+# python Benchmarks/startup.py [-repeat=N]
+# Runs a one line program with python -X importtime PyLang.py, once to write the bytecode and .pylc caches then repeat times,
+# prints the best times to import the modules of the interpreter, to start python and to run the program as a whole.
+# Checks that the imports stay under MAX_IMPORT_MS and that the modules of LAZY_MODULES are not imported
+
+ROOT = path.dirname(path.dirname(path.abspath(__file__)))
+
+MAX_IMPORT_MS = 25
+
+# Only imported by the programs, or the flags, that need them
+LAZY_MODULES = ['re', 'enum', 'pickle', 'hashlib', 'threading', 'math', 'mmap', 'pathlib', 'socketserver']
+
+PROGRAM = 'println("Hello, World!")'
+
+# PYTHONDONTWRITEBYTECODE would have every module compiled again
+ENV = {name : value for name, value in os.environ.items() if name != 'PYTHONDONTWRITEBYTECODE'}
+
+# Modules imported by python -X importtime and their own import time, in microseconds
+def imports(command : list[str]) -> dict[str, int]:
+    stderr = subprocess.run([executable, '-X', 'importtime'] + command, capture_output=True, text=True, env=ENV, cwd=ROOT).stderr
+
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line: continue
+        self_time, _, name = line[len('import time:'):].split('|')
+        modules[name.strip()] = int(self_time)
+    return modules
+
+def wall_time(command : list[str], repeat : int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = perf_counter()
+        subprocess.run([executable] + command, stdout=subprocess.DEVNULL, env=ENV, cwd=ROOT)
+        times.append(perf_counter() - start)
+    return min(times)
+
+if __name__ == '__main__':
+    repeat = 10
+    for arg in argv[1:]:
+        if arg.startswith('-repeat='):
+            repeat = int(arg.split('=')[1])
+
+    with tempfile.TemporaryDirectory() as directory:
+        script = path.join(directory, 'hello.pyl')
+        with open(script, 'w') as f:
+            f.write(PROGRAM)
+        command = [path.join(ROOT, 'PyLang.py'), script]
+
+        python_modules = imports(['-c', 'pass'])
+        imports(command)
+
+        runs = [imports(command) for _ in range(repeat)]
+        modules = {name : min(run[name] for run in runs) for name in runs[0] if name not in python_modules}
+        import_time = sum(modules.values()) / 1000
+
+        python = wall_time(['-c', 'pass'], repeat)
+        script_run = wall_time(command, repeat)
+        # The script python runs is compiled each time, a module run with -m is read from its bytecode cache
+        module_run = wall_time(['-m', 'PyLang', script], repeat)
+
+    print(f'imports           {import_time:>7.1f} ms   ({len(modules)} modules)')
+    for name, self_time in sorted(modules.items(), key=lambda item: -item[1])[:5]:
+        print(f'  {name:<24} {self_time / 1000:>5.1f} ms')
+    print(f'python -c pass    {python * 1000:>7.1f} ms')
+    print(f'PyLang.py         {script_run * 1000:>7.1f} ms')
+    print(f'-m PyLang         {module_run * 1000:>7.1f} ms')
+
+    failed = False
+    if import_time > MAX_IMPORT_MS:
+        print(f'  ! the imports take more than {MAX_IMPORT_MS} ms')
+        failed = True
+    for name in LAZY_MODULES:
+        if name in modules:
+            print(f'  ! {name} is imported')
+            failed = True
+    if failed: exit(1)
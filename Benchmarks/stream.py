@@ -0,0 +1,61 @@
+from os import path, wait4
+from subprocess import Popen, DEVNULL
+from sys import argv, executable
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+#########################
+# ! STREAM BENCHMARKS ! #
+#########################
+
+# python Benchmarks/stream.py [-size=MB]
+# Runs generated data tables of size and 4 times size MB with -stream, and the smaller one without,
+# checks that the peak memory of -stream doesn't grow with the size of the file (Unix only, wait4)
+
+MAX_GROWTH = 1.5
+ROWS_PER_TABLE = 100
+
+PYLANG = path.join(path.dirname(path.dirname(path.abspath(__file__))), 'PyLang.py')
+
+def write_tables(file_name : str, size : int) -> None:
+    # One table per statement, like a generated data file
+    with open(file_name, 'w') as f:
+        written = 0
+        table = 0
+        while written < size:
+            rows = ', '.join(f'[{i}, {i * 0.5}, "row {table}.{i}"]' for i in range(ROWS_PER_TABLE))
+            line = f'var table = [{rows}]\nvar total = len(table)\n'
+            f.write(line)
+            written += len(line)
+            table += 1
+
+def peak_memory(file_name : str, flags : list) -> tuple[float, float]:
+    # Peak resident memory of the run in MB, and its duration
+    start = perf_counter()
+    process = Popen([executable, PYLANG, *flags, '-no-cache', file_name], stdout=DEVNULL)
+    _, _, usage = wait4(process.pid, 0)
+    return usage.ru_maxrss / 1024, perf_counter() - start
+
+if __name__ == '__main__':
+    size = 2
+    for arg in argv[1:]:
+        if arg.startswith('-size='):
+            size = float(arg.split('=')[1])
+
+    with TemporaryDirectory() as folder:
+        small = path.join(folder, 'small.pyl')
+        large = path.join(folder, 'large.pyl')
+        write_tables(small, int(size * 1e6))
+        write_tables(large, int(size * 4e6))
+
+        whole_small, whole_time = peak_memory(small, [])
+        stream_small, stream_small_time = peak_memory(small, ['-stream'])
+        stream_large, stream_large_time = peak_memory(large, ['-stream'])
+
+    print(f'{size:g} MB   whole file  {whole_small:>8.1f} MB   {whole_time:>6.1f} s')
+    print(f'{size:g} MB   -stream     {stream_small:>8.1f} MB   {stream_small_time:>6.1f} s')
+    print(f'{size * 4:g} MB  -stream     {stream_large:>8.1f} MB   {stream_large_time:>6.1f} s')
+
+    if stream_large > stream_small * MAX_GROWTH:
+        print(f'  ! -stream peak memory grows with the file size')
+        exit(1)
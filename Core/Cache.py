@@ -0,0 +1,92 @@
+import gc
+from os import makedirs, path, replace, stat
+
+try:
+    # The C pickler without pickle.py, which imports re and enum for its pure Python version
+    from _pickle import dump, load
+except ImportError:
+    from pickle import dump, load
+
+#############
+# ! CACHE ! #
+#############
+
+# Parsed programs are pickled into .pylc files so that running or importing an unchanged file skips lexing and parsing.
+# Bump CACHE_VERSION whenever the Lexer, the Parser or the nodes change what they produce.
+CACHE_VERSION   = 9
+CACHE_DIR_NAME  = '__pylcache__'
+
+# ASTs kept in memory by a long-lived process (the server), keyed by absolute path, checked before the .pylc files
+memory_cache = {}
+
+def cache_file_name(file_name : str, cache_dir : str = None) -> str:
+    file_name = path.abspath(file_name)
+    base_name = path.splitext(path.basename(file_name))[0]
+
+    if cache_dir is None:
+        return path.join(path.dirname(file_name), CACHE_DIR_NAME, base_name + '.pylc')
+
+    # Files from different folders share the same cache directory
+    import hashlib
+    digest = hashlib.sha1(file_name.encode()).hexdigest()[:16]
+    return path.join(cache_dir, f'{base_name}.{digest}.pylc')
+
+def source_hash(text : str) -> str:
+    # Only needed to save a file or to check one that was touched, importing hashlib takes a few milliseconds
+    import hashlib
+    return hashlib.sha1(text.encode()).hexdigest()
+
+def load_ast(file_name : str, text : str, testing : bool, cache_dir : str = None):
+    try:
+        source = stat(file_name)
+        with open(cache_file_name(file_name, cache_dir), 'rb') as f:
+            header = load(f)
+
+            if header['version'] != CACHE_VERSION or header['testing'] != testing:
+                return None
+
+            # Same mtime and size, or the file was touched without being changed
+            if (header['mtime'], header['size']) != (source.st_mtime_ns, source.st_size) and header['hash'] != source_hash(text):
+                return None
+
+            # Unpickling creates one object per node, token and position, the collector only slows it down
+            gc_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                return load(f)
+            finally:
+                if gc_enabled: gc.enable()
+    except Exception:
+        return None
+
+def save_ast(file_name : str, text : str, testing : bool, node, cache_dir : str = None) -> None:
+    cache_file = cache_file_name(file_name, cache_dir)
+    source = stat(file_name)
+    header = {
+        'version'   : CACHE_VERSION,
+        'testing'   : testing,
+        'mtime'     : source.st_mtime_ns,
+        'size'      : source.st_size,
+        'hash'      : source_hash(text),
+    }
+
+    try:
+        makedirs(path.dirname(cache_file), exist_ok=True)
+        with open(cache_file + '.tmp', 'wb') as f:
+            dump(header, f)
+            # -1 is the highest protocol
+            dump(node, f, -1)
+        replace(cache_file + '.tmp', cache_file)
+    except Exception:
+        # A read-only folder or a too deeply nested AST only means no cache
+        pass
+
+def load_memory_ast(file_name : str, text : str, testing : bool):
+    entry = memory_cache.get(path.abspath(file_name))
+    # The text is compared as a whole, an edited file is parsed again
+    if entry is None or entry[0] != text or entry[1] != testing:
+        return None
+    return entry[2]
+
+def save_memory_ast(file_name : str, text : str, testing : bool, node) -> None:
+    memory_cache[path.abspath(file_name)] = (text, testing, node)
@@ -0,0 +1,450 @@
+from __future__ import annotations
+
+from Core.Constants import *
+
+from Nodes.BinOp import BinOpNode
+from Nodes.List import ListNode
+from Nodes.If import IfNode
+from Nodes.For import ForNode
+from Nodes.ForIn import ForInNode
+from Nodes.While import WhileNode
+from Nodes.FuncDef import FuncDefNode
+from Nodes.Call import CallNode
+from Nodes.Number import NumberNode
+from Nodes.String import StringNode
+from Nodes.InterpolatedString import InterpolatedStringNode
+from Nodes.UnaryOp import UnaryOpNode
+from Nodes.VarAccess import VarAccessNode
+from Nodes.VarAssign import VarAssignNode
+from Nodes.Return import ReturnNode
+from Nodes.Yield import YieldNode
+from Nodes.Continue import ContinueNode
+from Nodes.Break import BreakNode
+from Nodes.Import import ImportNode
+
+from Core.Resolver import Resolver, SCOPE_LOCAL, SCOPE_GLOBAL, var_observed
+
+from Errors.Error import Error
+
+from Values.Number import Number, NUMBER_OPERATIONS
+from Values.Range import stepped_range
+
+from Utils.Signature import Signature
+
+###############
+# ! OPCODES ! #
+###############
+
+OP_LOAD_NUMBER          = 0     # constants[arg] -> new Number
+OP_LOAD_STRING          = 1     # constants[arg] -> new String
+OP_LOAD_OBJECT          = 2     # constants[arg] pushed as is
+OP_LOAD_VAR             = 3     # names[arg] looked up through the callers
+OP_LOAD_FAST            = 4     # slot arg of the running function
+OP_LOAD_GLOBAL          = 5     # names[arg] from the global symbol table, looked up through the callers if missing
+OP_GET_INDEX            = 6
+OP_GET_SLICE            = 7     # arg : 1 if start is given | 2 if end is given
+OP_STORE_VAR            = 8     # names[arg] = top of the stack (kept on the stack)
+OP_STORE_FAST           = 9     # slot arg = top of the stack (kept on the stack)
+OP_BINARY_OP            = 10    # arg : (name of the Value method, operation on two numbers, class of its result)
+OP_UNARY_MINUS          = 11
+OP_UNARY_NOT            = 12
+OP_BUILD_LIST           = 13    # arg : number of elements
+OP_POP_TOP              = 14
+OP_JUMP                 = 15    # arg : target
+OP_POP_JUMP_IF_FALSE    = 16    # arg : target
+OP_LOOP_SETUP           = 17    # arg : (loop start, body start, loop end) of the loop
+OP_LOOP_TICK            = 18    # one step of the run's budget
+OP_FOR_SETUP            = 19    # arg : (True if a step value is on the stack, (slot or names index, True for a slot) bound when the loop ends or None,
+                                #        (loop start, body start, loop end) of the loop)
+OP_FOR_ITER             = 20    # arg : (slot or names index, exit target, True for a slot, True if bound each iteration)
+OP_FORIN_SETUP          = 21    # arg : (loop start, body start, loop end) of the loop
+OP_FORIN_ITER           = 22    # arg : (slot or names index, exit target, True for a slot)
+OP_LOOP_APPEND          = 23
+OP_LOOP_END             = 24
+OP_BREAK_LOOP           = 25    # arg : exit target
+OP_CONTINUE_LOOP        = 26    # arg : loop start
+OP_MAKE_FUNCTION        = 27    # arg : constants index of a FunctionTemplate
+OP_CALL                 = 28    # arg : the CallSite of the node, its positional args then its keyword args are on the stack
+OP_RETURN_VALUE         = 29
+OP_FALLBACK             = 30    # arg : constants index of a node run by the Interpreter
+OP_YIELD_VALUE          = 31    # top of the stack sent to the loop pulling the generator, replaced by null
+OP_BUILD_STRING         = 32    # arg : constants index of the texts, the values of the expressions between them are on the stack
+OP_JUMP_IF_DECIDED      = 33    # arg : (&& or || token type, target), the value of the decided operation replaces its left operand
+OP_TAIL_CALL            = 34    # arg : as OP_CALL, followed by OP_RETURN_VALUE : the function called takes the place of the running one
+OP_LOOP_SIGNAL          = 35    # arg : True for a break, False for a continue outside of the loops of the running code, taken by the loops of its callers
+
+OPCODE_NAMES = {value : name[3:] for name, value in dict(globals()).items() if name.startswith('OP_')}
+
+BINARY_METHODS = {
+    TT_PLUS     : 'add',
+    TT_MINUS    : 'subtract',
+    TT_MUL      : 'multiply',
+    TT_DIV      : 'divide',
+    TT_POW      : 'power',
+    TT_MOD      : 'modulo',
+    TT_QUO      : 'quotient',
+    TT_EE       : 'get_comparison_eq',
+    TT_NE       : 'get_comparison_ne',
+    TT_LT       : 'get_comparison_lt',
+    TT_GT       : 'get_comparison_gt',
+    TT_LTE      : 'get_comparison_lte',
+    TT_GTE      : 'get_comparison_gte',
+    TT_AND      : 'get_and',
+    TT_OR       : 'get_or',
+}
+
+# Values of the variable of a for loop, a python range when its bounds and step are integers
+def loop_range(start : int | float, end : int | float, step : int | float):
+    if start.__class__ is int and end.__class__ is int and step.__class__ is int and step != 0:
+        return range(start, end, step)
+    return stepped_range(start, end, step)
+
+# && and || only run their right operand when their left one doesn't decide the result
+SHORT_CIRCUIT_TYPES = (TT_AND, TT_OR)
+
+# Value of a && or || decided by its left operand, the one get_and or get_or gives with any right operand it takes.
+# None when the right operand is needed, or when the left one has no && and || and its method makes the error
+def decided_value(op_type : str, left):
+    if left.__class__ is Boolean or left.__class__ is Number:
+        if (op_type == TT_OR) == bool(left.value): return Boolean.of(left.value)
+    return None
+
+############
+# ! CODE ! #
+############
+
+class Code:
+    def __init__(self, name : str, is_function : bool, slot_indexes : dict = None) -> None:
+        self.name = name
+        self.is_function = is_function
+        # Calls of a generator function return a Generator running the code
+        self.is_generator = False
+        # Locals of a function, {name : slot index}
+        self.slot_indexes = slot_indexes or {}
+        self.slot_names = list(self.slot_indexes)
+        self.instructions = []
+        self.positions = []
+        # Positions of the nodes an instruction's operands come from, only read to report its errors
+        self.operand_positions = {}
+        self.constants = []
+        self.names = []
+        self.constant_indexes = {}
+        self.name_indexes = {}
+        # Names bound by the programs of the run (Resolver.bound_names), a SCOPE_GLOBAL name found there is read through the callers
+        self.bound_names = None
+
+    def emit(self, opcode : int, arg = None, node = None) -> int:
+        self.instructions.append((opcode, arg))
+        self.positions.append((node.pos_start, node.pos_end) if node else (None, None))
+        return len(self.instructions) - 1
+
+    def add_operands(self, index : int, nodes : list) -> None:
+        self.operand_positions[index] = [(node.pos_start, node.pos_end) if node else (None, None) for node in nodes]
+
+    def patch(self, index : int, arg) -> None:
+        self.instructions[index] = (self.instructions[index][0], arg)
+
+    def add_constant(self, value) -> int:
+        # Literals are shared by value, everything else by identity
+        key = (type(value), value) if type(value) in (int, float, str) else id(value)
+        if key not in self.constant_indexes:
+            self.constant_indexes[key] = len(self.constants)
+            self.constants.append(value)
+        return self.constant_indexes[key]
+
+    def add_name(self, name : str) -> int:
+        if name not in self.name_indexes:
+            self.name_indexes[name] = len(self.names)
+            self.names.append(name)
+        return self.name_indexes[name]
+
+    def __repr__(self) -> str:
+        lines = [f'<code {self.name}>']
+        for index, (opcode, arg) in enumerate(self.instructions):
+            lines.append(f'{index:>5} {OPCODE_NAMES[opcode]:<20} {"" if arg is None else arg}')
+        return '\n'.join(lines)
+
+class FunctionTemplate:
+    def __init__(self, name : str, code : Code, arg_names : list[str], has_defaults : list[bool], auto_return : bool) -> None:
+        self.name = name
+        self.code = code
+        self.arg_names = arg_names
+        self.has_defaults = has_defaults
+        self.auto_return = auto_return
+        # Shared by the functions made from the template, an arg named twice is the last one
+        required = {arg_name : not has_default for arg_name, has_default in zip(arg_names, has_defaults)}
+        self.signature = Signature(list(required), list(required.values()), [code.slot_indexes[arg_name] for arg_name in required])
+
+################
+# ! COMPILER ! #
+################
+
+class Compiler:
+    # Lowers the AST into bytecode run by the VM, the visit_* methods of the Interpreter are the reference semantics
+    def __init__(self, resolver : Resolver = None) -> None:
+        self.code = None
+        self.loops = []
+        self.resolver = resolver
+        # Slots of the function being compiled, None at the top level of the program
+        self.slot_indexes = None
+
+    def compile_program(self, node, name : str = '<program>') -> Code:
+        self.resolver = self.resolver or Resolver().resolve(node)
+        self.code = Code(name, False)
+        self.code.bound_names = self.resolver.bound_names
+        self.compile(node)
+        self.code.emit(OP_RETURN_VALUE)
+        return self.code
+
+    def compile_function(self, node : FuncDefNode, name : str) -> Code:
+        compiler = Compiler(self.resolver)
+        compiler.slot_indexes = self.resolver.slot_indexes(node)
+        compiler.code = Code(name, True, compiler.slot_indexes)
+        compiler.code.bound_names = self.resolver.bound_names
+        compiler.code.is_generator = node.is_generator
+        compiler.compile(node.body_node)
+        if not node.auto_return:
+            compiler.code.emit(OP_POP_TOP)
+            compiler.code.emit(OP_LOAD_OBJECT, compiler.code.add_constant(Boolean.null))
+        compiler.code.emit(OP_RETURN_VALUE)
+        return compiler.code
+
+    def emit_load(self, name : str, node) -> None:
+        scope = self.resolver.scope_of(name, self.slot_indexes)
+        if scope == SCOPE_LOCAL:
+            self.code.emit(OP_LOAD_FAST, self.slot_indexes[name], node)
+        elif scope == SCOPE_GLOBAL:
+            self.code.emit(OP_LOAD_GLOBAL, self.code.add_name(name), node)
+        else:
+            self.code.emit(OP_LOAD_VAR, self.code.add_name(name), node)
+
+    def emit_store(self, name : str, node) -> None:
+        if self.resolver.scope_of(name, self.slot_indexes) == SCOPE_LOCAL:
+            self.code.emit(OP_STORE_FAST, self.slot_indexes[name], node)
+        else:
+            self.code.emit(OP_STORE_VAR, self.code.add_name(name), node)
+
+    # Where a loop stores its variable : (slot or names index, True for a slot)
+    def loop_target(self, name : str) -> tuple[int, bool]:
+        if self.resolver.scope_of(name, self.slot_indexes) == SCOPE_LOCAL:
+            return self.slot_indexes[name], True
+        return self.code.add_name(name), False
+
+    def compile(self, node) -> None:
+        method_name = f'compile_{type(node).__name__}'
+        method = getattr(self, method_name, self.no_compile_method)
+        method(node)
+
+    def no_compile_method(self, node) -> Exception:
+        raise Exception(f'No compile_{type(node).__name__} method defined')
+
+    ######
+
+    def compile_NumberNode(self, node : NumberNode) -> None:
+        self.code.emit(OP_LOAD_NUMBER, self.code.add_constant(node.token.value), node)
+
+    def compile_StringNode(self, node : StringNode) -> None:
+        self.code.emit(OP_LOAD_STRING, self.code.add_constant(node.token.value), node)
+
+    def compile_InterpolatedStringNode(self, node : InterpolatedStringNode) -> None:
+        # The error of an expression that couldn't be parsed is raised by the Interpreter, after the expressions before it
+        if any(isinstance(expression_node, Error) for expression_node in node.expression_nodes):
+            self.code.emit(OP_FALLBACK, self.code.add_constant(node), node)
+            return
+
+        # Only the value of the first statement of each expression stays on the stack
+        for expression_node in node.expression_nodes:
+            for index, statement_node in enumerate(expression_node.elements_nodes):
+                self.compile(statement_node)
+                if index > 0: self.code.emit(OP_POP_TOP)
+        self.code.emit(OP_BUILD_STRING, self.code.add_constant(node.texts), node)
+
+    def compile_ListNode(self, node : ListNode) -> None:
+        for element_node in node.elements_nodes:
+            self.compile(element_node)
+        self.code.emit(OP_BUILD_LIST, len(node.elements_nodes), node)
+
+    def compile_BinOpNode(self, node : BinOpNode) -> None:
+        self.compile(node.left_node)
+        if node.op_token.type in SHORT_CIRCUIT_TYPES:
+            decided_jump = self.code.emit(OP_JUMP_IF_DECIDED, None, node)
+        self.compile(node.right_node)
+        method_name = BINARY_METHODS[node.op_token.type]
+        index = self.code.emit(OP_BINARY_OP, (method_name, *NUMBER_OPERATIONS[method_name]), node)
+        self.code.add_operands(index, [node.left_node, node.right_node])
+        if node.op_token.type in SHORT_CIRCUIT_TYPES:
+            self.code.patch(decided_jump, (node.op_token.type, len(self.code.instructions)))
+
+    def compile_UnaryOpNode(self, node : UnaryOpNode) -> None:
+        self.compile(node.node)
+        if node.op_token.type == TT_MINUS:
+            index = self.code.emit(OP_UNARY_MINUS, None, node)
+        elif node.op_token.type == TT_NOT:
+            index = self.code.emit(OP_UNARY_NOT, None, node)
+        self.code.add_operands(index, [node.node, None])
+
+    def compile_VarAccessNode(self, node : VarAccessNode) -> None:
+        self.emit_load(node.var_name_token.value, node)
+
+        if not node.slice_or_getter:
+            return
+
+        if len(node.slice_or_getter) == 1:
+            self.compile(node.slice_or_getter[0])
+            index = self.code.emit(OP_GET_INDEX, None, node)
+        else:
+            flags = 0
+            if node.slice_or_getter[0] != None:
+                self.compile(node.slice_or_getter[0])
+                flags |= 1
+            if node.slice_or_getter[1] != None:
+                self.compile(node.slice_or_getter[1])
+                flags |= 2
+            index = self.code.emit(OP_GET_SLICE, flags, node)
+        self.code.add_operands(index, [node] + node.slice_or_getter)
+
+    def compile_VarAssignNode(self, node : VarAssignNode) -> None:
+        self.compile(node.value_node)
+        self.emit_store(node.var_name_token.value, node)
+
+    def compile_IfNode(self, node : IfNode) -> None:
+        end_jumps = []
+
+        for condition, expression in node.cases:
+            self.compile(condition)
+            next_case_jump = self.code.emit(OP_POP_JUMP_IF_FALSE, None, condition)
+            self.compile(expression)
+            end_jumps.append(self.code.emit(OP_JUMP))
+            self.code.patch(next_case_jump, len(self.code.instructions))
+
+        if node.else_case:
+            self.compile(node.else_case)
+        else:
+            self.code.emit(OP_LOAD_OBJECT, self.code.add_constant(None))
+
+        for end_jump in end_jumps:
+            self.code.patch(end_jump, len(self.code.instructions))
+
+    def compile_loop_body(self, body_node, loop_start : int, is_statement : bool) -> int:
+        self.loops.append((loop_start, []))
+        # A loop whose value is never read drops the value of each statement of its body
+        if is_statement and isinstance(body_node, ListNode) and body_node.elements_nodes:
+            for statement_node in body_node.elements_nodes:
+                self.compile(statement_node)
+                self.code.emit(OP_POP_TOP)
+        else:
+            self.compile(body_node)
+            self.code.emit(OP_POP_TOP if is_statement else OP_LOOP_APPEND)
+        self.code.emit(OP_JUMP, loop_start)
+        _, break_jumps = self.loops.pop()
+
+        loop_end = len(self.code.instructions)
+        for break_jump in break_jumps:
+            self.code.patch(break_jump, loop_end)
+        return loop_end
+
+    def compile_ForNode(self, node : ForNode) -> None:
+        self.compile(node.start_value_node)
+        self.compile(node.end_value_node)
+        if node.step_value_node:
+            self.compile(node.step_value_node)
+        target_index, is_slot = self.loop_target(node.var_name_token.value)
+        # A body that can't see the variable leaves the counter a python int until the loop ends
+        observed = var_observed(node)
+        loop_setup = self.code.emit(OP_FOR_SETUP, None, node)
+
+        loop_start = self.code.emit(OP_FOR_ITER, None, node)
+        loop_end = self.compile_loop_body(node.body_node, loop_start, node.is_statement)
+        self.code.patch(loop_start, (target_index, loop_end, is_slot, observed))
+        self.code.patch(loop_setup, (node.step_value_node != None, None if observed else (target_index, is_slot), (loop_start, loop_start + 1, loop_end)))
+        self.code.emit(OP_LOOP_END, node.is_statement, node)
+
+    def compile_ForInNode(self, node : ForInNode) -> None:
+        self.compile(node.iterated_value_node)
+        loop_setup = self.code.emit(OP_FORIN_SETUP, None, node)
+
+        target_index, is_slot = self.loop_target(node.var_name_token.value)
+        loop_start = self.code.emit(OP_FORIN_ITER, None, node)
+        loop_end = self.compile_loop_body(node.body_node, loop_start, node.is_statement)
+        self.code.patch(loop_start, (target_index, loop_end, is_slot))
+        self.code.patch(loop_setup, (loop_start, loop_start + 1, loop_end))
+        self.code.emit(OP_LOOP_END, node.is_statement, node)
+
+    def compile_WhileNode(self, node : WhileNode) -> None:
+        loop_setup = self.code.emit(OP_LOOP_SETUP, None, node)
+
+        loop_start = self.code.emit(OP_LOOP_TICK, None, node)
+        self.compile(node.condition_node)
+        exit_jump = self.code.emit(OP_POP_JUMP_IF_FALSE, None, node)
+        loop_end = self.compile_loop_body(node.body_node, loop_start, node.is_statement)
+        self.code.patch(exit_jump, loop_end)
+        # The condition is not in the body, a break or continue passed up from a call in it leaves the loop to its callers
+        self.code.patch(loop_setup, (loop_start, exit_jump + 1, loop_end))
+        self.code.emit(OP_LOOP_END, node.is_statement, node)
+
+    def compile_FuncDefNode(self, node : FuncDefNode) -> None:
+        func_name = node.var_name_token.value if node.var_name_token else None
+        arg_names = []
+        has_defaults = []
+
+        for key, value in node.arg_name_tokens.items():
+            arg_names.append(key.value)
+            has_defaults.append(value != Boolean.null)
+            if value != Boolean.null:
+                self.compile(value)
+
+        code = self.compile_function(node, func_name or '<anonymous>')
+        template = FunctionTemplate(func_name, code, arg_names, has_defaults, node.auto_return)
+        self.code.emit(OP_MAKE_FUNCTION, self.code.add_constant(template), node)
+
+    def compile_CallNode(self, node : CallNode, opcode : int = OP_CALL) -> None:
+        self.compile(node.name_node)
+
+        for key, arg_node in node.args_nodes.items():
+            if key == Boolean.null:
+                for positional_node in arg_node:
+                    self.compile(positional_node)
+            else:
+                self.compile(arg_node)
+
+        self.code.emit(opcode, node.call_site, node)
+
+    def compile_ReturnNode(self, node : ReturnNode) -> None:
+        # return f(...) in a function other than a generator : the function called takes its frame,
+        # tail recursions run in constant space
+        if self.code.is_function and not self.code.is_generator and isinstance(node.return_node, CallNode):
+            self.compile_CallNode(node.return_node, OP_TAIL_CALL)
+        elif node.return_node:
+            self.compile(node.return_node)
+        else:
+            self.code.emit(OP_LOAD_OBJECT, self.code.add_constant(Boolean.null))
+
+        # A return at the top of a program stops it without a value
+        if not self.code.is_function:
+            self.code.emit(OP_POP_TOP)
+            self.code.emit(OP_LOAD_OBJECT, self.code.add_constant(None))
+        self.code.emit(OP_RETURN_VALUE, None, node)
+
+    def compile_YieldNode(self, node : YieldNode) -> None:
+        if node.yield_node:
+            self.compile(node.yield_node)
+        else:
+            self.code.emit(OP_LOAD_OBJECT, self.code.add_constant(Boolean.null))
+        self.code.emit(OP_YIELD_VALUE, None, node)
+
+    def compile_ContinueNode(self, node : ContinueNode) -> None:
+        if not self.loops:
+            self.code.emit(OP_LOOP_SIGNAL, False, node)
+            return
+        loop_start, _ = self.loops[-1]
+        self.code.emit(OP_CONTINUE_LOOP, loop_start, node)
+
+    def compile_BreakNode(self, node : BreakNode) -> None:
+        if not self.loops:
+            self.code.emit(OP_LOOP_SIGNAL, True, node)
+            return
+        _, break_jumps = self.loops[-1]
+        break_jumps.append(self.code.emit(OP_BREAK_LOOP, None, node))
+
+    def compile_ImportNode(self, node : ImportNode) -> None:
+        self.code.emit(OP_FALLBACK, self.code.add_constant(node), node)
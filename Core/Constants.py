@@ -1,5 +1,3 @@
-import string
-
 from Values.Boolean import Boolean
 from Values.String import String
 
@@ -10,13 +8,23 @@ from Values.String import String
 # GLOBALS
 
 GLOBAL_TESTING  = False
-
-# RULES
-LOOP_MAX_RECUR  = 10000
+GLOBAL_ENGINE   = 'CLOSURE'
+GLOBAL_CACHE    = True
+GLOBAL_CACHE_DIR = None
+GLOBAL_BUDGET   = None
+GLOBAL_STREAM   = False
+GLOBAL_FOLD     = True
+GLOBAL_MEMORY_CACHE = False
+
+# ENGINES
+ENGINE_TREE     = 'TREE'
+ENGINE_CLOSURE  = 'CLOSURE'
+ENGINE_VM       = 'VM'
+ENGINE_EXCEPTIONS = 'EXCEPTIONS'
 
 # LETTERS & DIGITS
 DIGITS          = '0123456789'
-LETTERS         = string.ascii_letters 
+LETTERS         = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'
 LETTERS_DIGITS  = LETTERS + DIGITS
 
 # KEYWORDS & =
@@ -92,6 +100,7 @@ KEYWORDS = [
     'append',
     'delete',
     'return',
+    'yield',
     'break',
     'continue',
     'in',
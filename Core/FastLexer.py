@@ -0,0 +1,302 @@
+import gc
+from codecs import getincrementaldecoder
+from collections.abc import Iterator
+from itertools import accumulate, islice, repeat
+from operator import itemgetter
+
+from Errors.Error import Error
+from Errors.ExpectedCharError import ExpectedCharError
+from Errors.IllegalCharError import IllegalCharError
+
+from Core.Constants import *
+
+from Utils.Position import LazyPosition, Source
+
+##################
+# ! FAST LEXER ! #
+##################
+
+# Same tokens as the Lexer, read by one regex over the whole text instead of one character at a time.
+# Each match is a token and the spaces after it, the type and value of each distinct match are found once
+# and the tokens are then made a whole column at a time.
+
+TOKEN_PATTERN = r'''
+    (?:
+         [A-Za-z_][A-Za-z0-9_]*
+        |[(),:%\[\]{};\n]
+        |[0-9]+(?:\.[0-9]*)?
+        |==?|!=?|<=?|>=?|\*\*?=?|\+[+=]?|-[-=]?|&&|\|\|
+        |//?=?\*(?s:.*?\*\n*/|.*)
+        |//?=?
+        |"[^"]*"?|'[^']*'?
+        |\#[^\n]*\n?
+        |QUESTION
+        |[^ \t]
+    )[ \t]*
+'''
+
+# Compiled when the first text is lexed, re is not imported to run a program loaded from its .pylc file
+TOKEN_REGEXES = {}
+
+# A multiline comment runs to the end of the text when it isn't closed, newlines between its '*' and '/' are skipped.
+# '?' skips the rest of its line, or only itself when testing
+def token_regex(testing : bool):
+    if testing not in TOKEN_REGEXES:
+        import re
+        TOKEN_REGEXES[testing] = re.compile(TOKEN_PATTERN.replace('QUESTION', r'\?' if testing else r'\?[^\n]*\n?'), re.VERBOSE)
+    return TOKEN_REGEXES[testing]
+
+SYMBOLS = {
+    '(' : TT_LPAREN,
+    ')' : TT_RPAREN,
+    ',' : TT_COMMA,
+    ':' : TT_COLON,
+    '%' : TT_MOD,
+    '[' : TT_LSBRACKET,
+    ']' : TT_RSBRACKET,
+    '{' : TT_LCBRACKET,
+    '}' : TT_RCBRACKET,
+    ';' : TT_NEWLINE,
+    '\n': TT_NEWLINE,
+}
+
+OPERATORS = {
+    '=' : TT_EQ,        '==' : TT_EE,
+    '!' : TT_NOT,       '!=' : TT_NE,
+    '<' : TT_LT,        '<=' : TT_LTE,
+    '>' : TT_GT,        '>=' : TT_GTE,
+    '*' : TT_MUL,       '**' : TT_POW,      '*=' : TT_MULEQ,    '**=' : TT_MULEQ,
+    '+' : TT_PLUS,      '+=' : TT_PLUSEQ,   '++' : TT_PLUSPLUS,
+    '-' : TT_MINUS,     '-=' : TT_MINUSEQ,  '--' : TT_MINUSMINUS,
+    '&&': TT_AND,
+    '||': TT_OR,
+    '/' : TT_DIV,       '//' : TT_QUO,      '/=' : TT_DIVEQ,    '//=' : TT_DIVEQ,
+}
+
+SKIPPED = 'SKIPPED'
+
+# Characters read at once from a streamed file
+CHUNK_SIZE = 1 << 20
+
+# Type of a token text, or of its first character when the text is not listed (None for an illegal character)
+TEXT_TYPES = {**SYMBOLS, **OPERATORS, **{keyword : TT_KEYWORD for keyword in KEYWORDS}}
+FIRST_CHAR_TYPES = {
+    **{char : TT_IDENTIFIER for char in LETTERS + '_'},
+    **{char : TT_INT for char in DIGITS},
+    '"' : TT_STRING,    "'" : TT_STRING,
+    # Comments, the other texts starting with '/' are listed operators
+    '#' : SKIPPED,      '?' : SKIPPED,      '/' : SKIPPED,
+}
+
+# Symbols and operators have no value
+NO_VALUE_TYPES = frozenset({**SYMBOLS, **OPERATORS}.values())
+
+# Tokens read in one character end right after it, on its line. The others end where lexing ended
+OWN_END_TYPES = frozenset(SYMBOLS.values()) | {TT_EOF}
+
+class CompactToken(tuple):
+    # (type, value, start index, source), the positions are only made when they are read
+    __slots__ = ()
+
+    type = property(itemgetter(0))
+    value = property(itemgetter(1))
+
+    @property
+    def pos_start(self) -> LazyPosition:
+        return LazyPosition(self[2], self[3])
+
+    @property
+    def pos_end(self) -> LazyPosition:
+        if self[0] in OWN_END_TYPES:
+            return LazyPosition(self[2] + 1, self[3], True)
+        return LazyPosition(self[3].end_index, self[3])
+
+    def __repr__(self) -> str:
+        if self[1]: return f'{self[0]}:{self[1]}'
+        return f'{self[0]}'
+
+    def matches(self,  type_ : str, value : str) -> bool:
+        return self[0] == type_ and self[1] == value
+
+class TokenKinds(dict):
+    # Type and value of each token text (with the spaces after it). A text is only read the first time it is met
+    def __init__(self) -> None:
+        super().__init__()
+        # Whether a text is an illegal character, only then is it looked for among the types
+        self.illegal = False
+
+    def __missing__(self, match : str) -> tuple[str, object]:
+        text = match.rstrip(' \t')
+        type_ = TEXT_TYPES.get(text) or FIRST_CHAR_TYPES.get(text[0])
+        if type_ == None: self.illegal = True
+
+        if type_ in NO_VALUE_TYPES:
+            value = None
+        elif type_ == TT_INT:
+            if '.' in text:
+                type_ = TT_FLOAT
+                value = float(text)
+            else:
+                value = int(text)
+        elif type_ == TT_STRING:
+            value = string_value(text)
+        else:
+            value = text
+
+        kind = self[match] = (type_, value)
+        return kind
+
+def is_closed(string : str) -> bool:
+    return len(string) > 1 and string[-1] == string[0]
+
+# A backslash is dropped and the character after it is read as is
+def string_value(text : str) -> str:
+    return (text[1:-1] if is_closed(text) else text[1:]).replace('\\', '')
+
+# Whether a string or a multiline comment runs to the end of the text
+def is_unfinished(text : str) -> bool:
+    if text[0] in '"\'':
+        return not is_closed(text)
+    if text[0] == '/' and text not in OPERATORS:
+        # Closed by a '*' after the opening one, then newlines and a '/'
+        body = text[:-1].rstrip('\n')
+        return not (text[-1] == '/' and body[-1:] == '*' and len(body) - 1 > text.index('*'))
+    return False
+
+# Found by the list's own search, there are few of them
+def indexes_of(items : list, item) -> list[int]:
+    indexes = []
+    try:
+        while True:
+            indexes.append(items.index(item, indexes[-1] + 1 if indexes else 0))
+    except ValueError:
+        return indexes
+
+class FastLexer:
+    def __init__(self, file_name : str, text : str, testing : bool = False, first_line : int = 0) -> None:
+        self.file_name = file_name
+        self.text = text
+        self.testing = testing
+        self.source = Source(file_name, text, first_line)
+        # Whether the text ends with a '#' comment and its newline
+        self.ends_with_comment = False
+
+    def make_tokens(self, complete : bool = True, after_comment : bool = False) -> tuple[list[CompactToken], Error]:
+        # Only strings, numbers and tuples are made here, the collector would walk them for nothing
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return self.scan(complete, after_comment)
+        finally:
+            if gc_enabled: gc.enable()
+
+    # complete : False when more text follows (StreamLexer), no tokens are made if the text ends inside a string or a comment
+    # after_comment : the text before ended with a '#' comment
+    def scan(self, complete : bool, after_comment : bool) -> tuple[list[CompactToken], Error]:
+        text = self.text
+        source = self.source
+        if after_comment and text[:1] in (' ', '\t', '#'):
+            return [], self.illegal_char(0)
+
+        first = len(text) - len(text.lstrip(' \t'))
+        matches = token_regex(self.testing).findall(text, first)
+
+        kinds = TokenKinds()
+        match_kinds = list(map(kinds.__getitem__, matches))
+        types = list(map(itemgetter(0), match_kinds))
+
+        # The first illegal character stops lexing
+        error_index = types.index(None) if kinds.illegal else len(types)
+        last = matches[-1].rstrip(' \t') if matches else ''
+
+        if not complete and error_index == len(types) and last and is_unfinished(last):
+            return None, None
+        self.ends_with_comment = last[:1] == '#' and last[-1:] == '\n'
+
+        skipped = indexes_of(types, SKIPPED)
+        for i in skipped:
+            if i > error_index: break
+            # The character after a '#' comment is read without skipping spaces, tabs or another comment
+            comment = matches[i].rstrip(' \t')
+            if comment[0] == '#' and comment[-1] == '\n':
+                if len(matches[i]) > len(comment):
+                    return [], self.illegal_char(self.start_of(matches, first, i) + len(comment))
+                if i + 1 < len(matches) and matches[i + 1][0] == '#':
+                    return [], self.illegal_char(self.start_of(matches, first, i + 1))
+
+        if error_index < len(types):
+            return [], self.char_error(self.start_of(matches, first, error_index))
+
+        starts = accumulate(map(len, matches), initial=first)
+        tokens = list(map(CompactToken, zip(types, map(itemgetter(1), match_kinds), starts, repeat(source))))
+        if skipped:
+            # Comments are cut out between the slices of the tokens around them
+            kept = tokens[:skipped[0]]
+            for i, j in zip(skipped, skipped[1:]):
+                kept += tokens[i + 1:j]
+            tokens = kept + tokens[skipped[-1] + 1:]
+
+        if types and types[-1] == TT_STRING and not is_closed(last):
+            # An unclosed string runs to the end of the text with its spaces, the Lexer steps once past it
+            tokens[-1] = CompactToken((TT_STRING, string_value(matches[-1]), tokens[-1][2], source))
+            source.end_index = len(text) + 1
+
+        tokens.append(CompactToken((TT_EOF, None, source.end_index, source)))
+        return tokens, None
+
+    # Index of the i-th match, only needed for the errors
+    def start_of(self, matches : list, first : int, i : int) -> int:
+        return first + sum(map(len, islice(matches, i)))
+
+    def char_error(self, index : int) -> Error:
+        char = self.text[index]
+        if char in '&|':
+            return ExpectedCharError(LazyPosition(index, self.source), LazyPosition(index + 2, self.source), f"'{char}' (after '{char}')")
+        return self.illegal_char(index)
+
+    def illegal_char(self, index : int) -> Error:
+        char = self.text[index]
+        return IllegalCharError(LazyPosition(index, self.source), LazyPosition(index + 1, self.source), "'" + char + "' - Ascii code: " + str(ord(char)))
+
+
+class StreamLexer:
+    # Lexes a file object or an mmap a few lines at a time, its tokens are yielded as they are read.
+    # Tokens read in several characters end where the lines they are read with end
+    def __init__(self, file_name : str, file, testing : bool = False, chunk_size : int = CHUNK_SIZE) -> None:
+        self.file_name = file_name
+        self.file = file
+        self.testing = testing
+        self.chunk_size = chunk_size
+        self.error = None
+
+    def make_tokens(self) -> Iterator[CompactToken]:
+        decoder = getincrementaldecoder('utf-8')()
+        text = ''
+        line = 0
+        after_comment = False
+        at_end = False
+
+        while not at_end:
+            data = self.file.read(self.chunk_size)
+            at_end = not data
+            text += decoder.decode(data, at_end) if isinstance(data, bytes) else data
+
+            # Only whole lines are lexed until the end of the file
+            end = len(text) if at_end else text.rfind('\n') + 1
+            if end == 0 and not at_end: continue
+
+            lexer = FastLexer(self.file_name, text[:end], self.testing, line)
+            tokens, error = lexer.make_tokens(at_end, after_comment)
+            if error:
+                # The tokens end where the error is
+                self.error = error
+                yield CompactToken((TT_EOF, None, error.pos_start.index, lexer.source))
+                return
+            # A string or a comment goes on in the next lines
+            if tokens is None: continue
+
+            # The end of the file is the only end of the tokens
+            yield from tokens if at_end else islice(tokens, len(tokens) - 1)
+            line += text.count('\n', 0, end)
+            after_comment = lexer.ends_with_comment
+            text = text[end:]
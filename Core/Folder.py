@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+from Core.Constants import *
+from Core.Compiler import BINARY_METHODS, SHORT_CIRCUIT_TYPES, decided_value
+
+from Utils.Token import Token
+
+from Values.Value import Value
+from Values.Number import Number
+from Values.String import String
+
+from Errors.Error import Error
+
+from Nodes.BinOp import BinOpNode
+from Nodes.List import ListNode
+from Nodes.If import IfNode
+from Nodes.For import ForNode
+from Nodes.ForIn import ForInNode
+from Nodes.While import WhileNode
+from Nodes.FuncDef import FuncDefNode
+from Nodes.Call import CallNode
+from Nodes.Number import NumberNode
+from Nodes.String import StringNode
+from Nodes.InterpolatedString import InterpolatedStringNode
+from Nodes.UnaryOp import UnaryOpNode
+from Nodes.VarAccess import VarAccessNode
+from Nodes.VarAssign import VarAssignNode
+from Nodes.Return import ReturnNode
+from Nodes.Yield import YieldNode
+from Nodes.Continue import ContinueNode
+from Nodes.Break import BreakNode
+
+##############
+# ! FOLDER ! #
+##############
+
+# Pass over the AST before it is run : operations on numbers and strings are computed once,
+# constant if and elif cases are decided and the statements after a return, a break or a continue are dropped.
+# Values are computed by the same methods as at run time, an operation that fails (division by zero, illegal operation)
+# is left in the AST so that its error is raised when it is run.
+
+# Largest exponent and string folded, bigger results are made at run time, only if the code is run
+MAX_FOLDED_EXPONENT = 64
+MAX_FOLDED_LENGTH = 4096
+
+ENDING_NODES = (ReturnNode, BreakNode, ContinueNode)
+
+class Folder:
+    def fold(self, node):
+        method = getattr(self, f'fold_{type(node).__name__}', None)
+        return method(node) if method else node
+
+    # Value of a constant expression, None when it is only known at run time
+    def constant_value(self, node) -> Value:
+        if isinstance(node, NumberNode):
+            return Number(node.token.value)
+
+        if isinstance(node, StringNode):
+            return String(node.token.value)
+
+        if isinstance(node, BinOpNode):
+            left = self.constant_value(node.left_node)
+            if left is None: return None
+            # Known without its right operand, which may only be known at run time
+            if node.op_token.type in SHORT_CIRCUIT_TYPES:
+                value = decided_value(node.op_token.type, left)
+                if value is not None: return value
+            right = self.constant_value(node.right_node)
+            if right is None: return None
+            return self.operation_value(BINARY_METHODS[node.op_token.type], left, right)
+
+        if isinstance(node, UnaryOpNode):
+            operand = self.constant_value(node.node)
+            if operand is None: return None
+            if node.op_token.type == TT_MINUS:
+                return self.operation_value('multiply', operand, Number(-1))
+            if node.op_token.type == TT_NOT:
+                return self.operation_value('not_comp', operand)
+
+        return None
+
+    def operation_value(self, method_name : str, operand : Value, *others : Value) -> Value:
+        if not self.small_enough(method_name, operand, *others): return None
+        try:
+            value, error = getattr(operand, method_name)(*others)
+        except Exception:
+            return None
+        return None if error else value
+
+    def small_enough(self, method_name : str, operand : Value, other : Value = None) -> bool:
+        if method_name == 'power' and isinstance(other, Number):
+            return not isinstance(other.value, int) or abs(other.value) <= MAX_FOLDED_EXPONENT
+        if method_name == 'multiply' and isinstance(operand, String) and isinstance(other, Number):
+            return isinstance(other.value, int) and len(operand.value) * other.value <= MAX_FOLDED_LENGTH
+        if method_name == 'add' and isinstance(operand, String) and isinstance(other, String):
+            return len(operand.value) + len(other.value) <= MAX_FOLDED_LENGTH
+        return True
+
+    # Number or string node of a folded operation, at the operation's positions
+    def constant_node(self, node):
+        value = self.constant_value(node)
+
+        if isinstance(value, Number) and type(value.value) in (int, float):
+            token_type = TT_FLOAT if isinstance(value.value, float) else TT_INT
+            return NumberNode(Token(token_type, value.value, node.pos_start, node.pos_end))
+
+        if isinstance(value, String):
+            return StringNode(Token(TT_STRING, value.value, node.pos_start, node.pos_end))
+
+        return node
+
+    ######
+
+    def fold_ListNode(self, node : ListNode) -> ListNode:
+        elements = []
+        for element_node in node.elements_nodes:
+            elements.append(self.fold(element_node))
+            # Nothing after it is ever run
+            if isinstance(elements[-1], ENDING_NODES): break
+        node.elements_nodes = elements
+        return node
+
+    def fold_InterpolatedStringNode(self, node : InterpolatedStringNode) -> InterpolatedStringNode:
+        node.expression_nodes = [
+            expression_node if isinstance(expression_node, Error) else self.fold(expression_node)
+            for expression_node in node.expression_nodes
+        ]
+        return node
+
+    def fold_BinOpNode(self, node : BinOpNode):
+        node.left_node = self.fold(node.left_node)
+        node.right_node = self.fold(node.right_node)
+        return self.constant_node(node)
+
+    def fold_UnaryOpNode(self, node : UnaryOpNode):
+        node.node = self.fold(node.node)
+        return self.constant_node(node)
+
+    def fold_VarAccessNode(self, node : VarAccessNode) -> VarAccessNode:
+        if node.slice_or_getter:
+            node.slice_or_getter = [self.fold(ope) if ope != None else None for ope in node.slice_or_getter]
+        return node
+
+    def fold_VarAssignNode(self, node : VarAssignNode) -> VarAssignNode:
+        node.value_node = self.fold(node.value_node)
+        return node
+
+    def fold_IfNode(self, node : IfNode) -> IfNode:
+        # The node stays, with its positions, its cases that are decided at run time and the case taken after them
+        cases = []
+        else_case = self.fold(node.else_case) if node.else_case else None
+
+        for condition, expression in node.cases:
+            condition = self.fold(condition)
+            value = self.constant_value(condition)
+
+            if value is None:
+                cases.append((condition, self.fold(expression)))
+            elif value.is_true():
+                else_case = self.fold(expression)
+                break
+
+        node.cases = cases
+        node.else_case = else_case
+        return node
+
+    def fold_ForNode(self, node : ForNode) -> ForNode:
+        node.start_value_node = self.fold(node.start_value_node)
+        node.end_value_node = self.fold(node.end_value_node)
+        if node.step_value_node: node.step_value_node = self.fold(node.step_value_node)
+        node.body_node = self.fold(node.body_node)
+        return node
+
+    def fold_ForInNode(self, node : ForInNode) -> ForInNode:
+        node.iterated_value_node = self.fold(node.iterated_value_node)
+        node.body_node = self.fold(node.body_node)
+        return node
+
+    def fold_WhileNode(self, node : WhileNode) -> WhileNode:
+        node.condition_node = self.fold(node.condition_node)
+        node.body_node = self.fold(node.body_node)
+        return node
+
+    def fold_FuncDefNode(self, node : FuncDefNode) -> FuncDefNode:
+        for arg_name_token, default_node in node.arg_name_tokens.items():
+            if default_node != Boolean.null: node.arg_name_tokens[arg_name_token] = self.fold(default_node)
+        node.body_node = self.fold(node.body_node)
+        return node
+
+    def fold_CallNode(self, node : CallNode) -> CallNode:
+        node.name_node = self.fold(node.name_node)
+        for key, arg_node in node.args_nodes.items():
+            if key == Boolean.null:
+                node.args_nodes[key] = [self.fold(positional_node) for positional_node in arg_node]
+            else:
+                node.args_nodes[key] = self.fold(arg_node)
+        return node
+
+    def fold_ReturnNode(self, node : ReturnNode) -> ReturnNode:
+        if node.return_node: node.return_node = self.fold(node.return_node)
+        return node
+
+    def fold_YieldNode(self, node : YieldNode) -> YieldNode:
+        if node.yield_node: node.yield_node = self.fold(node.yield_node)
+        return node
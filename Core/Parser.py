@@ -1,8 +1,13 @@
+from collections.abc import Iterator
+
 from Utils.Token import Token
 from Utils.ParseResult import ParseResult
+from Utils.TokenStream import TokenStream
 
 from Core.Constants import *
+from Core.FastLexer import FastLexer
 
+from Errors.Error import Error
 from Errors.InvalidSyntaxError import InvalidSyntaxError
 
 from Nodes.BinOp import BinOpNode
@@ -15,10 +20,12 @@ from Nodes.FuncDef import FuncDefNode
 from Nodes.Call import CallNode
 from Nodes.Number import NumberNode
 from Nodes.String import StringNode
+from Nodes.InterpolatedString import InterpolatedStringNode
 from Nodes.UnaryOp import UnaryOpNode
 from Nodes.VarAccess import VarAccessNode
 from Nodes.VarAssign import VarAssignNode
 from Nodes.Return import ReturnNode
+from Nodes.Yield import YieldNode
 from Nodes.Continue import ContinueNode
 from Nodes.Break import BreakNode
 from Nodes.Import import ImportNode
@@ -29,8 +36,10 @@ from Nodes.Import import ImportNode
 ##############
 
 class Parser:
-    def __init__(self, tokens : list[Token]) -> None:
+    def __init__(self, tokens : list[Token] | TokenStream) -> None:
         self.tokens = tokens
+        # Yields parsed in the function bodies being parsed, a function keeps none of them once parsed
+        self.yield_nodes = []
         self.token_index = -1
         self.advance()
     
@@ -55,6 +64,16 @@ class Parser:
                 self.current_token.pos_start, self.current_token.pos_end,
                 "Expected '+', '-', '*', '/', '%', '//', '**', '==', '!=', '<', '>', <=', '>=', '&&' or '||'"
             ))
+
+        if not result.error and self.yield_nodes:
+            return result.failure(InvalidSyntaxError(
+                self.yield_nodes[0].pos_start, self.yield_nodes[0].pos_end,
+                "'yield' outside of a function"
+            ))
+
+        # The value of a program is only shown by the shell, for a single statement
+        if not result.error:
+            self.mark_statement_loops(result.node, len(result.node.elements_nodes) == 1)
         return result 
 
 ########
@@ -111,6 +130,17 @@ class Parser:
                 self.reverse(res.to_reverse_count)
             return res.success(ReturnNode(expr, pos_start, self.current_token.pos_end.copy()))
         
+        if self.current_token.matches(TT_KEYWORD, 'yield'):
+            res.register_advance()
+            self.advance()
+
+            expr = res.try_register(self.expression())
+            if not expr:
+                self.reverse(res.to_reverse_count)
+            yield_node = YieldNode(expr, pos_start, self.current_token.pos_end.copy())
+            self.yield_nodes.append(yield_node)
+            return res.success(yield_node)
+        
         if self.current_token.matches(TT_KEYWORD, 'continue'):
             res.register_advance()
             self.advance()
@@ -125,7 +155,7 @@ class Parser:
         if res.error:
             return res.failure(InvalidSyntaxError(
                 self.current_token.pos_start, self.current_token.pos_end,
-                "Expected 'return', 'continue', 'break', 'var', 'if', 'for', 'while', 'func', INT, FLOAT, IDENTIFIER, '+', '-', '(' or '!'"
+                "Expected 'return', 'yield', 'continue', 'break', 'var', 'if', 'for', 'while', 'func', INT, FLOAT, IDENTIFIER, '+', '-', '(' or '!'"
             ))
         return res.success(expr)
 
@@ -688,6 +718,7 @@ class Parser:
         arg_names_dict = {}
         for i in range(len(arg_name_tokens)):
             arg_names_dict[arg_name_tokens[i]] = arg_default_values[i]
+        yields_start = len(self.yield_nodes)
         
         if self.current_token.type == TT_NEWLINE:
             result.register_advance()
@@ -704,7 +735,12 @@ class Parser:
             
             result.register_advance()
             self.advance()
-            return result.success(FuncDefNode(func_name_token, arg_names_dict, body_node, False))
+            is_generator = len(self.yield_nodes) > yields_start
+            if is_generator:
+                error = yield_error(body_node, self.yield_nodes[yields_start:])
+                if error: return result.failure(error)
+            del self.yield_nodes[yields_start:]
+            return result.success(FuncDefNode(func_name_token, arg_names_dict, body_node, False, is_generator))
         else:
             body_node = result.register(self.expression())
             if result.error: return result
@@ -794,7 +830,7 @@ class Parser:
         if token.type == TT_STRING:
             result.register_advance()
             self.advance()
-            return result.success(StringNode(token))
+            return result.success(string_node(token, Parser))
         
         elif token.type == TT_IDENTIFIER:
             var_expr = result.register(self.var_expr())
@@ -1025,4 +1061,171 @@ class Parser:
             if result.error: return result
             left = BinOpNode(left, op_token, right)
         
-        return result.success(left)
\ No newline at end of file
+        return result.success(left)
+
+#* STREAMING
+
+    # Statements of a TokenStream, parsed and yielded one at a time.
+    # The tokens before a statement's end are released once it is parsed, an error ends the statements
+    def parse_statements(self) -> Iterator[ParseResult]:
+        while self.current_token.type == TT_NEWLINE:
+            self.advance()
+
+        result = self.statement()
+        while True:
+            if result.error:
+                yield result
+                return
+
+            if self.yield_nodes:
+                yield ParseResult().failure(InvalidSyntaxError(
+                    self.yield_nodes[0].pos_start, self.yield_nodes[0].pos_end,
+                    "'yield' outside of a function"
+                ))
+                return
+
+            self.mark_statement_loops(result.node, False)
+            yield result
+            self.tokens.release(self.token_index)
+
+            newline_count = 0
+            while self.current_token.type == TT_NEWLINE:
+                self.advance()
+                newline_count += 1
+            if newline_count == 0: break
+
+            result = self.statement()
+            if result.error:
+                self.reverse(result.advance_count)
+                break
+
+        if self.current_token.type != TT_EOF:
+            yield ParseResult().failure(InvalidSyntaxError(
+                self.current_token.pos_start, self.current_token.pos_end,
+                "Expected '+', '-', '*', '/', '%', '//', '**', '==', '!=', '<', '>', <=', '>=', '&&' or '||'"
+            ))
+
+#* STATEMENT LOOPS
+
+    def mark_statement_loops(self, node, value_used : bool) -> None:
+        mark_statement_loops(node, value_used)
+
+# Loops whose value is never read don't build the list of their body values
+def mark_statement_loops(node, value_used : bool) -> None:
+    if isinstance(node, (ForNode, ForInNode, WhileNode)):
+        node.is_statement = not value_used
+        for value_node in (
+            [node.condition_node] if isinstance(node, WhileNode) else
+            [node.iterated_value_node] if isinstance(node, ForInNode) else
+            [node.start_value_node, node.end_value_node, node.step_value_node]
+        ):
+            if value_node: mark_statement_loops(value_node, True)
+        mark_statement_loops(node.body_node, value_used)
+
+    # Statements are elements of a ListNode, used when the block's value is
+    elif isinstance(node, ListNode):
+        for element_node in node.elements_nodes:
+            mark_statement_loops(element_node, value_used)
+
+    elif isinstance(node, IfNode):
+        for condition, expression in node.cases:
+            mark_statement_loops(condition, True)
+            mark_statement_loops(expression, value_used)
+        if node.else_case: mark_statement_loops(node.else_case, value_used)
+
+    # Only functions written on one line return the value of their body
+    elif isinstance(node, FuncDefNode):
+        for default_node in node.arg_name_tokens.values():
+            if default_node != Boolean.null: mark_statement_loops(default_node, True)
+        mark_statement_loops(node.body_node, node.auto_return)
+
+    elif isinstance(node, BinOpNode):
+        mark_statement_loops(node.left_node, True)
+        mark_statement_loops(node.right_node, True)
+
+    elif isinstance(node, UnaryOpNode):
+        mark_statement_loops(node.node, True)
+
+    elif isinstance(node, VarAssignNode):
+        mark_statement_loops(node.value_node, True)
+
+    elif isinstance(node, VarAccessNode):
+        for ope in node.slice_or_getter or []:
+            if ope != None: mark_statement_loops(ope, True)
+
+    elif isinstance(node, CallNode):
+        mark_statement_loops(node.name_node, True)
+        for key, arg_node in node.args_nodes.items():
+            for value_node in (arg_node if key == Boolean.null else [arg_node]):
+                mark_statement_loops(value_node, True)
+
+    elif isinstance(node, ReturnNode):
+        if node.return_node: mark_statement_loops(node.return_node, True)
+
+    elif isinstance(node, YieldNode):
+        if node.yield_node: mark_statement_loops(node.yield_node, True)
+
+#* GENERATORS
+
+# A generator stops at its yields, which are statements of its body or of the bodies of the ifs and loops in it.
+# The lists, ifs and loops on the way to a yield are marked as suspending, the yields found are returned
+def mark_suspending(node) -> list[YieldNode]:
+    if isinstance(node, YieldNode): return [node]
+
+    if isinstance(node, ListNode):
+        body_nodes = node.elements_nodes
+    elif isinstance(node, IfNode):
+        body_nodes = [expression for _, expression in node.cases] + ([node.else_case] if node.else_case else [])
+    elif isinstance(node, (ForNode, ForInNode, WhileNode)):
+        body_nodes = [node.body_node]
+    else:
+        return []
+
+    yield_nodes = []
+    for body_node in body_nodes:
+        yield_nodes += mark_suspending(body_node)
+    node.suspends = len(yield_nodes) > 0
+    return yield_nodes
+
+# A yield in a value (an assignment, an argument, an operand...) can't stop the generator
+def yield_error(body_node, yield_nodes : list[YieldNode]) -> Error:
+    suspending = mark_suspending(body_node)
+    for yield_node in yield_nodes:
+        if yield_node not in suspending:
+            return InvalidSyntaxError(
+                yield_node.pos_start, yield_node.pos_end,
+                "'yield' can't be inside a value, only in the statements of the function and of its ifs and loops"
+            )
+    return None
+
+#* STRING INTERPOLATION
+
+# A string with {expr} is split into the texts around its expressions, each expression is lexed and parsed once here
+def string_node(token : Token, parser_class) -> StringNode | InterpolatedStringNode:
+    text = token.value
+    texts = []
+    expression_nodes = []
+    text_start = index = 0
+
+    while True:
+        close_index = text.find('}', index)
+        if close_index < 0: break
+        open_index = text.find('{', index, close_index)
+        index = close_index + 1
+        # A '}' with no '{' before it is text
+        if open_index < 0: continue
+
+        texts.append(text[text_start:open_index])
+        expression_nodes.append(interpolated_expression(text[open_index + 1:close_index], token.pos_start.file_name, parser_class))
+        text_start = index
+
+    if not expression_nodes: return StringNode(token)
+    texts.append(text[text_start:])
+    return InterpolatedStringNode(token, texts, expression_nodes)
+
+# Statements of an expression, or the error that stops lexing or parsing it
+def interpolated_expression(expression : str, file_name : str, parser_class) -> ListNode | Error:
+    tokens, error = FastLexer(file_name, expression).make_tokens()
+    if error: return error
+    ast = parser_class(tokens).parse()
+    return ast.error or ast.node
@@ -0,0 +1,531 @@
+from collections.abc import Iterator
+
+from Utils.Token import Token
+from Utils.ParseResult import ParseResult
+from Utils.TokenStream import TokenStream
+
+from Core.Constants import *
+from Core.Parser import mark_statement_loops, string_node, yield_error
+
+from Errors.Error import Error
+from Errors.InvalidSyntaxError import InvalidSyntaxError
+
+from Nodes.BinOp import BinOpNode
+from Nodes.List import ListNode
+from Nodes.If import IfNode
+from Nodes.For import ForNode
+from Nodes.ForIn import ForInNode
+from Nodes.While import WhileNode
+from Nodes.FuncDef import FuncDefNode
+from Nodes.Call import CallNode
+from Nodes.Number import NumberNode
+from Nodes.UnaryOp import UnaryOpNode
+from Nodes.VarAccess import VarAccessNode
+from Nodes.VarAssign import VarAssignNode
+from Nodes.Return import ReturnNode
+from Nodes.Yield import YieldNode
+from Nodes.Continue import ContinueNode
+from Nodes.Break import BreakNode
+from Nodes.Import import ImportNode
+
+
+####################
+# ! PRATT PARSER ! #
+####################
+
+# Same grammar (grammar.txt), nodes and errors as the Parser.
+# The binary operators are parsed by precedence in one loop instead of one method per level,
+# the methods return nodes and a syntax error is raised up to parse() instead of being checked after each call.
+
+LOGIC_PRECEDENCE = 1
+COMP_PRECEDENCE  = 2
+ARITH_PRECEDENCE = 3
+TERM_PRECEDENCE  = 4
+
+BINARY_PRECEDENCES = {
+    TT_AND : LOGIC_PRECEDENCE,  TT_OR : LOGIC_PRECEDENCE,
+    TT_EE  : COMP_PRECEDENCE,   TT_NE : COMP_PRECEDENCE,
+    TT_LT  : COMP_PRECEDENCE,   TT_GT : COMP_PRECEDENCE,
+    TT_LTE : COMP_PRECEDENCE,   TT_GTE: COMP_PRECEDENCE,
+    TT_PLUS: ARITH_PRECEDENCE,  TT_MINUS : ARITH_PRECEDENCE,
+    TT_MUL : TERM_PRECEDENCE,   TT_DIV: TERM_PRECEDENCE,
+    TT_MOD : TERM_PRECEDENCE,   TT_QUO: TERM_PRECEDENCE,
+}
+
+ASSIGN_OPERATORS = {
+    TT_EQ           : None,
+    TT_PLUSEQ       : TT_PLUS,
+    TT_MINUSEQ      : TT_MINUS,
+    TT_MULEQ        : TT_MUL,
+    TT_DIVEQ        : TT_DIV,
+    TT_PLUSPLUS     : TT_PLUS,
+    TT_MINUSMINUS   : TT_MINUS,
+}
+
+class ParseError(Exception):
+    def __init__(self, error : Error) -> None:
+        super().__init__(error)
+        self.error = error
+
+class PrattParser:
+    def __init__(self, tokens : list[Token] | TokenStream) -> None:
+        self.tokens = tokens
+        # Yields parsed in the function bodies being parsed, a function keeps none of them once parsed
+        self.yield_nodes = []
+        self.token_index = 0
+        self.current_token = tokens[0]
+
+    def advance(self) -> None:
+        self.token_index += 1
+        # Past the end, the current token stays the last one (EOF)
+        try:
+            self.current_token = self.tokens[self.token_index]
+        except IndexError:
+            pass
+
+    def reverse_to(self, token_index : int) -> None:
+        self.token_index = token_index
+        self.current_token = self.tokens[token_index]
+
+    def fail(self, details : str, token : Token = None) -> None:
+        token = token or self.current_token
+        raise ParseError(InvalidSyntaxError(token.pos_start, token.pos_end, details))
+
+    def expect(self, token_type : str, details : str) -> None:
+        if self.current_token.type != token_type: self.fail(details)
+        self.advance()
+
+    def parse(self) -> ParseResult:
+        result = ParseResult()
+        try:
+            node = self.statements()
+            if self.current_token.type != TT_EOF:
+                self.fail("Expected '+', '-', '*', '/', '%', '//', '**', '==', '!=', '<', '>', <=', '>=', '&&' or '||'")
+        except ParseError as error:
+            return result.failure(error.error)
+
+        if self.yield_nodes:
+            return result.failure(InvalidSyntaxError(
+                self.yield_nodes[0].pos_start, self.yield_nodes[0].pos_end,
+                "'yield' outside of a function"
+            ))
+
+        # The value of a program is only shown by the shell, for a single statement
+        mark_statement_loops(node, len(node.elements_nodes) == 1)
+        return result.success(node)
+
+########
+    def statements(self) -> ListNode:
+        statements = []
+        pos_start = self.current_token.pos_start.copy()
+
+        while self.current_token.type == TT_NEWLINE:
+            self.advance()
+
+        statements.append(self.statement())
+
+        while self.current_token.type == TT_NEWLINE:
+            while self.current_token.type == TT_NEWLINE:
+                self.advance()
+
+            # The statements end before the first one that can't be parsed
+            token_index = self.token_index
+            try:
+                statements.append(self.statement())
+            except ParseError:
+                self.reverse_to(token_index)
+                break
+
+        return ListNode(statements, pos_start, self.current_token.pos_end.copy())
+
+    def statement(self):
+        token = self.current_token
+        pos_start = token.pos_start.copy()
+
+        if token.type == TT_KEYWORD:
+            if token.value in ('return', 'yield'):
+                self.advance()
+                token_index = self.token_index
+                try:
+                    expression = self.expression()
+                except ParseError:
+                    self.reverse_to(token_index)
+                    expression = None
+
+                if token.value == 'return':
+                    return ReturnNode(expression, pos_start, self.current_token.pos_end.copy())
+                yield_node = YieldNode(expression, pos_start, self.current_token.pos_end.copy())
+                self.yield_nodes.append(yield_node)
+                return yield_node
+
+            if token.value == 'continue':
+                self.advance()
+                return ContinueNode(pos_start, self.current_token.pos_end.copy())
+
+            if token.value == 'break':
+                self.advance()
+                return BreakNode(pos_start, self.current_token.pos_end.copy())
+
+        token_index = self.token_index
+        try:
+            return self.expression()
+        except ParseError:
+            if self.token_index == token_index:
+                self.fail("Expected 'return', 'yield', 'continue', 'break', 'var', 'if', 'for', 'while', 'func', INT, FLOAT, IDENTIFIER, '+', '-', '(' or '!'")
+            raise
+
+#* EXPRESSIONS
+
+    def expression(self):
+        if self.current_token.matches(TT_KEYWORD, 'var'):
+            return self.var_assign()
+
+        # An error before any token is read is reported as the error of the whole expression
+        token_index = self.token_index
+        try:
+            return self.binary(LOGIC_PRECEDENCE)
+        except ParseError:
+            if self.token_index == token_index:
+                self.fail("Expected 'var', INT, FLOAT, IDENTIFIER, '!', '+', '-' or '('")
+            raise
+
+    def var_assign(self) -> VarAssignNode:
+        self.advance()
+
+        var_name = self.current_token
+        self.expect(TT_IDENTIFIER, "Expected identifier")
+
+        operator_value = self.current_token
+        if operator_value.type not in ASSIGN_OPERATORS:
+            self.fail("Expected '=' or operators")
+        self.advance()
+
+        # var a++ and var a += b are read as var a = a + 1 and var a = a + b
+        if operator_value.type in (TT_PLUSPLUS, TT_MINUSMINUS):
+            expression = NumberNode(Token(TT_INT, 1, operator_value.pos_start, operator_value.pos_end))
+        else:
+            expression = self.expression()
+
+        operator_type = ASSIGN_OPERATORS[operator_value.type]
+        if operator_type:
+            operator_token = Token(operator_type, pos_start=operator_value.pos_start, pos_end=operator_value.pos_end)
+            expression = BinOpNode(VarAccessNode(var_name), operator_token, expression)
+        return VarAssignNode(var_name, expression)
+
+    # Binary operators of at least min_precedence, each right operand binds the operators of higher precedence
+    def binary(self, min_precedence : int):
+        token = self.current_token
+
+        # A comparison (or an '!') is the operand of '&&' and '||'
+        if min_precedence <= COMP_PRECEDENCE and token.type == TT_NOT:
+            self.advance()
+            left = UnaryOpNode(token, self.binary(COMP_PRECEDENCE))
+        elif min_precedence <= COMP_PRECEDENCE:
+            token_index = self.token_index
+            try:
+                left = self.factor()
+            except ParseError:
+                if self.token_index == token_index:
+                    self.fail("Expected INT, FLOAT, IDENTIFIER, '!', '+', '-' or '('")
+                raise
+        else:
+            left = self.factor()
+
+        while True:
+            op_token = self.current_token
+            precedence = BINARY_PRECEDENCES.get(op_token.type)
+            if precedence is None or precedence < min_precedence:
+                return left
+
+            self.advance()
+            left = BinOpNode(left, op_token, self.binary(precedence + 1))
+
+    def factor(self):
+        token = self.current_token
+        if token.type in (TT_PLUS, TT_MINUS):
+            self.advance()
+            return UnaryOpNode(token, self.factor())
+
+        node = self.call()
+        while self.current_token.type == TT_POW:
+            op_token = self.current_token
+            self.advance()
+            node = BinOpNode(node, op_token, self.factor())
+        return node
+
+    def call(self):
+        atom = self.atom()
+        if self.current_token.type != TT_LPAREN:
+            return atom
+        self.advance()
+
+        # Positional arguments are listed under null, a keyword argument is keyed by its name node
+        arg_nodes = {
+            Boolean.null: []
+        }
+
+        if self.current_token.type == TT_RPAREN:
+            self.advance()
+            return CallNode(atom, arg_nodes)
+
+        while True:
+            arg_node = self.expression()
+            if self.current_token.type == TT_EQ:
+                self.advance()
+                arg_nodes[arg_node] = self.expression()
+            else:
+                arg_nodes[Boolean.null].append(arg_node)
+
+            if self.current_token.type != TT_COMMA: break
+            self.advance()
+
+        self.expect(TT_RPAREN, "Expected ',' or ')'")
+        return CallNode(atom, arg_nodes)
+
+    def atom(self):
+        token = self.current_token
+        token_type = token.type
+
+        if token_type in (TT_INT, TT_FLOAT):
+            self.advance()
+            return NumberNode(token)
+
+        if token_type == TT_STRING:
+            self.advance()
+            return string_node(token, PrattParser)
+
+        if token_type == TT_IDENTIFIER:
+            return self.var_expr()
+
+        if token_type == TT_LPAREN:
+            self.advance()
+            expression = self.expression()
+            if self.current_token.type != TT_RPAREN:
+                self.fail("Expected ')'", token)
+            self.advance()
+            return expression
+
+        if token_type == TT_LSBRACKET:
+            return self.list_expr()
+
+        if token_type == TT_KEYWORD:
+            if token.value == 'if':     return self.if_expr()
+            if token.value == 'import': return self.import_expr()
+            if token.value == 'for':    return self.for_expr()
+            if token.value == 'while':  return self.while_expr()
+            if token.value == 'func':   return self.func_def()
+
+        self.fail("Expected INT, FLOAT, IDENTIFIER, '+', '-' or '('")
+
+    def var_expr(self) -> VarAccessNode:
+        token = self.current_token
+        slice_or_getter = []
+        self.advance()
+
+        # a[i], a[:end], a[start:] or a[start:end]
+        if self.current_token.type == TT_LSBRACKET:
+            self.advance()
+
+            if self.current_token.type == TT_COLON:
+                slice_or_getter.append(None)
+                self.advance()
+                slice_or_getter.append(self.expression())
+            else:
+                slice_or_getter.append(self.expression())
+                if self.current_token.type == TT_COLON:
+                    self.advance()
+                    slice_or_getter.append(None if self.current_token.type == TT_RSBRACKET else self.expression())
+
+            self.expect(TT_RSBRACKET, "Expected ']'")
+        return VarAccessNode(token, slice_or_getter)
+
+    def list_expr(self) -> ListNode:
+        element_nodes = []
+        pos_start = self.current_token.pos_start.copy()
+        self.advance()
+
+        if self.current_token.type != TT_RSBRACKET:
+            element_nodes.append(self.expression())
+            while self.current_token.type == TT_COMMA:
+                self.advance()
+                element_nodes.append(self.expression())
+
+            if self.current_token.type != TT_RSBRACKET:
+                self.fail("Expected ',' or ']'")
+        self.advance()
+
+        return ListNode(element_nodes, pos_start, self.current_token.pos_end.copy())
+
+#* BLOCKS
+
+    # The body of an if, a loop or a function: statements after a newline until '}', or one on the line
+    def block(self, single):
+        if self.current_token.type == TT_NEWLINE:
+            self.advance()
+            body = self.statements()
+        else:
+            body = single()
+
+        self.expect(TT_RCBRACKET, "Expected '}'")
+        return body
+
+    def if_expr(self) -> IfNode:
+        cases = []
+        else_case = None
+
+        # if, then each elif
+        while True:
+            self.advance()
+            condition = self.expression()
+            self.expect(TT_LCBRACKET, "Expected '{'")
+            cases.append((condition, self.block(self.statement)))
+
+            if not self.current_token.matches(TT_KEYWORD, 'elif'): break
+
+        if self.current_token.matches(TT_KEYWORD, 'else'):
+            self.advance()
+            self.expect(TT_LCBRACKET, "Expected '{'")
+            else_case = self.block(self.statement)
+
+        return IfNode(cases, else_case)
+
+    def for_expr(self) -> ForNode | ForInNode:
+        self.advance()
+
+        var_name = self.current_token
+        self.expect(TT_IDENTIFIER, "Expected IDENTIFIER")
+
+        if self.current_token.type == TT_EQ:
+            self.advance()
+            start_value = self.expression()
+
+            if not self.current_token.matches(TT_KEYWORD, 'to'):
+                self.fail("Expected 'to'")
+            self.advance()
+            end_value = self.expression()
+
+            step_value = None
+            if self.current_token.matches(TT_KEYWORD, 'step'):
+                self.advance()
+                step_value = self.expression()
+
+            self.expect(TT_LCBRACKET, "Expected '{'")
+            return ForNode(var_name, start_value, end_value, step_value, self.block(self.expression))
+
+        if self.current_token.matches(TT_KEYWORD, 'in'):
+            self.advance()
+            iterated_value = self.expression()
+
+            self.expect(TT_LCBRACKET, "Expected '{'")
+            return ForInNode(var_name, iterated_value, self.block(self.expression))
+
+        self.fail("Expected '=' or 'in'")
+
+    def while_expr(self) -> WhileNode:
+        self.advance()
+        condition_value = self.expression()
+
+        self.expect(TT_LCBRACKET, "Expected '{'")
+        return WhileNode(condition_value, self.block(self.expression))
+
+    def import_expr(self) -> ImportNode:
+        pos_start = self.current_token.pos_start.copy()
+        self.advance()
+
+        file_name = self.current_token
+        if file_name.type != TT_STRING:
+            self.fail("Expected a string")
+        pos_end = file_name.pos_end.copy()
+        self.advance()
+
+        return ImportNode(file_name, pos_start, pos_end)
+
+    def func_def(self) -> FuncDefNode:
+        self.advance()
+
+        func_name_token = None
+        if self.current_token.type == TT_IDENTIFIER:
+            func_name_token = self.current_token
+            self.advance()
+            self.expect(TT_LPAREN, "Expected '('")
+        else:
+            self.expect(TT_LPAREN, "Expected IDENTIFIER or '('")
+
+        # Arguments and their default values, null for none. Once an argument has one, the next ones need one too
+        arg_names_dict = {}
+        if self.current_token.type == TT_IDENTIFIER:
+            using_default_values = False
+            while True:
+                arg_name_token = self.current_token
+                self.advance()
+
+                if self.current_token.type == TT_EQ:
+                    self.advance()
+                    using_default_values = True
+                    arg_names_dict[arg_name_token] = self.expression()
+                elif using_default_values:
+                    self.fail("Expected '='")
+                else:
+                    arg_names_dict[arg_name_token] = Boolean.null
+
+                if self.current_token.type != TT_COMMA: break
+                self.advance()
+                if self.current_token.type != TT_IDENTIFIER:
+                    self.fail("Expected IDENTIFIER")
+
+            self.expect(TT_RPAREN, "Expected ',' or ')'")
+        else:
+            self.expect(TT_RPAREN, "Expected IDENTIFIER or ')'")
+
+        self.expect(TT_LCBRACKET, "Expected '{'")
+
+        # A function written on one line returns the value of its body
+        if self.current_token.type != TT_NEWLINE:
+            return FuncDefNode(func_name_token, arg_names_dict, self.block(self.expression), True)
+
+        yields_start = len(self.yield_nodes)
+        body_node = self.block(self.expression)
+        is_generator = len(self.yield_nodes) > yields_start
+        if is_generator:
+            error = yield_error(body_node, self.yield_nodes[yields_start:])
+            if error: raise ParseError(error)
+        del self.yield_nodes[yields_start:]
+        return FuncDefNode(func_name_token, arg_names_dict, body_node, False, is_generator)
+
+#* STREAMING
+
+    # Statements of a TokenStream, parsed and yielded one at a time.
+    # The tokens before a statement's end are released once it is parsed, an error ends the statements
+    def parse_statements(self) -> Iterator[ParseResult]:
+        try:
+            while self.current_token.type == TT_NEWLINE:
+                self.advance()
+            node = self.statement()
+
+            while True:
+                if self.yield_nodes:
+                    yield ParseResult().failure(InvalidSyntaxError(
+                        self.yield_nodes[0].pos_start, self.yield_nodes[0].pos_end,
+                        "'yield' outside of a function"
+                    ))
+                    return
+
+                mark_statement_loops(node, False)
+                yield ParseResult().success(node)
+                self.tokens.release(self.token_index)
+
+                if self.current_token.type != TT_NEWLINE: break
+                while self.current_token.type == TT_NEWLINE:
+                    self.advance()
+
+                token_index = self.token_index
+                try:
+                    node = self.statement()
+                except ParseError:
+                    self.reverse_to(token_index)
+                    break
+
+            if self.current_token.type != TT_EOF:
+                self.fail("Expected '+', '-', '*', '/', '%', '//', '**', '==', '!=', '<', '>', <=', '>=', '&&' or '||'")
+        except ParseError as error:
+            yield ParseResult().failure(error.error)
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+from Core.Constants import *
+
+from Nodes.BinOp import BinOpNode
+from Nodes.List import ListNode
+from Nodes.If import IfNode
+from Nodes.For import ForNode
+from Nodes.ForIn import ForInNode
+from Nodes.While import WhileNode
+from Nodes.FuncDef import FuncDefNode
+from Nodes.Call import CallNode
+from Nodes.UnaryOp import UnaryOpNode
+from Nodes.VarAccess import VarAccessNode
+from Nodes.VarAssign import VarAssignNode
+from Nodes.Return import ReturnNode
+from Nodes.Yield import YieldNode
+from Nodes.InterpolatedString import InterpolatedStringNode
+from Nodes.Import import ImportNode
+
+from Errors.Error import Error
+
+################
+# ! RESOLVER ! #
+################
+
+# How a compiled engine reads a variable
+SCOPE_LOCAL     = 'LOCAL'   # slot of the running function
+SCOPE_GLOBAL    = 'GLOBAL'  # global symbol table first, bound nowhere else
+SCOPE_NAME      = 'NAME'    # looked up by name through the callers
+
+# Set by _run in the symbol table of every program
+PROGRAM_NAMES   = ('__name__', '__file__')
+
+class Resolver:
+    # bound_names : names bound by the programs of a run, shared with the modules it imports and the scripts it runs.
+    # Scoping is dynamic : a name bound anywhere can be read from any function called while it is bound,
+    # a name bound nowhere can only come from the global symbol table (builtins, imported modules).
+    # A program resolved later in the run may still bind it : reads of SCOPE_GLOBAL names look at the set again when they run
+    def __init__(self, bound_names : set = None) -> None:
+        # id of each FuncDefNode -> {local name : slot index}
+        self.slots = {}
+        self.bound_names = bound_names if bound_names != None else set(PROGRAM_NAMES)
+
+    def resolve(self, node) -> Resolver:
+        self.visit(node, None)
+        return self
+
+    def slot_indexes(self, node : FuncDefNode) -> dict:
+        return self.slots[id(node)]
+
+    def scope_of(self, name : str, slot_indexes : dict = None) -> str:
+        if slot_indexes != None and name in slot_indexes:
+            return SCOPE_LOCAL
+        if name not in self.bound_names:
+            return SCOPE_GLOBAL
+        return SCOPE_NAME
+
+    def bind(self, name : str, slot_indexes : dict) -> None:
+        self.bound_names.add(name)
+        if slot_indexes != None and name not in slot_indexes:
+            slot_indexes[name] = len(slot_indexes)
+
+    # slot_indexes is None at the top level of a program, its variables stay in its symbol table
+    def visit(self, node, slot_indexes : dict) -> None:
+        method_name = f'visit_{type(node).__name__}'
+        method = getattr(self, method_name, self.no_visit_method)
+        method(node, slot_indexes)
+
+    def no_visit_method(self, node, slot_indexes : dict) -> None:
+        # Numbers, strings, imports, break and continue bind nothing
+        pass
+
+    ######
+
+    def visit_ListNode(self, node : ListNode, slot_indexes : dict) -> None:
+        for element_node in node.elements_nodes:
+            self.visit(element_node, slot_indexes)
+
+    def visit_InterpolatedStringNode(self, node : InterpolatedStringNode, slot_indexes : dict) -> None:
+        for expression_node in node.expression_nodes:
+            if not isinstance(expression_node, Error): self.visit(expression_node, slot_indexes)
+
+    def visit_BinOpNode(self, node : BinOpNode, slot_indexes : dict) -> None:
+        self.visit(node.left_node, slot_indexes)
+        self.visit(node.right_node, slot_indexes)
+
+    def visit_UnaryOpNode(self, node : UnaryOpNode, slot_indexes : dict) -> None:
+        self.visit(node.node, slot_indexes)
+
+    def visit_VarAccessNode(self, node : VarAccessNode, slot_indexes : dict) -> None:
+        for ope in node.slice_or_getter or []:
+            if ope != None: self.visit(ope, slot_indexes)
+
+    def visit_VarAssignNode(self, node : VarAssignNode, slot_indexes : dict) -> None:
+        self.bind(node.var_name_token.value, slot_indexes)
+        self.visit(node.value_node, slot_indexes)
+
+    def visit_IfNode(self, node : IfNode, slot_indexes : dict) -> None:
+        for condition, expression in node.cases:
+            self.visit(condition, slot_indexes)
+            self.visit(expression, slot_indexes)
+        if node.else_case: self.visit(node.else_case, slot_indexes)
+
+    def visit_ForNode(self, node : ForNode, slot_indexes : dict) -> None:
+        self.bind(node.var_name_token.value, slot_indexes)
+        self.visit(node.start_value_node, slot_indexes)
+        self.visit(node.end_value_node, slot_indexes)
+        if node.step_value_node: self.visit(node.step_value_node, slot_indexes)
+        self.visit(node.body_node, slot_indexes)
+
+    def visit_ForInNode(self, node : ForInNode, slot_indexes : dict) -> None:
+        self.bind(node.var_name_token.value, slot_indexes)
+        self.visit(node.iterated_value_node, slot_indexes)
+        self.visit(node.body_node, slot_indexes)
+
+    def visit_WhileNode(self, node : WhileNode, slot_indexes : dict) -> None:
+        self.visit(node.condition_node, slot_indexes)
+        self.visit(node.body_node, slot_indexes)
+
+    def visit_FuncDefNode(self, node : FuncDefNode, slot_indexes : dict) -> None:
+        if node.var_name_token: self.bind(node.var_name_token.value, slot_indexes)
+
+        function_slots = {}
+        for arg_name_token, default_node in node.arg_name_tokens.items():
+            self.bind(arg_name_token.value, function_slots)
+            # Default values are computed where the function is defined
+            if default_node != Boolean.null: self.visit(default_node, slot_indexes)
+
+        self.slots[id(node)] = function_slots
+        self.visit(node.body_node, function_slots)
+
+    def visit_CallNode(self, node : CallNode, slot_indexes : dict) -> None:
+        self.visit(node.name_node, slot_indexes)
+        for key, arg_node in node.args_nodes.items():
+            if key == Boolean.null:
+                for positional_node in arg_node:
+                    self.visit(positional_node, slot_indexes)
+            else:
+                self.visit(arg_node, slot_indexes)
+
+    def visit_ReturnNode(self, node : ReturnNode, slot_indexes : dict) -> None:
+        if node.return_node: self.visit(node.return_node, slot_indexes)
+
+    def visit_YieldNode(self, node : YieldNode, slot_indexes : dict) -> None:
+        if node.yield_node: self.visit(node.yield_node, slot_indexes)
+
+class VarObserver(Resolver):
+    # Visits a loop body to find whether it may read or bind a name.
+    # A call may read it through the callers, an import, a yield or a for in pulling from a generator
+    # may run code that does, a return leaves the loop before it ends.
+    def __init__(self, name : str) -> None:
+        super().__init__()
+        self.name = name
+        self.observed = False
+
+    def observes(self, node) -> bool:
+        self.visit(node, None)
+        return self.observed
+
+    def bind(self, name : str, slot_indexes : dict) -> None:
+        if name == self.name: self.observed = True
+
+    def visit_VarAccessNode(self, node : VarAccessNode, slot_indexes : dict) -> None:
+        if node.var_name_token.value == self.name: self.observed = True
+        super().visit_VarAccessNode(node, slot_indexes)
+
+    def visit_CallNode(self, node : CallNode, slot_indexes : dict) -> None:
+        self.observed = True
+
+    def visit_ForInNode(self, node : ForInNode, slot_indexes : dict) -> None:
+        self.observed = True
+
+    def visit_ImportNode(self, node : ImportNode, slot_indexes : dict) -> None:
+        self.observed = True
+
+    def visit_ReturnNode(self, node : ReturnNode, slot_indexes : dict) -> None:
+        self.observed = True
+
+    def visit_YieldNode(self, node : YieldNode, slot_indexes : dict) -> None:
+        self.observed = True
+
+# A for loop whose body can't see its variable only binds its last value, when the loop ends or breaks
+def var_observed(node : ForNode) -> bool:
+    if node.var_observed is None:
+        node.var_observed = VarObserver(node.var_name_token.value).observes(node.body_node)
+    return node.var_observed
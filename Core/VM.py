@@ -0,0 +1,432 @@
+from __future__ import annotations
+
+from Core.Constants import *
+from Core.Compiler import *
+
+from Errors.RunTimeError import RTError
+
+from Utils.CallPool import call_pool
+from Utils.Context import Context
+from Utils.Frame import tail_scope
+from Utils.Signature import Signature
+from Utils.Position import Position
+from Utils.RTResult import RTResult
+
+from Values.BaseFunction import BaseFunction
+from Values.Number import Number
+from Values.String import String, interpolated
+from Values.List import List
+from Values.Iterator import Iterator
+from Values.Generator import Generator
+from Values.Value import Value
+
+#################
+# ! FUNCTIONS ! #
+#################
+
+class CompiledFunction(BaseFunction):
+    def __init__(self, name : str, code : Code, arg_names : dict, auto_return : bool, signature : Signature = None) -> None:
+        super().__init__(name)
+        self.code = code
+        self.auto_return = auto_return
+        self.slot_indexes = code.slot_indexes
+        self.set_args(arg_names, signature)
+
+    def run_call(self, exec_context : Context) -> RTResult:
+        # The code of a generator runs as its values are pulled
+        if self.code.is_generator:
+            return RTResult().success(Generator(self.name, VM().suspend(self.code, exec_context), exec_context))
+
+        return VM().run(self.code, exec_context)
+
+    def copy(self) -> CompiledFunction:
+        return CompiledFunction(self.name, self.code, self.arg_names, self.auto_return, self.signature)
+
+    def __repr__(self) -> str:
+        return f'<function {self.name}>'
+
+class LoopBlock:
+    # counter drives a for loop, i is its last value and target where it's bound when the loop ends,
+    # iterator and iterated_value drive a for-in loop. jumps : (loop start, body start, loop end) of the loop
+    __slots__ = ('elements', 'depth', 'jumps', 'iterator', 'iterated_value', 'counter', 'i', 'target')
+
+    def __init__(self, depth : int, jumps : tuple) -> None:
+        self.elements = []
+        self.depth = depth
+        self.jumps = jumps
+        self.i = None
+        self.target = None
+
+##########
+# ! VM ! #
+##########
+
+class VM:
+    # Interpreter run for the nodes the Compiler does not lower (imports, string interpolation), set by PyLang
+    fallback = None
+    # Nested calls allowed when the budget sets no max_depth.
+    # A call of a compiled function runs in the same loop, its caller's state is kept on a list instead of the python stack
+    max_depth = 100000
+
+    # Runs the code of a generator, its python generator stops at each yield with the value.
+    # The loop returns at a yield and keeps where it stopped in suspended, the next run picks the code up from there
+    def suspend(self, code : Code, context : Context):
+        resumed = None
+        while True:
+            self.suspended = None
+            result = self.run(code, context, resumed)
+            resumed = self.suspended
+            if resumed is None: return result
+            yield result.value
+
+    # resumed : (pc, stack, blocks) of the generator code stopped at a yield
+    def run(self, code : Code, context : Context, resumed : tuple = None) -> RTResult:
+        instructions = code.instructions
+        constants = code.constants
+        names = code.names
+        symbol_table = context.symbol_table
+        # Slots of a function call, the symbols of the program otherwise
+        slots = symbol_table.values if code.is_function else None
+        global_symbols = symbol_table.root.symbols
+        budget = context.budget
+        max_depth = budget.max_depth if budget and budget.max_depth != None else self.max_depth
+        pc, stack, blocks = resumed or (0, [], [])
+        push = stack.append
+        pop = stack.pop
+        # (code, pc, stack, blocks, context, escapes) of the callers suspended by the calls running in this loop
+        frames = []
+        # call_pool.escapes when the running call started, its context goes back to the pool if it didn't change
+        escapes = None
+
+        while True:
+            opcode, arg = instructions[pc]
+            pc += 1
+
+            if opcode == OP_LOAD_FAST:
+                value = slots[arg]
+                if value == None:
+                    # Not assigned yet, a caller may have it
+                    value = symbol_table.get(code.slot_names[arg])
+                    if not value:
+                        return self.failure(code, pc, f"'{code.slot_names[arg]}' is not defined", context)
+                push(value)
+
+            elif opcode == OP_LOAD_VAR:
+                value = symbol_table.get(names[arg])
+                if not value:
+                    return self.failure(code, pc, f"'{names[arg]}' is not defined", context)
+                push(value)
+
+            elif opcode == OP_LOAD_GLOBAL:
+                value = global_symbols.get(names[arg]) if names[arg] not in code.bound_names else None
+                if value == None:
+                    value = symbol_table.get(names[arg])
+                    if not value:
+                        return self.failure(code, pc, f"'{names[arg]}' is not defined", context)
+                push(value)
+
+            elif opcode == OP_LOAD_NUMBER:
+                push(Number.of(constants[arg]))
+
+            elif opcode == OP_BINARY_OP:
+                right = pop()
+                left = pop()
+                method_name, operation, value_class = arg
+                if left.__class__ is Number and right.__class__ is Number:
+                    try:
+                        push(value_class.of(operation(left.value, right.value)))
+                        continue
+                    except ZeroDivisionError:
+                        pass
+                value, error = getattr(left, method_name)(right)
+                if error: return self.operation_failure(code, pc, method_name, [left, right], context)
+                push(value)
+
+            elif opcode == OP_STORE_FAST:
+                slots[arg] = stack[-1]
+
+            elif opcode == OP_STORE_VAR:
+                symbol_table.set(names[arg], stack[-1])
+
+            elif opcode == OP_POP_JUMP_IF_FALSE:
+                if not pop().is_true():
+                    pc = arg
+
+            elif opcode == OP_JUMP:
+                pc = arg
+
+            elif opcode == OP_JUMP_IF_DECIDED:
+                value = decided_value(arg[0], stack[-1])
+                if value is not None:
+                    stack[-1] = value
+                    pc = arg[1]
+
+            elif opcode == OP_LOOP_APPEND:
+                blocks[-1].elements.append(pop())
+
+            elif opcode == OP_FOR_ITER:
+                block = blocks[-1]
+                i = next(block.counter, None)
+                if i is None:
+                    pc = arg[1]
+                    continue
+                block.i = i
+                if arg[3]:
+                    if arg[2]: slots[arg[0]] = Number.of(i)
+                    else: symbol_table.set(names[arg[0]], Number.of(i))
+                if budget:
+                    error = budget.tick()
+                    if error: return self.failure(code, pc, error, context)
+
+            elif opcode == OP_FORIN_ITER:
+                block = blocks[-1]
+                try:
+                    element = next(block.iterator)
+                except StopIteration:
+                    # A generator that failed stops the loop with its error
+                    if isinstance(block.iterated_value, Iterator):
+                        error = block.iterated_value.take_error()
+                        if error: return RTResult().failure(error)
+                    pc = arg[1]
+                    continue
+                if arg[2]: slots[arg[0]] = element
+                else: symbol_table.set(names[arg[0]], element)
+                if budget:
+                    error = budget.tick()
+                    if error: return self.failure(code, pc, error, context)
+
+            elif opcode == OP_LOOP_TICK:
+                if budget:
+                    error = budget.tick()
+                    if error: return self.failure(code, pc, error, context)
+
+            elif opcode == OP_CALL or opcode == OP_TAIL_CALL:
+                args_start = len(stack) - arg.args_count
+                values = stack[args_start:]
+                del stack[args_start:]
+
+                pos_start, pos_end = code.positions[pc - 1]
+                func = pop()
+                if func.__class__ is not CompiledFunction or func.code.is_generator:
+                    result = func.call(values, arg, context, pos_start, pos_end)
+                    if result.should_return():
+                        if result.error: return result
+                        state = self.take_loop_signal(result.loop_break, code, pc, stack, blocks, context, escapes, frames)
+                        if state.__class__ is RTResult: return state
+                        code, pc, stack, blocks, context, escapes = state
+                        instructions, constants, names = code.instructions, code.constants, code.names
+                        symbol_table = context.symbol_table
+                        slots = symbol_table.values if code.is_function else None
+                        push, pop = stack.append, stack.pop
+                        continue
+                    push(result.value)
+                    continue
+
+                plan = arg.plan_for(func.signature)
+                # check_args tells what is wrong with the call
+                if plan is None: return func.execute(func.args_of(values, arg), context, pos_start, pos_end)
+
+                call_escapes = call_pool.escapes
+                exec_context = func.generate_new_context(context, pos_start, pos_end, func.slot_indexes)
+                if budget:
+                    result = func.check_budget(exec_context)
+                    if result.error: return result
+                func.bind_args(plan, values, exec_context)
+                if exec_context.depth > max_depth:
+                    return self.failure(code, pc, f"Call depth limit reached ({max_depth} calls)", context)
+
+                if opcode == OP_TAIL_CALL:
+                    # The running function only returns what the call gives, the call takes its place
+                    exec_context.parent = context.parent
+                    exec_context.parent_entry_pos, exec_context.parent_entry_end = context.parent_entry_pos, context.parent_entry_end
+                    exec_context.depth = context.depth
+                    exec_context.symbol_table.parent = tail_scope(symbol_table)
+                else:
+                    frames.append((code, pc, stack, blocks, context, escapes))
+                    escapes = call_escapes
+                code, context, stack, blocks, pc = func.code, exec_context, [], [], 0
+                instructions, constants, names = code.instructions, code.constants, code.names
+                symbol_table = context.symbol_table
+                slots = symbol_table.values
+                push, pop = stack.append, stack.pop
+
+            elif opcode == OP_RETURN_VALUE:
+                value = pop()
+                if code.is_function and value is None:
+                    value = Boolean.null
+                if not frames: return RTResult().success(value)
+
+                if call_pool.escapes == escapes: call_pool.release(context)
+                code, pc, stack, blocks, context, escapes = frames.pop()
+                instructions, constants, names = code.instructions, code.constants, code.names
+                symbol_table = context.symbol_table
+                slots = symbol_table.values if code.is_function else None
+                push, pop = stack.append, stack.pop
+                push(value)
+
+            elif opcode == OP_POP_TOP:
+                pop()
+
+            elif opcode == OP_LOAD_STRING:
+                push(String(constants[arg]))
+
+            elif opcode == OP_LOAD_OBJECT:
+                push(constants[arg])
+
+            elif opcode == OP_BUILD_LIST:
+                elements = stack[len(stack) - arg:]
+                del stack[len(stack) - arg:]
+                push(List(elements))
+
+            elif opcode == OP_BUILD_STRING:
+                texts = constants[arg]
+                values = stack[len(stack) - len(texts) + 1:]
+                del stack[len(stack) - len(texts) + 1:]
+                push(String(interpolated(texts, values)))
+
+            elif opcode == OP_GET_INDEX:
+                index = pop()
+                iterable = pop()
+                value, error = iterable.get(index)
+                if error: return self.operation_failure(code, pc, 'get', [iterable, index], context)
+                push(value)
+
+            elif opcode == OP_GET_SLICE:
+                end = pop() if arg & 2 else None
+                start = pop() if arg & 1 else None
+                iterable = pop()
+                value, error = iterable.get_slice(start, end)
+                if error: return self.operation_failure(code, pc, 'get_slice', [iterable, start, end], context)
+                push(value)
+
+            elif opcode == OP_UNARY_MINUS:
+                operand = pop()
+                value, error = operand.multiply(Number.of(-1))
+                if error: return self.operation_failure(code, pc, 'multiply', [operand, Number.of(-1)], context)
+                push(value)
+
+            elif opcode == OP_UNARY_NOT:
+                operand = pop()
+                value, error = operand.not_comp()
+                if error: return self.operation_failure(code, pc, 'not_comp', [operand], context)
+                push(value)
+
+            elif opcode == OP_LOOP_SETUP:
+                blocks.append(LoopBlock(len(stack), arg))
+
+            elif opcode == OP_FOR_SETUP:
+                step_value = pop() if arg[0] else None
+                end_value = pop()
+                start_value = pop()
+                if step_value is None:
+                    step_value = Number(1 if start_value.value < end_value.value else -1)
+
+                block = LoopBlock(len(stack), arg[2])
+                block.counter = iter(loop_range(start_value.value, end_value.value, step_value.value))
+                block.target = arg[1]
+                blocks.append(block)
+
+            elif opcode == OP_FORIN_SETUP:
+                iterated_value = pop()
+                iterator = iterated_value.iterate() if isinstance(iterated_value, Value) else None
+                if iterator is None:
+                    return self.failure(code, pc, f"Can't iterate over {iterated_value}", context)
+
+                block = LoopBlock(len(stack), arg)
+                block.iterator = iterator
+                block.iterated_value = iterated_value
+                blocks.append(block)
+
+            elif opcode == OP_LOOP_END:
+                block = blocks.pop()
+                if block.target and block.i is not None:
+                    index, is_slot = block.target
+                    if is_slot: slots[index] = Number.of(block.i)
+                    else: symbol_table.set(names[index], Number.of(block.i))
+                if arg:
+                    push(Boolean.null)
+                    continue
+                push(List(block.elements))
+
+            elif opcode == OP_BREAK_LOOP:
+                del stack[blocks[-1].depth:]
+                pc = arg
+
+            elif opcode == OP_CONTINUE_LOOP:
+                del stack[blocks[-1].depth:]
+                pc = arg
+
+            elif opcode == OP_LOOP_SIGNAL:
+                state = self.take_loop_signal(arg, code, pc, stack, blocks, context, escapes, frames)
+                if state.__class__ is RTResult: return state
+                code, pc, stack, blocks, context, escapes = state
+                instructions, constants, names = code.instructions, code.constants, code.names
+                symbol_table = context.symbol_table
+                slots = symbol_table.values if code.is_function else None
+                push, pop = stack.append, stack.pop
+
+            elif opcode == OP_MAKE_FUNCTION:
+                template : FunctionTemplate = constants[arg]
+                arg_names = {}
+                defaults_start = len(stack) - sum(template.has_defaults)
+                defaults = iter(stack[defaults_start:])
+                del stack[defaults_start:]
+
+                for arg_name, has_default in zip(template.arg_names, template.has_defaults):
+                    arg_names[arg_name] = next(defaults) if has_default else None
+
+                func_value = CompiledFunction(template.name, template.code, arg_names, template.auto_return, template.signature)
+                if template.name:
+                    symbol_table.set(template.name, func_value)
+                push(func_value)
+
+            elif opcode == OP_YIELD_VALUE:
+                # Only run by the code of a generator, which no call of this loop runs : it is the code the loop started with
+                value = pop()
+                if value is None: value = Boolean.null
+                push(Boolean.null)
+                self.suspended = (pc, stack, blocks)
+                return RTResult().success(value)
+
+            elif opcode == OP_FALLBACK:
+                result = self.fallback.visit(constants[arg], context)
+                if result.should_return():
+                    if result.error: return result
+                    state = self.take_loop_signal(result.loop_break, code, pc, stack, blocks, context, escapes, frames)
+                    if state.__class__ is RTResult: return state
+                    code, pc, stack, blocks, context, escapes = state
+                    instructions, constants, names = code.instructions, code.constants, code.names
+                    symbol_table = context.symbol_table
+                    slots = symbol_table.values if code.is_function else None
+                    push, pop = stack.append, stack.pop
+                    continue
+                push(result.value)
+
+            else:
+                raise Exception(f'No {OPCODE_NAMES[opcode]} opcode defined')
+
+    # A break or continue passed up from the call before pc, or run outside of the loops of its code, as the Interpreter passes it :
+    # the innermost loop whose body runs it takes it, else the caller of the running code.
+    # Returns (code, pc, stack, blocks, context, escapes) of the code going on, or the result of the run when it leaves this loop
+    def take_loop_signal(self, is_break : bool, code : Code, pc : int, stack : list, blocks : list, context : Context, escapes : int, frames : list):
+        while True:
+            for index in range(len(blocks) - 1, -1, -1):
+                loop_start, body_start, loop_end = blocks[index].jumps
+                if pc > body_start:
+                    del stack[blocks[index].depth:]
+                    del blocks[index + 1:]
+                    return code, loop_end if is_break else loop_start, stack, blocks, context, escapes
+
+            # Outside of any loop, the program stops
+            if not code.is_function: return RTResult().success(None)
+            if not frames: return RTResult().success_break() if is_break else RTResult().success_continue()
+
+            if call_pool.escapes == escapes: call_pool.release(context)
+            code, pc, stack, blocks, context, escapes = frames.pop()
+
+    def failure(self, code : Code, pc : int, details : str, context : Context) -> RTResult:
+        pos_start, pos_end = code.positions[pc - 1]
+        return RTResult().failure(RTError(pos_start, pos_end, details, context))
+
+    def operation_failure(self, code : Code, pc : int, method_name : str, operands : list, context : Context) -> RTResult:
+        return RTResult().failure(Value.locate_error(method_name, operands, code.operand_positions[pc - 1], context))
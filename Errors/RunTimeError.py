@@ -15,13 +15,32 @@ class RTError(Error):
         return result
 
     def generate_traceback(self) -> str:
-        result = ''
+        lines = []
         pos = self.pos_start
         context = self.context
 
         while context:
-            result = f'  File {pos.file_name}, line {str(pos.line + 1)}, in {context.display_name}\n' + result
+            lines.append(f'  File {pos.file_name}, line {str(pos.line + 1)}, in {context.display_name}\n')
             pos = context.parent_entry_pos
             context = context.parent
-        
-        return 'Traceback (most recent call last):\n' + result
\ No newline at end of file
+
+        # A deep recursion shows its first calls of a line, as python does
+        result = ''
+        previous, count = None, 0
+        for line in reversed(lines):
+            if line == previous:
+                count += 1
+                if count > TRACEBACK_REPEATS: continue
+            else:
+                result += repeated_lines(count)
+                previous, count = line, 1
+            result += line
+        result += repeated_lines(count)
+
+        return 'Traceback (most recent call last):\n' + result
+
+TRACEBACK_REPEATS = 3
+
+def repeated_lines(count : int) -> str:
+    if count <= TRACEBACK_REPEATS: return ''
+    return f'  [Previous line repeated {count - TRACEBACK_REPEATS} more times]\n'
@@ -1,4 +1,5 @@
 from Nodes.BinOp import BinOpNode
+from Utils.Signature import CallSite
 
 
 class CallNode:
@@ -7,11 +8,21 @@ class CallNode:
         self.args_nodes = args_nodes
 
         self.pos_start = name_node.pos_start
+        self.pos_end = name_node.pos_end
 
-        if len(args_nodes) > 0:
-            self.pos_end = args_nodes.values()[-1].pos_end
-        else:
-            self.pos_end = name_node.pos_end
+        # Positional args are stored as a list, keyword args as single nodes
+        positional_count = 0
+        keyword_names = []
+        for key, arg_node in args_nodes.items():
+            if isinstance(arg_node, list):
+                if len(arg_node) > 0: self.pos_end = arg_node[-1].pos_end
+                positional_count = len(arg_node)
+            else:
+                self.pos_end = arg_node.pos_end
+                keyword_names.append(key.var_name_token.value)
+
+        # The values of a call are its positional args then its keyword args, bound with the plan the site keeps
+        self.call_site = CallSite(positional_count, keyword_names)
     
     def __repr__(self) -> str:
-        return f"{self.name_node}({''.join([str(e) + ', ' if index != len(self.args_nodes) - 1 else str(e) for index ,e in enumerate(self.args_nodes.items())])})"
\ No newline at end of file
+        return f"{self.name_node}({''.join([str(e) + ', ' if index != len(self.args_nodes) - 1 else str(e) for index ,e in enumerate(self.args_nodes.items())])})"
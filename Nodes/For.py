@@ -9,6 +9,13 @@ class ForNode:
         self.step_value_node = step_value_node
         self.body_node = body_node
 
+        # Set by the Parser when the value of the loop is never read
+        self.is_statement = False
+        # Set by the Parser when a yield of the generator is in it
+        self.suspends = False
+        # Whether the body may read or bind the loop's variable, found by var_observed the first time the loop runs
+        self.var_observed = None
+
         self.pos_start = var_name_token.pos_start
         self.pos_end = body_node.pos_end
     
@@ -6,6 +6,11 @@ class ForInNode:
         self.iterated_value_node = iterated_value
         self.body_node = body_node
 
+        # Set by the Parser when the value of the loop is never read
+        self.is_statement = False
+        # Set by the Parser when a yield of the generator is in it
+        self.suspends = False
+
         self.pos_start = var_name_token.pos_start
         self.pos_end = body_node.pos_end
     
@@ -3,11 +3,13 @@ from Utils.Token import Token
 
 
 class FuncDefNode:
-    def __init__(self, var_name_token : Token, arg_name_tokens : dict, body_node : BinOpNode, auto_return) -> None:
+    def __init__(self, var_name_token : Token, arg_name_tokens : dict, body_node : BinOpNode, auto_return, is_generator : bool = False) -> None:
         self.var_name_token = var_name_token
         self.arg_name_tokens = arg_name_tokens
         self.body_node = body_node
         self.auto_return = auto_return
+        # Calling a function with a yield in its body returns a generator
+        self.is_generator = is_generator
 
         if var_name_token:
             self.pos_start = var_name_token.pos_start
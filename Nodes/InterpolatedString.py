@@ -0,0 +1,16 @@
+from Utils.Token import Token
+
+
+class InterpolatedStringNode:
+    # "text {expr} text" : the texts around the expressions, and the statements of each expression, parsed once.
+    # An expression that couldn't be lexed or parsed is kept as its error, raised when the string is run
+    def __init__(self, token : Token, texts : list[str], expression_nodes : list) -> None:
+        self.token = token
+        self.texts = texts
+        self.expression_nodes = expression_nodes
+
+        self.pos_start = self.token.pos_start
+        self.pos_end = self.token.pos_end
+    
+    def __repr__(self) -> str:
+        return f'"{self.token.value}"'
@@ -1,6 +1,8 @@
 class ListNode:
     def __init__(self, elements_nodes, pos_start, pos_end) -> None:
         self.elements_nodes = elements_nodes
+        # Set by the Parser when a yield of the generator is in it
+        self.suspends = False
 
         self.pos_start = pos_start
         self.pos_end = pos_end
@@ -0,0 +1,14 @@
+from Utils.Token import Token
+from Utils.Position import Position
+
+
+class YieldNode:
+    def __init__(self, yield_node, pos_start : Position, pos_end : Position) -> None:
+        self.yield_node = yield_node
+        # The generator stops here
+        self.suspends = True
+        self.pos_start = pos_start
+        self.pos_end = pos_end
+    
+    def __repr__(self) -> str:
+        return f'yield {self.yield_node}'
\ No newline at end of file
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
-import math
+import gc
 from sys import argv
 from os import listdir, remove
 from os import path
 
-from Values.Number import Number
-from Values.String import String
+from Values.Number import Number, NUMBER_OPERATIONS
+from Values.String import String, interpolated
 from Values.List import List
+from Values.Range import Range
+from Values.Iterator import Iterator
+from Values.Generator import Generator
 from Values.BaseFunction import BaseFunction
 from Values.Value import Value
 from Values.Boolean import Boolean
@@ -16,6 +19,7 @@ from Nodes.BinOp import BinOpNode
 from Nodes.UnaryOp import UnaryOpNode
 from Nodes.Number import NumberNode
 from Nodes.String import StringNode
+from Nodes.InterpolatedString import InterpolatedStringNode
 from Nodes.List import ListNode
 from Nodes.VarAccess import VarAccessNode
 from Nodes.If import IfNode
@@ -26,22 +30,31 @@ from Nodes.FuncDef import FuncDefNode
 from Nodes.Call import CallNode
 from Nodes.While import WhileNode
 from Nodes.Return import ReturnNode
+from Nodes.Yield import YieldNode
 from Nodes.Break import BreakNode
 from Nodes.Continue import ContinueNode
 from Nodes.Import import ImportNode
 
 from Utils.Context import Context
 from Utils.Token import Token
+from Utils.Position import Position
 from Utils.RTResult import RTResult
+from Utils.Signals import RunFailure, ReturnSignal, BreakSignal, ContinueSignal, result_of, result_of_suspended, value_of
 from Utils.SymbolTable import SymbolTable
+from Utils.Signature import Signature
+from Utils.ModuleTable import ModuleTable
+from Utils.Budget import Budget
 
 from Errors.RunTimeError import RTError
 from Errors.Error import Error
 
 
 from Core.Constants import *
-from Core.Lexer import Lexer
-from Core.Parser import Parser
+from Core.Compiler import Compiler, BINARY_METHODS, SHORT_CIRCUIT_TYPES, decided_value, loop_range
+from Core.Resolver import Resolver, SCOPE_LOCAL, SCOPE_GLOBAL, PROGRAM_NAMES, var_observed
+from Core.Folder import Folder
+from Core.Cache import load_ast, save_ast, load_memory_ast, save_memory_ast
+from Core.VM import VM
 
 #################
 # ! FUNCTIONS ! #
@@ -49,30 +62,18 @@ from Core.Parser import Parser
 class BuiltInFunction(BaseFunction):
     def __init__(self, name : Token) -> None:
         super().__init__(name)
+        self.method = getattr(self, f'execute_{self.name}', self.no_visit_method)
+        self.set_args(self.method.arg_names)
 
-    def execute(self, args : list[Token]) -> RTResult:
-        result = RTResult()
-        exec_context = self.generate_new_context()
-
-        method_name = f'execute_{self.name}'
-        method = getattr(self, method_name, self.no_visit_method)
-
-        result.register(self.check_populate_args(method.arg_names, args, exec_context))
-        if result.error: return result
+    def run_call(self, exec_context : Context) -> RTResult:
+        return self.method(exec_context)
 
-        return_value = result.register(method(exec_context))
-        if result.error: return result
-
-        return result.success(return_value)
-
-    def no_visit_method(self) -> Exception:
+    def no_visit_method(self, exec_context : Context) -> Exception:
         raise Exception(f'No execute_{self.name} method defined')
+    no_visit_method.arg_names = {}
     
     def copy(self) -> BuiltInFunction:
-        copy = BuiltInFunction(self.name)
-        copy.set_context(self.context)
-        copy.set_pos(self.pos_start, self.pos_end)
-        return copy
+        return BuiltInFunction(self.name)
     
     def __repr__(self) -> str:
         return f'<built-in function {self.name}> '
@@ -94,7 +95,7 @@ class BuiltInFunction(BaseFunction):
             text = str(exec_context.symbol_table.get('value').value)
         except ValueError:
             return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
+                exec_context.parent_entry_pos, exec_context.parent_entry_end,
                 f"Cannot convert {exec_context.symbol_table.get('value').type} to STR",
                 exec_context
             ))
@@ -106,7 +107,7 @@ class BuiltInFunction(BaseFunction):
             number = int(exec_context.symbol_table.get('value').value)
         except ValueError:
             return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
+                exec_context.parent_entry_pos, exec_context.parent_entry_end,
                 f"Cannot convert {exec_context.symbol_table.get('value').type} to INT",
                 exec_context
             ))
@@ -118,7 +119,7 @@ class BuiltInFunction(BaseFunction):
             number = float(exec_context.symbol_table.get('value').value)
         except ValueError:
             return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
+                exec_context.parent_entry_pos, exec_context.parent_entry_end,
                 f"Cannot convert {exec_context.symbol_table.get('value').type} to FLOAT",
                 exec_context
             ))
@@ -141,7 +142,7 @@ class BuiltInFunction(BaseFunction):
 
         if not isinstance(list, List):
             return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
+                exec_context.parent_entry_pos, exec_context.parent_entry_end,
                 "First argument must be a LIST",
                 exec_context
             ))
@@ -157,14 +158,14 @@ class BuiltInFunction(BaseFunction):
 
         if not isinstance(list, List):
             return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
+                exec_context.parent_entry_pos, exec_context.parent_entry_end,
                 "First argument must be LIST",
                 exec_context
             ))
         
         if not isinstance(value, Number):
             return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
+                exec_context.parent_entry_pos, exec_context.parent_entry_end,
                 "Second argument must be INT",
                 exec_context
             ))
@@ -173,7 +174,7 @@ class BuiltInFunction(BaseFunction):
             return_value = list.elements.pop(value.value)
         except:
             return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
+                exec_context.parent_entry_pos, exec_context.parent_entry_end,
                 "Element at this index could not be removed from list because index is out of range",
                 exec_context
             ))
@@ -188,14 +189,14 @@ class BuiltInFunction(BaseFunction):
 
         if not isinstance(list1, List):
             return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
+                exec_context.parent_entry_pos, exec_context.parent_entry_end,
                 "First argument must be LIST",
                 exec_context
             ))
         
         if not isinstance(list2, List):
             return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
+                exec_context.parent_entry_pos, exec_context.parent_entry_end,
                 "Second argument must be LIST",
                 exec_context
             ))
@@ -210,16 +211,17 @@ class BuiltInFunction(BaseFunction):
 
         if not isinstance(value, Number):
             return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
+                exec_context.parent_entry_pos, exec_context.parent_entry_end,
                 "First argument must be INT or FLOAT",
                 exec_context
             ))
 
+        import math
         try:
             return_value = math.sqrt(value.value)
         except:
             return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
+                exec_context.parent_entry_pos, exec_context.parent_entry_end,
                 "Math domain error: positive number expected",
                 exec_context
             ))
@@ -231,7 +233,7 @@ class BuiltInFunction(BaseFunction):
         value = exec_context.symbol_table.get('value')
 
         if isinstance(value, List):
-            return_value = len(value.elements)
+            return_value = value.length()
             return RTResult().success(Number(return_value))
 
         
@@ -240,7 +242,7 @@ class BuiltInFunction(BaseFunction):
             return RTResult().success(Number(return_value))
     
         return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
+                exec_context.parent_entry_pos, exec_context.parent_entry_end,
                 "Argument must be LIST or STRING",
                 exec_context
             ))
@@ -251,15 +253,15 @@ class BuiltInFunction(BaseFunction):
 
         if not isinstance(list, List):
             return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
+                exec_context.parent_entry_pos, exec_context.parent_entry_end,
                 "Argument must be LIST",
                 exec_context
             ))
         return_value = 0
-        for element in list.elements:
+        for element in list.iterate():
             if not isinstance(element, Number):
                 return RTResult().failure(RTError(
-                    self.pos_start, self.pos_end,
+                    exec_context.parent_entry_pos, exec_context.parent_entry_end,
                     "Elements of list must be INT or FLOAT",
                     exec_context
                 ))
@@ -272,14 +274,12 @@ class BuiltInFunction(BaseFunction):
 
         if not isinstance(file, String):
             return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
+                exec_context.parent_entry_pos, exec_context.parent_entry_end,
                 "Argument must be STRING",
                 exec_context
             ))
         
-        file = file.value
-        file_path = path.dirname(exec_context.symbol_table.get("__file__").value) + "/"
-        file = file_path + file.value.replace('.', '/') + '.pyl'
+        file = _module_file_name(file.value, exec_context)
 
         try:
             with open(file, "r") as f:
@@ -287,7 +287,7 @@ class BuiltInFunction(BaseFunction):
             
         except Exception as e:
             return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
+                exec_context.parent_entry_pos, exec_context.parent_entry_end,
                 f"Failed to load script \"{file}\"\n" + str(e),
                 exec_context
             ))
@@ -296,7 +296,7 @@ class BuiltInFunction(BaseFunction):
 
         if error:
             return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
+                exec_context.parent_entry_pos, exec_context.parent_entry_end,
                 f"Failed to finish executing script \"{file}\"\n" + error.as_string(),
                 exec_context
             ))
@@ -304,6 +304,56 @@ class BuiltInFunction(BaseFunction):
         return RTResult().success(Boolean.null)
     execute_run.arg_names = {"file" : None}
 
+    def execute_read_lines(self, exec_context : Context) -> RTResult:
+        file = exec_context.symbol_table.get('file')
+
+        if not isinstance(file, String):
+            return RTResult().failure(RTError(
+                exec_context.parent_entry_pos, exec_context.parent_entry_end,
+                "Argument must be STRING",
+                exec_context
+            ))
+
+        try:
+            f = open(file.value, "r")
+        except Exception as e:
+            return RTResult().failure(RTError(
+                exec_context.parent_entry_pos, exec_context.parent_entry_end,
+                f"Failed to open file \"{file.value}\"\n" + str(e),
+                exec_context
+            ))
+
+        # Lines are read as the loop pulls them
+        def lines():
+            with f:
+                for line in f:
+                    yield String(line.rstrip('\n'))
+
+        return RTResult().success(Iterator(lines()))
+    execute_read_lines.arg_names = {"file" : None}
+
+    def execute_reload(self, exec_context : Context) -> RTResult:
+        module = exec_context.symbol_table.get('module')
+
+        if not isinstance(module, String):
+            return RTResult().failure(RTError(
+                exec_context.parent_entry_pos, exec_context.parent_entry_end,
+                "Argument must be STRING",
+                exec_context
+            ))
+        
+        error = _import(_module_file_name(module.value, exec_context), reload=True)
+
+        if error:
+            return RTResult().failure(RTError(
+                exec_context.parent_entry_pos, exec_context.parent_entry_end,
+                error,
+                exec_context
+            ))
+        
+        return RTResult().success(Boolean.null)
+    execute_reload.arg_names = {"module" : None}
+
     def execute_type(self, exec_context : Context) -> RTResult:
         value = exec_context.symbol_table.get('value')
 
@@ -311,6 +361,9 @@ class BuiltInFunction(BaseFunction):
             Number : "number",
             String : "str",
             List : "list",
+            Range : "list",
+            Iterator : "iterator",
+            Generator : "iterator",
             BaseFunction : "function",
             BuiltInFunction : "function",
             Boolean.null : "null",
@@ -331,7 +384,7 @@ class BuiltInFunction(BaseFunction):
 
         if not isinstance(value, String):
             return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
+                exec_context.parent_entry_pos, exec_context.parent_entry_end,
                 "Argument must be STRING",
                 exec_context
             ))
@@ -345,7 +398,7 @@ class BuiltInFunction(BaseFunction):
 
         if not isinstance(value, String):
             return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
+                exec_context.parent_entry_pos, exec_context.parent_entry_end,
                 "Argument must be STRING",
                 exec_context
             ))
@@ -361,7 +414,7 @@ class BuiltInFunction(BaseFunction):
 
         if not isinstance(arg1, Number):
             return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
+                exec_context.parent_entry_pos, exec_context.parent_entry_end,
                 "First argument must be INT or FLOAT",
                 exec_context
             ))
@@ -372,7 +425,7 @@ class BuiltInFunction(BaseFunction):
 
         elif not isinstance(arg2, Number):
             return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
+                exec_context.parent_entry_pos, exec_context.parent_entry_end,
                 "Second argument must be INT or FLOAT",
                 exec_context
             ))
@@ -381,59 +434,54 @@ class BuiltInFunction(BaseFunction):
             step = Number(1)
         elif not isinstance(step, Number):
             return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
+                exec_context.parent_entry_pos, exec_context.parent_entry_end,
                 "Third argument must be INT or FLOAT",
                 exec_context
             ))
         
         if step.value == 0:
             return RTResult().failure(RTError(
-                self.pos_start, self.pos_end,
+                exec_context.parent_entry_pos, exec_context.parent_entry_end,
                 "Third argument cannot be 0",
                 exec_context
             ))
         
-        return_value = []
-        if step.value > 0:
-            i = arg1.value
-            while i < arg2.value:
-                return_value.append(Number(i))
-                i += step.value
-        else:
-            i = arg1.value
-            while i > arg2.value:
-                return_value.append(Number(i))
-                i += step.value
-        return RTResult().success(List(return_value))
+        return RTResult().success(Range.from_bounds(arg1.value, arg2.value, step.value))
     execute_range.arg_names = {"arg1" : None, "arg2" : Boolean.null, "step" : Boolean.null}
 
 class Function(BaseFunction):
-    def __init__(self, name : Token, body_node : BinOpNode, arg_names : dict, auto_return) -> None:
+    def __init__(self, name : Token, body_node : BinOpNode, arg_names : dict, auto_return, body = None, slot_indexes : dict = None, is_generator : bool = False, signature : Signature = None) -> None:
         super().__init__(name)
         self.body_node = body_node
-        self.arg_names = arg_names
         self.auto_return = auto_return
-
-    def execute(self, args : dict) -> RTResult:
-        result = RTResult()
-        interpreter = Interpreter()
-        exec_context = self.generate_new_context()
-
-        result.register(self.check_populate_args(self.arg_names, args, exec_context))
-        if result.should_return(): return result
+        # Compiled closure of body_node (a generator function for a generator), the body is walked by the Interpreter when missing
+        self.body = body
+        # Locals of the compiled body, {name : slot index}
+        self.slot_indexes = slot_indexes
+        self.is_generator = is_generator
+        self.set_args(arg_names, signature)
+
+    def run_call(self, exec_context : Context) -> RTResult:
+        # The body of a generator runs as its values are pulled
+        if self.is_generator:
+            body = self.body(exec_context) if self.body else self.interpreter.suspend(self.body_node, exec_context)
+            return RTResult().success(Generator(self.name, body, exec_context))
         
-        value = result.register(interpreter.visit(self.body_node, exec_context))
+        # The result of the body is only seen here, it carries the return value
+        result = self.run_body(exec_context)
         if result.should_return() and result.func_return_value == None: return result
 
-        return_value = (value if self.auto_return else None) or result.func_return_value or Boolean.null
+        return_value = (result.value if self.auto_return else None) or result.func_return_value or Boolean.null
 
         return result.success(return_value)
     
+    def run_body(self, exec_context : Context) -> RTResult:
+        if self.body:
+            return self.body(exec_context)
+        return self.interpreter.visit(self.body_node, exec_context)
+    
     def copy(self) -> Function:
-        copy = Function(self.name, self.body_node, self.arg_names, self.auto_return)
-        copy.set_context(self.context)
-        copy.set_pos(self.pos_start, self.pos_end)
-        return copy
+        return Function(self.name, self.body_node, self.arg_names, self.auto_return, self.body, self.slot_indexes, self.is_generator, self.signature)
     
     def __repr__(self) -> str:
         return f'<function {self.name}>'
@@ -454,14 +502,21 @@ BuiltInFunction.sqrt                = BuiltInFunction("sqrt")
 BuiltInFunction.len                 = BuiltInFunction("len")
 BuiltInFunction.sum                 = BuiltInFunction("sum")
 BuiltInFunction.run                 = BuiltInFunction("run")
+BuiltInFunction.reload              = BuiltInFunction("reload")
 BuiltInFunction.type                = BuiltInFunction("type")
 BuiltInFunction.upper               = BuiltInFunction("upper")
 BuiltInFunction.lower               = BuiltInFunction("lower")
 BuiltInFunction.range               = BuiltInFunction("range")
+BuiltInFunction.read_lines          = BuiltInFunction("read_lines")
 
 # Public symbol table
 global_symbol_table = SymbolTable()
+# Imported modules
+module_table = ModuleTable()
 _FileMain = True
+# Set by the runs of a program file (PyLang.py script.pyl, a request of the server) : the first _run freezes its AST.
+# Imports, run() and the lines of the shell don't, what they freeze would never be collected
+_FreezeAST = False
 
 # * Default values *
 global_symbol_table.set("null", Boolean.null)
@@ -492,13 +547,19 @@ global_symbol_table.set("sqrt", BuiltInFunction.sqrt)
 global_symbol_table.set("len", BuiltInFunction.len)
 global_symbol_table.set("sum", BuiltInFunction.sum)
 global_symbol_table.set("run", BuiltInFunction.run)
+global_symbol_table.set("reload", BuiltInFunction.reload)
 global_symbol_table.set("type", BuiltInFunction.type)
 global_symbol_table.set("upper", BuiltInFunction.upper)
 global_symbol_table.set("lower", BuiltInFunction.lower)
 global_symbol_table.set("println", BuiltInFunction.println)
 global_symbol_table.set("range", BuiltInFunction.range)
+global_symbol_table.set("read_lines", BuiltInFunction.read_lines)
 
 
+# Calls of the tree, closure and exception engines nest python calls, the VM runs them in its own loop
+def recursion_error(pos_start : Position, pos_end : Position, context : Context) -> RTError:
+    return RTError(pos_start, pos_end, "Python recursion limit reached, run with -vm for deeper calls", context)
+
 ###################
 # ! INTERPRETER ! #
 ###################
@@ -514,38 +575,37 @@ class Interpreter:
     ######
 
     def visit_NumberNode(self, node : NumberNode, context : Context) -> RTResult:
-        return RTResult().success(
-            Number(node.token.value).set_context(context).set_pos(node.pos_start, node.pos_end)
-        )
+        return RTResult().success(Number.of(node.token.value))
     
     def visit_StringNode(self, node : StringNode, context : Context) -> RTResult:
-        # If {expr} is in string, replace it with the value of the expression
-        if '{' and '}' in node.token.value:
-            result = RTResult()
-
-            string = node.token.value
-
-            while '{' and '}' in string:
-                expr = string[string.find('{') + 1 : string.find('}')]
+        return RTResult().success(String(node.token.value))
 
-                tokens, error = Lexer(context.display_name, expr).make_tokens()
-                if error: return result.failure(error)
+    def visit_InterpolatedStringNode(self, node : InterpolatedStringNode, context : Context) -> RTResult:
+        result = RTResult()
+        values = []
 
-                ast = Parser(tokens).parse()
-                if ast.error: return result.failure(ast.error)
+        for expression_node in node.expression_nodes:
+            if isinstance(expression_node, Error): return result.failure(expression_node)
 
-                value = result.register(self.visit(ast.node, context))
+            # The value of the first statement is put in the string, the others are only run
+            for index, statement_node in enumerate(expression_node.elements_nodes):
+                value = result.register(self.visit(statement_node, context))
                 if result.should_return(): return result
+                if index == 0: values.append(value)
 
-                string = string.replace(f'{{{expr}}}', str(value.elements[0]))
-            return result.success(
-                String(string).set_context(context).set_pos(node.pos_start, node.pos_end)
-            )
-        
-        return RTResult().success(
-            String(node.token.value).set_context(context).set_pos(node.pos_start, node.pos_end)
-        )
+        return result.success(String(interpolated(node.texts, values)))
         
+    # Body of a loop whose value is never read, its statements run without a List of their values
+    def visit_body(self, node, context : Context) -> RTResult:
+        if not node.is_statement or not isinstance(node.body_node, ListNode): return self.visit(node.body_node, context)
+        result = RTResult()
+
+        for statement_node in node.body_node.elements_nodes:
+            result.register(self.visit(statement_node, context))
+            if result.should_return(): return result
+
+        return result.success(Boolean.null)
+
     def visit_ListNode(self, node : ListNode, context : Context) -> RTResult:
         result = RTResult()
         elements = []
@@ -554,54 +614,57 @@ class Interpreter:
             elements.append(result.register(self.visit(element_node, context)))
             if result.should_return(): return result
         
-        return result.success(
-            List(elements).set_context(context).set_pos(node.pos_start, node.pos_end)
-        )
+        return result.success(List(elements))
     
     def visit_BinOpNode(self, node : BinOpNode, context : Context) -> RTResult:
         result = RTResult()
         left = result.register(self.visit(node.left_node, context))
         if result.should_return(): return result
+
+        if node.op_token.type in SHORT_CIRCUIT_TYPES:
+            value = decided_value(node.op_token.type, left)
+            if value is not None: return result.success(value)
+
         right = result.register(self.visit(node.right_node, context))
         if result.should_return(): return result
 
-        methods = {
-            TT_PLUS     : left.add, 
-            TT_MINUS    : left.subtract, 
-            TT_MUL      : left.multiply, 
-            TT_DIV      : left.divide, 
-            TT_POW      : left.power,
-            TT_MOD      : left.modulo,
-            TT_QUO      : left.quotient,
-            TT_EE       : left.get_comparison_eq,
-            TT_NE       : left.get_comparison_ne,
-            TT_LT       : left.get_comparison_lt,
-            TT_GT       : left.get_comparison_gt,
-            TT_LTE      : left.get_comparison_lte,
-            TT_GTE      : left.get_comparison_gte,
-            TT_AND      : left.get_and,
-            TT_OR       : left.get_or,
-            }
-
-        method_result, error = methods[node.op_token.type](right)
-
-        if error: return result.failure(error)
-        else : return result.success(method_result.set_pos(node.pos_start, node.pos_end))
+        method_name = BINARY_METHODS[node.op_token.type]
+
+        if left.__class__ is Number and right.__class__ is Number:
+            operation, value_class = NUMBER_OPERATIONS[method_name]
+            try:
+                return result.success(value_class.of(operation(left.value, right.value)))
+            except ZeroDivisionError:
+                # Made below by the method, with its error
+                pass
+
+        method_result, error = getattr(left, method_name)(right)
+
+        if error: return result.failure(Value.locate_error(
+            method_name, [left, right],
+            [(node.left_node.pos_start, node.left_node.pos_end), (node.right_node.pos_start, node.right_node.pos_end)],
+            context
+        ))
+        else : return result.success(method_result)
     
     def visit_UnaryOpNode(self, node : UnaryOpNode, context : Context) -> RTResult:
         result = RTResult()
         number : Number = result.register(self.visit(node.node, context))
         if result.should_return(): return result
 
-        error = None
-
         if node.op_token.type == TT_MINUS:
-            number, error = number.multiply(Number(-1))
+            method_name, operands = 'multiply', [number, Number.of(-1)]
         elif node.op_token.type == TT_NOT:
-            number, error = number.not_comp()
+            method_name, operands = 'not_comp', [number]
+
+        number, error = getattr(operands[0], method_name)(*operands[1:])
 
-        if error: return result.failure(error)
-        else: return result.success(number.set_pos(node.pos_start, node.pos_end))
+        if error: return result.failure(Value.locate_error(
+            method_name, operands,
+            [(node.node.pos_start, node.node.pos_end), (None, None)],
+            context
+        ))
+        else: return result.success(number)
     
     def visit_VarAccessNode(self, node : VarAccessNode, context : Context) -> RTResult:
         result = RTResult()
@@ -620,8 +683,13 @@ class Interpreter:
             if len(node.slice_or_getter) == 1:
                 ope1 : Number = result.register(self.visit(node.slice_or_getter[0], context))
                 if result.should_return(): return result
-                value, error = value.get(ope1)
-                if error: return result.failure(error)
+                getter_value, error = value.get(ope1)
+                if error: return result.failure(Value.locate_error(
+                    'get', [value, ope1],
+                    [(node.pos_start, node.pos_end), (node.slice_or_getter[0].pos_start, node.slice_or_getter[0].pos_end)],
+                    context
+                ))
+                value = getter_value
 
             elif len(node.slice_or_getter) == 2:
                 ope1 = node.slice_or_getter[0]
@@ -634,11 +702,14 @@ class Interpreter:
                     ope2 = result.register(self.visit(ope2, context))
                     if result.should_return(): return result
 
-                value, error = value.get_slice(ope1, ope2)
-                if error: return result.failure(error)
+                slice_value, error = value.get_slice(ope1, ope2)
+                if error: return result.failure(Value.locate_error(
+                    'get_slice', [value, ope1, ope2],
+                    [(node.pos_start, node.pos_end)] + [(ope.pos_start, ope.pos_end) if ope else (None, None) for ope in node.slice_or_getter],
+                    context
+                ))
+                value = slice_value
 
-        
-        value = value.copy().set_pos(node.pos_start, node.pos_end).set_context(context)
         return result.success(value)
 
     def visit_VarAssignNode(self, node : VarAssignNode, context : Context) -> RTResult:
@@ -673,7 +744,7 @@ class Interpreter:
     def visit_ForNode(self, node : ForNode, context : Context) -> RTResult:
         result = RTResult()
         elements = []
-        recursion_count = 0
+        budget = context.budget
 
         start_value = result.register(self.visit(node.start_value_node, context))
         if result.should_return(): return result
@@ -686,27 +757,23 @@ class Interpreter:
             if result.should_return(): return result
         else:
             step_value = Number(1 if start_value.value < end_value.value else -1)
-        
-        i = start_value.value
 
-        if step_value.value >= 0:
-            condition = lambda: i < end_value.value
-        else:
-            condition = lambda: i > end_value.value
-        
-        while condition():
-            context.symbol_table.set(node.var_name_token.value, Number(i))
-            i += step_value.value
-            if recursion_count > LOOP_MAX_RECUR:
+        var_name = node.var_name_token.value
+        observed = var_observed(node)
+        i = None
+
+        for i in loop_range(start_value.value, end_value.value, step_value.value):
+            if observed: context.symbol_table.set(var_name, Number.of(i))
+            error = budget and budget.tick()
+            if error:
                 return result.failure(RTError(
                     node.pos_start, node.pos_end,
-                    f"Max recursion limit reached ({LOOP_MAX_RECUR})",
+                    error,
                     context
                 ))
-            recursion_count += 1
 
-            value= result.register(self.visit(node.body_node, context))
-            if result.should_return() and result.loop_continue == False: return result
+            value = result.register(self.visit_body(node, context))
+            if result.should_return() and result.loop_break == False and result.loop_continue == False: return result
 
             if result.loop_continue:
                 continue
@@ -714,74 +781,78 @@ class Interpreter:
             if result.loop_break:
                 break
 
-            elements.append(value)
-        
-        return result.success(
-            List(elements).set_context(context).set_pos(node.pos_start, node.pos_end)
-        )
+            if not node.is_statement: elements.append(value)
+
+        if not observed and i is not None: context.symbol_table.set(var_name, Number.of(i))
+
+        if node.is_statement: return result.success(Boolean.null)
+        return result.success(List(elements))
     
     def visit_ForInNode(self, node : ForInNode, context : Context) -> RTResult:
         result = RTResult()
         elements = []
-        recursion_count = 0
+        budget = context.budget
 
         iterated_value = result.register(self.visit(node.iterated_value_node, context))
         if result.should_return(): return result
 
-        if isinstance(iterated_value, String):
-            iterated_value = List([String(char) for char in iterated_value.value])
-            
-        if isinstance(iterated_value, List):
-            for i in range(len(iterated_value.elements)):
-                context.symbol_table.set(node.var_name_token.value, iterated_value.elements[i])
-                if recursion_count > LOOP_MAX_RECUR:
-                    return result.failure(RTError(
-                        node.pos_start, node.pos_end,
-                        f"Max recursion limit reached ({LOOP_MAX_RECUR})",
-                        context
-                    ))
-                recursion_count += 1
-
-                value = result.register(self.visit(node.body_node, context))
-                if result.should_return() and result.loop_continue == False: return result
-
-                if result.loop_continue:
-                    continue
-
-                if result.loop_break:
-                    break
-
-                elements.append(value)
-            return result.success(
-                List(elements).set_context(context).set_pos(node.pos_start, node.pos_end)
-            )
-        else:
+        iterator = iterated_value.iterate() if isinstance(iterated_value, Value) else None
+        if iterator is None:
             return result.failure(RTError(
                 node.pos_start, node.pos_end,
                 f"Can't iterate over {iterated_value}",
                 context
             ))
 
+        for element in iterator:
+            context.symbol_table.set(node.var_name_token.value, element)
+            error = budget and budget.tick()
+            if error:
+                return result.failure(RTError(
+                    node.pos_start, node.pos_end,
+                    error,
+                    context
+                ))
+
+            value = result.register(self.visit_body(node, context))
+            if result.should_return() and result.loop_break == False and result.loop_continue == False: return result
+
+            if result.loop_continue:
+                continue
+
+            if result.loop_break:
+                break
+
+            if not node.is_statement: elements.append(value)
+
+        # A generator that failed stops the loop with its error
+        if isinstance(iterated_value, Iterator):
+            error = iterated_value.take_error()
+            if error: return result.failure(error)
+
+        if node.is_statement: return result.success(Boolean.null)
+        return result.success(List(elements))
+
     def visit_WhileNode(self, node : WhileNode, context : Context) -> RTResult:
         result = RTResult()
         elements = []
-        recursion_count = 0
+        budget = context.budget
 
         while True:
-            if recursion_count > LOOP_MAX_RECUR:
+            error = budget and budget.tick()
+            if error:
                 return result.failure(RTError(
                     node.pos_start, node.pos_end,
-                    f"Max recursion limit reached ({LOOP_MAX_RECUR})",
+                    error,
                     context
                 ))
-            recursion_count += 1
 
             condition = result.register(self.visit(node.condition_node, context))
             if result.should_return(): return result
 
             if not condition.is_true(): break
 
-            value = result.register(self.visit(node.body_node, context))
+            value = result.register(self.visit_body(node, context))
             if result.should_return() and result.loop_break == False and result.loop_continue == False: return result
 
             if result.loop_continue:
@@ -790,11 +861,10 @@ class Interpreter:
             if result.loop_break:
                 break
 
-            elements.append(value)
+            if not node.is_statement: elements.append(value)
 
-        return result.success(
-            List(elements).set_context(context).set_pos(node.pos_start, node.pos_end)
-        )
+        if node.is_statement: return result.success(Boolean.null)
+        return result.success(List(elements))
 
     def visit_FuncDefNode(self, node : FuncDefNode, context : Context) -> RTResult:
         result = RTResult()
@@ -811,9 +881,9 @@ class Interpreter:
                 if result.should_return(): return result
                 new_arg_names[key] = result.value
             else:
-                new_arg_names[key] = value
+                new_arg_names[key] = None
 
-        func_value = Function(func_name, body_node, new_arg_names, node.auto_return).set_context(context).set_pos(node.pos_start, node.pos_end)
+        func_value = Function(func_name, body_node, new_arg_names, node.auto_return, is_generator=node.is_generator)
 
         if node.var_name_token:
             context.symbol_table.set(func_name, func_value)
@@ -822,21 +892,28 @@ class Interpreter:
 
     def visit_CallNode(self, node : CallNode, context : Context) -> RTResult:
         result = RTResult()
-        args = []
+        # Positional args then keyword args, as node.call_site binds them
+        values = []
 
         value_to_call = result.register(self.visit(node.name_node, context))
         if result.should_return(): return result
 
-        value_to_call = value_to_call.copy().set_pos(node.pos_start, node.pos_end)
-
-        for arg_node in node.args_nodes:
-            args.append(result.register(self.visit(arg_node, context)))
-            if result.should_return(): return result
+        for key, arg_node in node.args_nodes.items():
+            if key == Boolean.null:
+                for positional_node in arg_node:
+                    values.append(result.register(self.visit(positional_node, context)))
+                    if result.should_return(): return result
+            else:
+                values.append(result.register(self.visit(arg_node, context)))
+                if result.should_return(): return result
         
-        return_value = result.register(value_to_call.execute(args))
+        try:
+            return_value = result.register(value_to_call.call(values, node.call_site, context, node.pos_start, node.pos_end))
+        except RecursionError:
+            return result.failure(recursion_error(node.pos_start, node.pos_end, context))
         if result.should_return(): return result
 
-        return result.success(return_value.copy().set_pos(node.pos_start, node.pos_end).set_context(context))
+        return result.success(return_value)
     
     def visit_ReturnNode(self, node : ReturnNode, context : Context) -> RTResult:
         result = RTResult()
@@ -856,82 +933,1821 @@ class Interpreter:
         return RTResult().success_break()
     
     def visit_ImportNode(self, node: ImportNode, context : Context) -> RTResult:
-        result = RTResult()
-
-        file = node.module_name_token
-        file_path = path.dirname(context.symbol_table.get("__file__").value) + "/"
-        file = file_path + file.value.replace('.', '/') + '.pyl'
+        file = _module_file_name(node.module_name_token.value, context)
+        error = _import(file)
 
-        try:
-            with open(file, "r") as f:
-                script = f.read()
-            
-        except Exception as e:
+        if error:
             return RTResult().failure(RTError(
                 node.pos_start, node.pos_end,
-                f"Failed to load script \"{file}\"\n" + str(e),
+                error,
                 context
             ))
         
-        _, error = _run(file, script, global_symbol_table)
+        return RTResult().success(Boolean.null)
 
-        if error:
-            return RTResult().failure(RTError(
+    ######
+
+    # Generator bodies : the lists, ifs and loops with a yield in them and the yields are walked by python generators,
+    # which stop at each yield with its value and return the RTResult of the node. The other nodes are visited
+    def suspend(self, node, context : Context):
+        if not getattr(node, 'suspends', False): return self.visit(node, context)
+        method_name = f'suspend_{type(node).__name__}'
+        return (yield from getattr(self, method_name)(node, context))
+
+    def suspend_body(self, node, context : Context):
+        if not node.is_statement or not isinstance(node.body_node, ListNode): return (yield from self.suspend(node.body_node, context))
+        result = RTResult()
+
+        for statement_node in node.body_node.elements_nodes:
+            result.register((yield from self.suspend(statement_node, context)))
+            if result.should_return(): return result
+
+        return result.success(Boolean.null)
+
+    def suspend_ListNode(self, node : ListNode, context : Context):
+        result = RTResult()
+        elements = []
+
+        for element_node in node.elements_nodes:
+            elements.append(result.register((yield from self.suspend(element_node, context))))
+            if result.should_return(): return result
+
+        return result.success(List(elements))
+
+    def suspend_IfNode(self, node : IfNode, context : Context):
+        result = RTResult()
+
+        for condition, expression in node.cases:
+            condition_value = result.register(self.visit(condition, context))
+            if result.should_return(): return result
+
+            if condition_value.is_true():
+                expr_value = result.register((yield from self.suspend(expression, context)))
+                if result.should_return(): return result
+                return result.success(expr_value)
+
+        if node.else_case:
+            else_value = result.register((yield from self.suspend(node.else_case, context)))
+            if result.should_return(): return result
+            return result.success(else_value)
+        return result.success(None)
+
+    def suspend_ForNode(self, node : ForNode, context : Context):
+        result = RTResult()
+        elements = []
+        budget = context.budget
+
+        start_value = result.register(self.visit(node.start_value_node, context))
+        if result.should_return(): return result
+
+        end_value = result.register(self.visit(node.end_value_node, context))
+        if result.should_return(): return result
+
+        if node.step_value_node:
+            step_value = result.register(self.visit(node.step_value_node, context))
+            if result.should_return(): return result
+        else:
+            step_value = Number(1 if start_value.value < end_value.value else -1)
+
+        var_name = node.var_name_token.value
+        observed = var_observed(node)
+        i = None
+
+        for i in loop_range(start_value.value, end_value.value, step_value.value):
+            if observed: context.symbol_table.set(var_name, Number.of(i))
+            error = budget and budget.tick()
+            if error:
+                return result.failure(RTError(
+                    node.pos_start, node.pos_end,
+                    error,
+                    context
+                ))
+
+            value = result.register((yield from self.suspend_body(node, context)))
+            if result.should_return() and result.loop_break == False and result.loop_continue == False: return result
+
+            if result.loop_continue:
+                continue
+
+            if result.loop_break:
+                break
+
+            if not node.is_statement: elements.append(value)
+
+        if not observed and i is not None: context.symbol_table.set(var_name, Number.of(i))
+
+        if node.is_statement: return result.success(Boolean.null)
+        return result.success(List(elements))
+
+    def suspend_ForInNode(self, node : ForInNode, context : Context):
+        result = RTResult()
+        elements = []
+        budget = context.budget
+
+        iterated_value = result.register(self.visit(node.iterated_value_node, context))
+        if result.should_return(): return result
+
+        iterator = iterated_value.iterate() if isinstance(iterated_value, Value) else None
+        if iterator is None:
+            return result.failure(RTError(
                 node.pos_start, node.pos_end,
-                f"Failed to finish executing script \"{file}\"\n {error}",
+                f"Can't iterate over {iterated_value}",
                 context
             ))
-        
-        return result.success(Boolean.null)
 
-###########
-# ! RUN ! #
-###########
+        for element in iterator:
+            context.symbol_table.set(node.var_name_token.value, element)
+            error = budget and budget.tick()
+            if error:
+                return result.failure(RTError(
+                    node.pos_start, node.pos_end,
+                    error,
+                    context
+                ))
 
-def _run(file_name : str, text : str, symbol_table : SymbolTable = SymbolTable(global_symbol_table)) -> tuple[Token, Error]:
-    global _FileMain
-    # * Generate tokens *
-    lexer = Lexer(file_name, text, GLOBAL_TESTING)
-    tokens, error = lexer.make_tokens()
-    if error: return None, error
+            value = result.register((yield from self.suspend_body(node, context)))
+            if result.should_return() and result.loop_break == False and result.loop_continue == False: return result
 
-    #?print('> Tokens - ' + str(tokens))
+            if result.loop_continue:
+                continue
 
-    # * Generate AST *
-    parser = Parser(tokens)
-    ast = parser.parse()
-    if ast.error: return None, ast.error
+            if result.loop_break:
+                break
 
-    #?print('> Nodes - ' + str(ast.node))
+            if not node.is_statement: elements.append(value)
 
-    # * Run program *
-    interpreter = Interpreter()
-    context = Context('<program>')
-    context.symbol_table = symbol_table
-    if _FileMain:
-        context.symbol_table.set('__name__', String('__main__'))
-        _FileMain = False
-    else:
-        context.symbol_table.set('__name__', String(path.basename(file_name.strip('.pyl'))))
-    context.symbol_table.set('__file__', String(path.abspath(file_name)))
-    result = interpreter.visit(ast.node, context)
+        # A generator that failed stops the loop with its error
+        if isinstance(iterated_value, Iterator):
+            error = iterated_value.take_error()
+            if error: return result.failure(error)
 
+        if node.is_statement: return result.success(Boolean.null)
+        return result.success(List(elements))
 
-    return result.value, result.error
-        
+    def suspend_WhileNode(self, node : WhileNode, context : Context):
+        result = RTResult()
+        elements = []
+        budget = context.budget
 
-if __name__ == '__main__':
-    args = argv
-    if len(args) == 1:
-        exec(open(path.dirname(args[0]) + "/shell.py").read())
-    elif len(args) <= 3:
-        if '-test' in args:
-            args.remove('-test')
-            GLOBAL_TESTING = True
+        while True:
+            error = budget and budget.tick()
+            if error:
+                return result.failure(RTError(
+                    node.pos_start, node.pos_end,
+                    error,
+                    context
+                ))
+
+            condition = result.register(self.visit(node.condition_node, context))
+            if result.should_return(): return result
+
+            if not condition.is_true(): break
+
+            value = result.register((yield from self.suspend_body(node, context)))
+            if result.should_return() and result.loop_break == False and result.loop_continue == False: return result
+
+            if result.loop_continue:
+                continue
+
+            if result.loop_break:
+                break
+
+            if not node.is_statement: elements.append(value)
+
+        if node.is_statement: return result.success(Boolean.null)
+        return result.success(List(elements))
+
+    def suspend_YieldNode(self, node : YieldNode, context : Context):
+        result = RTResult()
+
+        if node.yield_node:
+            value = result.register(self.visit(node.yield_node, context))
+            if result.should_return(): return result
+            if value is None: value = Boolean.null
+        else:
+            value = Boolean.null
+
+        yield value
+        return result.success(Boolean.null)
+
+# The Interpreter keeps no state, one runs the nodes the VM does not lower and the bodies of the functions it walks
+VM.fallback = Function.interpreter = Interpreter()
+
+########################
+# ! CLOSURE COMPILER ! #
+########################
+class ClosureCompiler:
+    # Every node is compiled once into a closure taking the context and returning an RTResult,
+    # so running a program walks pre-bound callables instead of dispatching on each visit.
+    # The visit_* methods of the Interpreter are the reference semantics.
+    def __init__(self, resolver : Resolver = None) -> None:
+        self.resolver = resolver
+        # Slots of the function being compiled, None at the top level of the program
+        self.slot_indexes = None
+
+    def compile_program(self, node):
+        self.resolver = self.resolver or Resolver().resolve(node)
+        return self.compile(node)
+
+    def slot_of(self, var_name : str) -> int:
+        if self.resolver.scope_of(var_name, self.slot_indexes) == SCOPE_LOCAL:
+            return self.slot_indexes[var_name]
+        return None
+
+    def compile(self, node):
+        method_name = f'compile_{type(node).__name__}'
+        method = getattr(self, method_name, self.no_compile_method)
+        return method(node)
+    
+    def no_compile_method(self, node) -> Exception:
+        raise Exception(f'No compile_{type(node).__name__} method defined')
+    
+    ######
+
+    def compile_NumberNode(self, node : NumberNode):
+        # Numbers are never changed or placed, the literal's one is made once
+        number = Number.of(node.token.value)
+
+        def run(context : Context) -> RTResult:
+            return RTResult().success(number)
+        return run
+    
+    def compile_StringNode(self, node : StringNode):
+        # Strings are never changed or placed either
+        string = String(node.token.value)
+
+        def run(context : Context) -> RTResult:
+            return RTResult().success(string)
+        return run
+
+    def compile_InterpolatedStringNode(self, node : InterpolatedStringNode):
+        texts = node.texts
+
+        # (run of the first statement, runs of the others) of each expression
+        expression_runs = []
+        for expression_node in node.expression_nodes:
+            if isinstance(expression_node, Error):
+                def run_error(context : Context, error : Error = expression_node) -> RTResult:
+                    return RTResult().failure(error)
+                expression_runs.append((run_error, []))
+            else:
+                statement_runs = [self.compile(statement_node) for statement_node in expression_node.elements_nodes]
+                expression_runs.append((statement_runs[0], statement_runs[1:]))
+
+        def run(context : Context) -> RTResult:
+            result = RTResult()
+            values = []
+            for first_run, other_runs in expression_runs:
+                values.append(result.register(first_run(context)))
+                if result.should_return(): return result
+                for other_run in other_runs:
+                    result.register(other_run(context))
+                    if result.should_return(): return result
+
+            return result.success(String(interpolated(texts, values)))
+        return run
+    
+    # Body of a loop whose value is never read, its statements run without a List of their values
+    def compile_body(self, node, is_statement : bool):
+        if not is_statement or not isinstance(node, ListNode) or not node.elements_nodes: return self.compile(node)
+        statement_runs = [self.compile(statement_node) for statement_node in node.elements_nodes]
+        if len(statement_runs) == 1: return statement_runs[0]
+
+        def run(context : Context) -> RTResult:
+            result = RTResult()
+
+            for statement_run in statement_runs:
+                result.register(statement_run(context))
+                if result.should_return(): return result
+
+            return result.success(Boolean.null)
+        return run
+
+    def compile_ListNode(self, node : ListNode):
+        element_runs = [self.compile(element_node) for element_node in node.elements_nodes]
+
+        def run(context : Context) -> RTResult:
+            result = RTResult()
+            elements = []
+
+            for element_run in element_runs:
+                elements.append(result.register(element_run(context)))
+                if result.should_return(): return result
+            
+            return result.success(List(elements))
+        return run
+    
+    def compile_BinOpNode(self, node : BinOpNode):
+        left_run = self.compile(node.left_node)
+        right_run = self.compile(node.right_node)
+        method_name = BINARY_METHODS[node.op_token.type]
+        operation, value_class = NUMBER_OPERATIONS[method_name]
+        operand_positions = [(node.left_node.pos_start, node.left_node.pos_end), (node.right_node.pos_start, node.right_node.pos_end)]
+
+        if node.op_token.type in SHORT_CIRCUIT_TYPES:
+            op_type = node.op_token.type
+
+            def run(context : Context) -> RTResult:
+                result = left_run(context)
+                if result.should_return(): return result
+                left = result.value
+
+                value = decided_value(op_type, left)
+                if value is not None: return result.success(value)
+
+                result = right_run(context)
+                if result.should_return(): return result
+
+                method_result, error = getattr(left, method_name)(result.value)
+                if error: return result.failure(Value.locate_error(method_name, [left, result.value], operand_positions, context))
+                else : return result.success(method_result)
+            return run
+
+        def run(context : Context) -> RTResult:
+            # The operands' results are made for this call, the right one carries the operation's result
+            left_result = left_run(context)
+            if left_result.should_return(): return left_result
+            result = right_run(context)
+            if result.should_return(): return result
+            left, right = left_result.value, result.value
+
+            if left.__class__ is Number and right.__class__ is Number:
+                try:
+                    return result.success(value_class.of(operation(left.value, right.value)))
+                except ZeroDivisionError:
+                    pass
+
+            method_result, error = getattr(left, method_name)(right)
+
+            if error: return result.failure(Value.locate_error(method_name, [left, right], operand_positions, context))
+            else : return result.success(method_result)
+        return run
+    
+    def compile_UnaryOpNode(self, node : UnaryOpNode):
+        node_run = self.compile(node.node)
+        op_type = node.op_token.type
+        operand_positions = [(node.node.pos_start, node.node.pos_end), (None, None)]
+
+        def run(context : Context) -> RTResult:
+            result = RTResult()
+            number : Number = result.register(node_run(context))
+            if result.should_return(): return result
+
+            if op_type == TT_MINUS:
+                method_name, operands = 'multiply', [number, Number.of(-1)]
+            elif op_type == TT_NOT:
+                method_name, operands = 'not_comp', [number]
+
+            number, error = getattr(operands[0], method_name)(*operands[1:])
+
+            if error: return result.failure(Value.locate_error(method_name, operands, operand_positions, context))
+            else: return result.success(number)
+        return run
+    
+    def compile_VarAccessNode(self, node : VarAccessNode):
+        var_name = node.var_name_token.value
+        scope = self.resolver.scope_of(var_name, self.slot_indexes)
+        slot = self.slot_of(var_name)
+        bound_names = self.resolver.bound_names
+        pos_start, pos_end = node.pos_start, node.pos_end
+        getter_run, slice_runs = None, None
+
+        if node.slice_or_getter != None:
+            operand_positions = [(pos_start, pos_end)] + [(ope.pos_start, ope.pos_end) if ope != None else (None, None) for ope in node.slice_or_getter]
+            if len(node.slice_or_getter) == 1:
+                getter_run = self.compile(node.slice_or_getter[0])
+            elif len(node.slice_or_getter) == 2:
+                slice_runs = [self.compile(ope) if ope != None else None for ope in node.slice_or_getter]
+
+        def run(context : Context) -> RTResult:
+            result = RTResult()
+            symbol_table = context.symbol_table
+
+            # Locals are read from their slot and globals from the global symbol table, both fall back on the callers
+            if scope == SCOPE_LOCAL:
+                value : Value = symbol_table.values[slot]
+            elif scope == SCOPE_GLOBAL and var_name not in bound_names:
+                value : Value = symbol_table.root.symbols.get(var_name)
+            else:
+                value : Value = None
+            if value == None:
+                value = symbol_table.get(var_name)
+
+            if not value:
+                return result.failure(RTError(
+                    pos_start, pos_end,
+                    f"'{var_name}' is not defined",
+                    context
+                ))
+            
+            if getter_run:
+                ope1 : Number = result.register(getter_run(context))
+                if result.should_return(): return result
+                getter_value, error = value.get(ope1)
+                if error: return result.failure(Value.locate_error('get', [value, ope1], operand_positions, context))
+                value = getter_value
+
+            elif slice_runs:
+                ope1, ope2 = None, None
+                if slice_runs[0]:
+                    ope1 = result.register(slice_runs[0](context))
+                    if result.should_return(): return result
+                if slice_runs[1]:
+                    ope2 = result.register(slice_runs[1](context))
+                    if result.should_return(): return result
+
+                slice_value, error = value.get_slice(ope1, ope2)
+                if error: return result.failure(Value.locate_error('get_slice', [value, ope1, ope2], operand_positions, context))
+                value = slice_value
+            
+            return result.success(value)
+        return run
+    
+    def compile_VarAssignNode(self, node : VarAssignNode):
+        var_name = node.var_name_token.value
+        slot = self.slot_of(var_name)
+        value_run = self.compile(node.value_node)
+
+        def run(context : Context) -> RTResult:
+            result = RTResult()
+            value = result.register(value_run(context))
+            if result.should_return(): return result
+
+            if slot != None:
+                context.symbol_table.values[slot] = value
+            else:
+                context.symbol_table.set(var_name, value)
+            return result.success(value)
+        return run
+    
+    def compile_IfNode(self, node : IfNode):
+        case_runs = [(self.compile(condition), self.compile(expression)) for condition, expression in node.cases]
+        else_run = self.compile(node.else_case) if node.else_case else None
+
+        def run(context : Context) -> RTResult:
+            result = RTResult()
+
+            for condition_run, expression_run in case_runs:
+                condition_value = result.register(condition_run(context))
+                if result.should_return(): return result
+
+                if condition_value.is_true():
+                    expr_value = result.register(expression_run(context))
+                    if result.should_return(): return result
+                    return result.success(expr_value)
+            
+            if else_run:
+                else_value = result.register(else_run(context))
+                if result.should_return(): return result
+                return result.success(else_value)
+            return result.success(None)
+        return run
+    
+    def compile_ForNode(self, node : ForNode):
+        var_name = node.var_name_token.value
+        slot = self.slot_of(var_name)
+        start_run = self.compile(node.start_value_node)
+        end_run = self.compile(node.end_value_node)
+        step_run = self.compile(node.step_value_node) if node.step_value_node else None
+        body_run = self.compile_body(node.body_node, node.is_statement)
+        is_statement = node.is_statement
+        # A body that can't see the variable leaves the counter a python int until the loop ends
+        observed = var_observed(node)
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def run(context : Context) -> RTResult:
+            result = RTResult()
+            elements = []
+            budget = context.budget
+
+            start_value = result.register(start_run(context))
+            if result.should_return(): return result
+
+            end_value = result.register(end_run(context))
+            if result.should_return(): return result
+
+            if step_run:
+                step_value = result.register(step_run(context))
+                if result.should_return(): return result
+            else:
+                step_value = Number(1 if start_value.value < end_value.value else -1)
+
+            symbol_table = context.symbol_table
+            i = None
+
+            for i in loop_range(start_value.value, end_value.value, step_value.value):
+                if observed:
+                    if slot != None: symbol_table.values[slot] = Number.of(i)
+                    else: symbol_table.set(var_name, Number.of(i))
+                error = budget and budget.tick()
+                if error:
+                    return result.failure(RTError(
+                        pos_start, pos_end,
+                        error,
+                        context
+                    ))
+
+                value = result.register(body_run(context))
+                if result.should_return() and result.loop_break == False and result.loop_continue == False: return result
+
+                if result.loop_continue:
+                    continue
+
+                if result.loop_break:
+                    break
+
+                if not is_statement: elements.append(value)
+
+            if not observed and i is not None:
+                if slot != None: symbol_table.values[slot] = Number.of(i)
+                else: symbol_table.set(var_name, Number.of(i))
+
+            if is_statement: return result.success(Boolean.null)
+            return result.success(List(elements))
+        return run
+    
+    def compile_ForInNode(self, node : ForInNode):
+        var_name = node.var_name_token.value
+        slot = self.slot_of(var_name)
+        iterated_run = self.compile(node.iterated_value_node)
+        body_run = self.compile_body(node.body_node, node.is_statement)
+        is_statement = node.is_statement
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def run(context : Context) -> RTResult:
+            result = RTResult()
+            elements = []
+            budget = context.budget
+
+            iterated_value = result.register(iterated_run(context))
+            if result.should_return(): return result
+
+            iterator = iterated_value.iterate() if isinstance(iterated_value, Value) else None
+            if iterator is None:
+                return result.failure(RTError(
+                    pos_start, pos_end,
+                    f"Can't iterate over {iterated_value}",
+                    context
+                ))
+            
+            symbol_table = context.symbol_table
+            for element in iterator:
+                if slot != None: symbol_table.values[slot] = element
+                else: symbol_table.set(var_name, element)
+                error = budget and budget.tick()
+                if error:
+                    return result.failure(RTError(
+                        pos_start, pos_end,
+                        error,
+                        context
+                    ))
+
+                value = result.register(body_run(context))
+                if result.should_return() and result.loop_break == False and result.loop_continue == False: return result
+
+                if result.loop_continue:
+                    continue
+
+                if result.loop_break:
+                    break
+
+                if not is_statement: elements.append(value)
+            
+            if isinstance(iterated_value, Iterator):
+                error = iterated_value.take_error()
+                if error: return result.failure(error)
+
+            if is_statement: return result.success(Boolean.null)
+            return result.success(List(elements))
+        return run
+    
+    def compile_WhileNode(self, node : WhileNode):
+        condition_run = self.compile(node.condition_node)
+        body_run = self.compile_body(node.body_node, node.is_statement)
+        is_statement = node.is_statement
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def run(context : Context) -> RTResult:
+            result = RTResult()
+            elements = []
+            budget = context.budget
+
+            while True:
+                error = budget and budget.tick()
+                if error:
+                    return result.failure(RTError(
+                        pos_start, pos_end,
+                        error,
+                        context
+                    ))
+
+                condition = result.register(condition_run(context))
+                if result.should_return(): return result
+
+                if not condition.is_true(): break
+
+                value = result.register(body_run(context))
+                if result.should_return() and result.loop_break == False and result.loop_continue == False: return result
+
+                if result.loop_continue:
+                    continue
+
+                if result.loop_break:
+                    break
+
+                if not is_statement: elements.append(value)
+
+            if is_statement: return result.success(Boolean.null)
+            return result.success(List(elements))
+        return run
+    
+    def compile_FuncDefNode(self, node : FuncDefNode):
+        func_name = node.var_name_token.value if node.var_name_token else None
+        body_node = node.body_node
+        auto_return = node.auto_return
+        is_generator = node.is_generator
+        default_runs = {}
+
+        for key, value in node.arg_name_tokens.items():
+            default_runs[key.value] = self.compile(value) if value != Boolean.null else None
+
+        # The body reads and writes its locals through the slots of its calls
+        slot_indexes = self.resolver.slot_indexes(node)
+        enclosing_slot_indexes, self.slot_indexes = self.slot_indexes, slot_indexes
+        # The body of a generator gives a python generator stopping at its yields
+        body_run = self.compile_suspending(body_node) if is_generator else self.compile(body_node)
+        self.slot_indexes = enclosing_slot_indexes
+        signature = Signature(list(default_runs), [default_run is None for default_run in default_runs.values()], [slot_indexes[arg_name] for arg_name in default_runs])
+
+        def run(context : Context) -> RTResult:
+            result = RTResult()
+            arg_names = {}
+
+            for arg_name, default_run in default_runs.items():
+                if default_run:
+                    arg_names[arg_name] = result.register(default_run(context))
+                    if result.should_return(): return result
+                else:
+                    arg_names[arg_name] = None
+            
+            func_value = Function(func_name, body_node, arg_names, auto_return, body_run, slot_indexes, is_generator, signature)
+
+            if func_name:
+                context.symbol_table.set(func_name, func_value)
+
+            return result.success(func_value)
+        return run
+    
+    def compile_CallNode(self, node : CallNode):
+        name_run = self.compile(node.name_node)
+        # Positional args then keyword args, as call_site binds them
+        arg_runs = []
+        call_site = node.call_site
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        for key, arg_node in node.args_nodes.items():
+            if key == Boolean.null:
+                arg_runs += [self.compile(positional_node) for positional_node in arg_node]
+            else:
+                arg_runs.append(self.compile(arg_node))
+
+        def run(context : Context) -> RTResult:
+            result = RTResult()
+
+            value_to_call = result.register(name_run(context))
+            if result.should_return(): return result
+
+            values = []
+            for arg_run in arg_runs:
+                values.append(result.register(arg_run(context)))
+                if result.should_return(): return result
+            
+            try:
+                return_value = result.register(value_to_call.call(values, call_site, context, pos_start, pos_end))
+            except RecursionError:
+                return result.failure(recursion_error(pos_start, pos_end, context))
+            if result.should_return(): return result
+
+            return result.success(return_value)
+        return run
+    
+    def compile_ReturnNode(self, node : ReturnNode):
+        return_run = self.compile(node.return_node) if node.return_node else None
+
+        def run(context : Context) -> RTResult:
+            result = RTResult()
+
+            if return_run:
+                value = result.register(return_run(context))
+                if result.should_return(): return result
+            else:
+                value = Boolean.null
+
+            return result.success_return(value)
+        return run
+    
+    def compile_ContinueNode(self, node : ContinueNode):
+        def run(context : Context) -> RTResult:
+            return RTResult().success_continue()
+        return run
+    
+    def compile_BreakNode(self, node : BreakNode):
+        def run(context : Context) -> RTResult:
+            return RTResult().success_break()
+        return run
+    
+    def compile_ImportNode(self, node : ImportNode):
+        interpreter = Interpreter()
+
+        def run(context : Context) -> RTResult:
+            return interpreter.visit_ImportNode(node, context)
+        return run
+
+    ######
+
+    # Generator bodies : the lists, ifs and loops with a yield in them and the yields are compiled into generator functions,
+    # their python generators stop at each yield with its value and return the RTResult of the node. The other nodes run as usual
+    def compile_suspending(self, node):
+        method_name = f'compile_suspending_{type(node).__name__}'
+        return getattr(self, method_name)(node)
+
+    # (run, whether it is a generator function) of a node of a generator body
+    def compile_step(self, node) -> tuple:
+        if getattr(node, 'suspends', False): return self.compile_suspending(node), True
+        return self.compile(node), False
+
+    def compile_suspending_body(self, node, is_statement : bool):
+        if not is_statement or not isinstance(node, ListNode): return self.compile_suspending(node)
+        statement_runs = [self.compile_step(statement_node) for statement_node in node.elements_nodes]
+
+        def run(context : Context):
+            result = RTResult()
+
+            for statement_run, suspends in statement_runs:
+                result.register((yield from statement_run(context)) if suspends else statement_run(context))
+                if result.should_return(): return result
+
+            return result.success(Boolean.null)
+        return run
+
+    def compile_suspending_ListNode(self, node : ListNode):
+        element_runs = [self.compile_step(element_node) for element_node in node.elements_nodes]
+
+        def run(context : Context):
+            result = RTResult()
+            elements = []
+
+            for element_run, suspends in element_runs:
+                elements.append(result.register((yield from element_run(context)) if suspends else element_run(context)))
+                if result.should_return(): return result
+
+            return result.success(List(elements))
+        return run
+
+    def compile_suspending_IfNode(self, node : IfNode):
+        case_runs = [(self.compile(condition), *self.compile_step(expression)) for condition, expression in node.cases]
+        else_run, else_suspends = self.compile_step(node.else_case) if node.else_case else (None, False)
+
+        def run(context : Context):
+            result = RTResult()
+
+            for condition_run, expression_run, suspends in case_runs:
+                condition_value = result.register(condition_run(context))
+                if result.should_return(): return result
+
+                if condition_value.is_true():
+                    expr_value = result.register((yield from expression_run(context)) if suspends else expression_run(context))
+                    if result.should_return(): return result
+                    return result.success(expr_value)
+
+            if else_run:
+                else_value = result.register((yield from else_run(context)) if else_suspends else else_run(context))
+                if result.should_return(): return result
+                return result.success(else_value)
+            return result.success(None)
+        return run
+
+    def compile_suspending_ForNode(self, node : ForNode):
+        var_name = node.var_name_token.value
+        slot = self.slot_of(var_name)
+        start_run = self.compile(node.start_value_node)
+        end_run = self.compile(node.end_value_node)
+        step_run = self.compile(node.step_value_node) if node.step_value_node else None
+        body_run = self.compile_suspending_body(node.body_node, node.is_statement)
+        is_statement = node.is_statement
+        observed = var_observed(node)
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def run(context : Context):
+            result = RTResult()
+            elements = []
+            budget = context.budget
+
+            start_value = result.register(start_run(context))
+            if result.should_return(): return result
+
+            end_value = result.register(end_run(context))
+            if result.should_return(): return result
+
+            if step_run:
+                step_value = result.register(step_run(context))
+                if result.should_return(): return result
+            else:
+                step_value = Number(1 if start_value.value < end_value.value else -1)
+
+            symbol_table = context.symbol_table
+            i = None
+
+            for i in loop_range(start_value.value, end_value.value, step_value.value):
+                if observed:
+                    if slot != None: symbol_table.values[slot] = Number.of(i)
+                    else: symbol_table.set(var_name, Number.of(i))
+                error = budget and budget.tick()
+                if error:
+                    return result.failure(RTError(
+                        pos_start, pos_end,
+                        error,
+                        context
+                    ))
+
+                value = result.register((yield from body_run(context)))
+                if result.should_return() and result.loop_break == False and result.loop_continue == False: return result
+
+                if result.loop_continue:
+                    continue
+
+                if result.loop_break:
+                    break
+
+                if not is_statement: elements.append(value)
+
+            if not observed and i is not None:
+                if slot != None: symbol_table.values[slot] = Number.of(i)
+                else: symbol_table.set(var_name, Number.of(i))
+
+            if is_statement: return result.success(Boolean.null)
+            return result.success(List(elements))
+        return run
+
+    def compile_suspending_ForInNode(self, node : ForInNode):
+        var_name = node.var_name_token.value
+        slot = self.slot_of(var_name)
+        iterated_run = self.compile(node.iterated_value_node)
+        body_run = self.compile_suspending_body(node.body_node, node.is_statement)
+        is_statement = node.is_statement
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def run(context : Context):
+            result = RTResult()
+            elements = []
+            budget = context.budget
+
+            iterated_value = result.register(iterated_run(context))
+            if result.should_return(): return result
+
+            iterator = iterated_value.iterate() if isinstance(iterated_value, Value) else None
+            if iterator is None:
+                return result.failure(RTError(
+                    pos_start, pos_end,
+                    f"Can't iterate over {iterated_value}",
+                    context
+                ))
+
+            symbol_table = context.symbol_table
+            for element in iterator:
+                if slot != None: symbol_table.values[slot] = element
+                else: symbol_table.set(var_name, element)
+                error = budget and budget.tick()
+                if error:
+                    return result.failure(RTError(
+                        pos_start, pos_end,
+                        error,
+                        context
+                    ))
+
+                value = result.register((yield from body_run(context)))
+                if result.should_return() and result.loop_break == False and result.loop_continue == False: return result
+
+                if result.loop_continue:
+                    continue
+
+                if result.loop_break:
+                    break
+
+                if not is_statement: elements.append(value)
+
+            if isinstance(iterated_value, Iterator):
+                error = iterated_value.take_error()
+                if error: return result.failure(error)
+
+            if is_statement: return result.success(Boolean.null)
+            return result.success(List(elements))
+        return run
+
+    def compile_suspending_WhileNode(self, node : WhileNode):
+        condition_run = self.compile(node.condition_node)
+        body_run = self.compile_suspending_body(node.body_node, node.is_statement)
+        is_statement = node.is_statement
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def run(context : Context):
+            result = RTResult()
+            elements = []
+            budget = context.budget
+
+            while True:
+                error = budget and budget.tick()
+                if error:
+                    return result.failure(RTError(
+                        pos_start, pos_end,
+                        error,
+                        context
+                    ))
+
+                condition = result.register(condition_run(context))
+                if result.should_return(): return result
+
+                if not condition.is_true(): break
+
+                value = result.register((yield from body_run(context)))
+                if result.should_return() and result.loop_break == False and result.loop_continue == False: return result
+
+                if result.loop_continue:
+                    continue
+
+                if result.loop_break:
+                    break
+
+                if not is_statement: elements.append(value)
+
+            if is_statement: return result.success(Boolean.null)
+            return result.success(List(elements))
+        return run
+
+    def compile_suspending_YieldNode(self, node : YieldNode):
+        yield_run = self.compile(node.yield_node) if node.yield_node else None
+
+        def run(context : Context):
+            result = RTResult()
+
+            if yield_run:
+                value = result.register(yield_run(context))
+                if result.should_return(): return result
+                if value is None: value = Boolean.null
+            else:
+                value = Boolean.null
+
+            yield value
+            return result.success(Boolean.null)
+        return run
+
+##########################
+# ! EXCEPTION COMPILER ! #
+##########################
+class ExceptionCompiler(ClosureCompiler):
+    # Closures returning plain values instead of RTResults : errors, return, break and continue are raised as signals
+    # (Utils.Signals), so the runs that don't meet them skip the RTResult of every node and its checks.
+    # Function bodies and programs give RTResults back, through result_of.
+    def compile_program(self, node):
+        program_run = super().compile_program(node)
+
+        def run(context : Context) -> RTResult:
+            return result_of(program_run, context)
+        return run
+
+    ######
+
+    def compile_NumberNode(self, node : NumberNode):
+        number = Number.of(node.token.value)
+
+        def run(context : Context) -> Value:
+            return number
+        return run
+    
+    def compile_StringNode(self, node : StringNode):
+        string = String(node.token.value)
+
+        def run(context : Context) -> Value:
+            return string
+        return run
+
+    def compile_InterpolatedStringNode(self, node : InterpolatedStringNode):
+        texts = node.texts
+
+        # (run of the first statement, runs of the others) of each expression
+        expression_runs = []
+        for expression_node in node.expression_nodes:
+            if isinstance(expression_node, Error):
+                def run_error(context : Context, error : Error = expression_node) -> Value:
+                    raise RunFailure(error)
+                expression_runs.append((run_error, []))
+            else:
+                statement_runs = [self.compile(statement_node) for statement_node in expression_node.elements_nodes]
+                expression_runs.append((statement_runs[0], statement_runs[1:]))
+
+        def run(context : Context) -> Value:
+            values = []
+            for first_run, other_runs in expression_runs:
+                values.append(first_run(context))
+                for other_run in other_runs:
+                    other_run(context)
+            return String(interpolated(texts, values))
+        return run
+    
+    def compile_body(self, node, is_statement : bool):
+        if not is_statement or not isinstance(node, ListNode) or not node.elements_nodes: return self.compile(node)
+        statement_runs = [self.compile(statement_node) for statement_node in node.elements_nodes]
+        if len(statement_runs) == 1: return statement_runs[0]
+
+        def run(context : Context) -> Value:
+            for statement_run in statement_runs:
+                statement_run(context)
+            return Boolean.null
+        return run
+
+    def compile_ListNode(self, node : ListNode):
+        element_runs = [self.compile(element_node) for element_node in node.elements_nodes]
+
+        def run(context : Context) -> Value:
+            return List([element_run(context) for element_run in element_runs])
+        return run
+    
+    def compile_BinOpNode(self, node : BinOpNode):
+        left_run = self.compile(node.left_node)
+        right_run = self.compile(node.right_node)
+        method_name = BINARY_METHODS[node.op_token.type]
+        operation, value_class = NUMBER_OPERATIONS[method_name]
+        operand_positions = [(node.left_node.pos_start, node.left_node.pos_end), (node.right_node.pos_start, node.right_node.pos_end)]
+
+        if node.op_token.type in SHORT_CIRCUIT_TYPES:
+            op_type = node.op_token.type
+
+            def run(context : Context) -> Value:
+                left = left_run(context)
+                value = decided_value(op_type, left)
+                if value is not None: return value
+
+                right = right_run(context)
+                method_result, error = getattr(left, method_name)(right)
+                if error: raise RunFailure(Value.locate_error(method_name, [left, right], operand_positions, context))
+                return method_result
+            return run
+
+        def run(context : Context) -> Value:
+            left = left_run(context)
+            right = right_run(context)
+
+            if left.__class__ is Number and right.__class__ is Number:
+                try:
+                    return value_class.of(operation(left.value, right.value))
+                except ZeroDivisionError:
+                    pass
+
+            method_result, error = getattr(left, method_name)(right)
+            if error: raise RunFailure(Value.locate_error(method_name, [left, right], operand_positions, context))
+            return method_result
+        return run
+    
+    def compile_UnaryOpNode(self, node : UnaryOpNode):
+        node_run = self.compile(node.node)
+        op_type = node.op_token.type
+        operand_positions = [(node.node.pos_start, node.node.pos_end), (None, None)]
+
+        def run(context : Context) -> Value:
+            number : Number = node_run(context)
+
+            if op_type == TT_MINUS:
+                method_name, operands = 'multiply', [number, Number.of(-1)]
+            elif op_type == TT_NOT:
+                method_name, operands = 'not_comp', [number]
+
+            number, error = getattr(operands[0], method_name)(*operands[1:])
+            if error: raise RunFailure(Value.locate_error(method_name, operands, operand_positions, context))
+            return number
+        return run
+    
+    def compile_VarAccessNode(self, node : VarAccessNode):
+        var_name = node.var_name_token.value
+        scope = self.resolver.scope_of(var_name, self.slot_indexes)
+        slot = self.slot_of(var_name)
+        bound_names = self.resolver.bound_names
+        pos_start, pos_end = node.pos_start, node.pos_end
+        getter_run, slice_runs = None, None
+
+        if node.slice_or_getter != None:
+            operand_positions = [(pos_start, pos_end)] + [(ope.pos_start, ope.pos_end) if ope != None else (None, None) for ope in node.slice_or_getter]
+            if len(node.slice_or_getter) == 1:
+                getter_run = self.compile(node.slice_or_getter[0])
+            elif len(node.slice_or_getter) == 2:
+                slice_runs = [self.compile(ope) if ope != None else None for ope in node.slice_or_getter]
+
+        def run(context : Context) -> Value:
+            symbol_table = context.symbol_table
+
+            # Locals are read from their slot and globals from the global symbol table, both fall back on the callers
+            if scope == SCOPE_LOCAL:
+                value : Value = symbol_table.values[slot]
+            elif scope == SCOPE_GLOBAL and var_name not in bound_names:
+                value : Value = symbol_table.root.symbols.get(var_name)
+            else:
+                value : Value = None
+            if value == None:
+                value = symbol_table.get(var_name)
+
+            if not value:
+                raise RunFailure(RTError(
+                    pos_start, pos_end,
+                    f"'{var_name}' is not defined",
+                    context
+                ))
+            
+            if getter_run:
+                ope1 : Number = getter_run(context)
+                getter_value, error = value.get(ope1)
+                if error: raise RunFailure(Value.locate_error('get', [value, ope1], operand_positions, context))
+                value = getter_value
+
+            elif slice_runs:
+                ope1 = slice_runs[0](context) if slice_runs[0] else None
+                ope2 = slice_runs[1](context) if slice_runs[1] else None
+
+                slice_value, error = value.get_slice(ope1, ope2)
+                if error: raise RunFailure(Value.locate_error('get_slice', [value, ope1, ope2], operand_positions, context))
+                value = slice_value
+            
+            return value
+        return run
+    
+    def compile_VarAssignNode(self, node : VarAssignNode):
+        var_name = node.var_name_token.value
+        slot = self.slot_of(var_name)
+        value_run = self.compile(node.value_node)
+
+        def run(context : Context) -> Value:
+            value = value_run(context)
+
+            if slot != None:
+                context.symbol_table.values[slot] = value
+            else:
+                context.symbol_table.set(var_name, value)
+            return value
+        return run
+    
+    def compile_IfNode(self, node : IfNode):
+        case_runs = [(self.compile(condition), self.compile(expression)) for condition, expression in node.cases]
+        else_run = self.compile(node.else_case) if node.else_case else None
+
+        def run(context : Context) -> Value:
+            for condition_run, expression_run in case_runs:
+                if condition_run(context).is_true():
+                    return expression_run(context)
+            
+            if else_run:
+                return else_run(context)
+            return None
+        return run
+    
+    def compile_ForNode(self, node : ForNode):
+        var_name = node.var_name_token.value
+        slot = self.slot_of(var_name)
+        start_run = self.compile(node.start_value_node)
+        end_run = self.compile(node.end_value_node)
+        step_run = self.compile(node.step_value_node) if node.step_value_node else None
+        body_run = self.compile_body(node.body_node, node.is_statement)
+        is_statement = node.is_statement
+        # A body that can't see the variable leaves the counter a python int until the loop ends
+        observed = var_observed(node)
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def run(context : Context) -> Value:
+            elements = []
+            budget = context.budget
+
+            start_value = start_run(context)
+            end_value = end_run(context)
+            if step_run:
+                step_value = step_run(context)
+            else:
+                step_value = Number(1 if start_value.value < end_value.value else -1)
+
+            symbol_table = context.symbol_table
+            i = None
+
+            for i in loop_range(start_value.value, end_value.value, step_value.value):
+                if observed:
+                    if slot != None: symbol_table.values[slot] = Number.of(i)
+                    else: symbol_table.set(var_name, Number.of(i))
+                error = budget and budget.tick()
+                if error:
+                    raise RunFailure(RTError(
+                        pos_start, pos_end,
+                        error,
+                        context
+                    ))
+
+                try:
+                    value = body_run(context)
+                except ContinueSignal:
+                    continue
+                except BreakSignal:
+                    break
+
+                if not is_statement: elements.append(value)
+
+            if not observed and i is not None:
+                if slot != None: symbol_table.values[slot] = Number.of(i)
+                else: symbol_table.set(var_name, Number.of(i))
+
+            if is_statement: return Boolean.null
+            return List(elements)
+        return run
+    
+    def compile_ForInNode(self, node : ForInNode):
+        var_name = node.var_name_token.value
+        slot = self.slot_of(var_name)
+        iterated_run = self.compile(node.iterated_value_node)
+        body_run = self.compile_body(node.body_node, node.is_statement)
+        is_statement = node.is_statement
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def run(context : Context) -> Value:
+            elements = []
+            budget = context.budget
+
+            iterated_value = iterated_run(context)
+            iterator = iterated_value.iterate() if isinstance(iterated_value, Value) else None
+            if iterator is None:
+                raise RunFailure(RTError(
+                    pos_start, pos_end,
+                    f"Can't iterate over {iterated_value}",
+                    context
+                ))
+            
+            symbol_table = context.symbol_table
+            for element in iterator:
+                if slot != None: symbol_table.values[slot] = element
+                else: symbol_table.set(var_name, element)
+                error = budget and budget.tick()
+                if error:
+                    raise RunFailure(RTError(
+                        pos_start, pos_end,
+                        error,
+                        context
+                    ))
+
+                try:
+                    value = body_run(context)
+                except ContinueSignal:
+                    continue
+                except BreakSignal:
+                    break
+
+                if not is_statement: elements.append(value)
+            
+            if isinstance(iterated_value, Iterator):
+                error = iterated_value.take_error()
+                if error: raise RunFailure(error)
+
+            if is_statement: return Boolean.null
+            return List(elements)
+        return run
+    
+    def compile_WhileNode(self, node : WhileNode):
+        condition_run = self.compile(node.condition_node)
+        body_run = self.compile_body(node.body_node, node.is_statement)
+        is_statement = node.is_statement
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def run(context : Context) -> Value:
+            elements = []
+            budget = context.budget
+
+            while True:
+                error = budget and budget.tick()
+                if error:
+                    raise RunFailure(RTError(
+                        pos_start, pos_end,
+                        error,
+                        context
+                    ))
+
+                if not condition_run(context).is_true(): break
+
+                try:
+                    value = body_run(context)
+                except ContinueSignal:
+                    continue
+                except BreakSignal:
+                    break
+
+                if not is_statement: elements.append(value)
+
+            if is_statement: return Boolean.null
+            return List(elements)
+        return run
+    
+    def compile_FuncDefNode(self, node : FuncDefNode):
+        func_name = node.var_name_token.value if node.var_name_token else None
+        body_node = node.body_node
+        auto_return = node.auto_return
+        is_generator = node.is_generator
+        default_runs = {}
+
+        for key, value in node.arg_name_tokens.items():
+            default_runs[key.value] = self.compile(value) if value != Boolean.null else None
+
+        # The body reads and writes its locals through the slots of its calls
+        slot_indexes = self.resolver.slot_indexes(node)
+        enclosing_slot_indexes, self.slot_indexes = self.slot_indexes, slot_indexes
+        # The body of a generator gives a python generator stopping at its yields
+        body_run = self.compile_suspending(body_node) if is_generator else self.compile(body_node)
+        self.slot_indexes = enclosing_slot_indexes
+        signature = Signature(list(default_runs), [default_run is None for default_run in default_runs.values()], [slot_indexes[arg_name] for arg_name in default_runs])
+
+        # Function.run_call takes the RTResult of the body, a generator's python generator returns it once finished
+        if is_generator:
+            def body(exec_context : Context):
+                return result_of_suspended(body_run, exec_context)
+        else:
+            def body(exec_context : Context) -> RTResult:
+                return result_of(body_run, exec_context)
+
+        def run(context : Context) -> Value:
+            arg_names = {}
+            for arg_name, default_run in default_runs.items():
+                arg_names[arg_name] = default_run(context) if default_run else None
+            
+            func_value = Function(func_name, body_node, arg_names, auto_return, body, slot_indexes, is_generator, signature)
+
+            if func_name:
+                context.symbol_table.set(func_name, func_value)
+            return func_value
+        return run
+    
+    def compile_CallNode(self, node : CallNode):
+        name_run = self.compile(node.name_node)
+        # Positional args then keyword args, as call_site binds them
+        arg_runs = []
+        call_site = node.call_site
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        for key, arg_node in node.args_nodes.items():
+            if key == Boolean.null:
+                arg_runs += [self.compile(positional_node) for positional_node in arg_node]
+            else:
+                arg_runs.append(self.compile(arg_node))
+
+        def run(context : Context) -> Value:
+            value_to_call = name_run(context)
+            values = [arg_run(context) for arg_run in arg_runs]
+            
+            try:
+                return value_of(value_to_call.call(values, call_site, context, pos_start, pos_end))
+            except RecursionError:
+                raise RunFailure(recursion_error(pos_start, pos_end, context))
+        return run
+    
+    def compile_ReturnNode(self, node : ReturnNode):
+        return_run = self.compile(node.return_node) if node.return_node else None
+
+        def run(context : Context) -> Value:
+            raise ReturnSignal(return_run(context) if return_run else Boolean.null)
+        return run
+    
+    def compile_ContinueNode(self, node : ContinueNode):
+        def run(context : Context) -> Value:
+            raise ContinueSignal()
+        return run
+    
+    def compile_BreakNode(self, node : BreakNode):
+        def run(context : Context) -> Value:
+            raise BreakSignal()
+        return run
+    
+    def compile_ImportNode(self, node : ImportNode):
+        interpreter = Interpreter()
+
+        def run(context : Context) -> Value:
+            return value_of(interpreter.visit_ImportNode(node, context))
+        return run
+
+    ######
+
+    # The generator functions give the value of their node once finished, result_of_suspended makes the RTResult of the body
+    def compile_suspending_body(self, node, is_statement : bool):
+        if not is_statement or not isinstance(node, ListNode): return self.compile_suspending(node)
+        statement_runs = [self.compile_step(statement_node) for statement_node in node.elements_nodes]
+
+        def run(context : Context):
+            for statement_run, suspends in statement_runs:
+                if suspends: yield from statement_run(context)
+                else: statement_run(context)
+            return Boolean.null
+        return run
+
+    def compile_suspending_ListNode(self, node : ListNode):
+        element_runs = [self.compile_step(element_node) for element_node in node.elements_nodes]
+
+        def run(context : Context):
+            elements = []
+            for element_run, suspends in element_runs:
+                elements.append((yield from element_run(context)) if suspends else element_run(context))
+            return List(elements)
+        return run
+
+    def compile_suspending_IfNode(self, node : IfNode):
+        case_runs = [(self.compile(condition), *self.compile_step(expression)) for condition, expression in node.cases]
+        else_run, else_suspends = self.compile_step(node.else_case) if node.else_case else (None, False)
+
+        def run(context : Context):
+            for condition_run, expression_run, suspends in case_runs:
+                if condition_run(context).is_true():
+                    return (yield from expression_run(context)) if suspends else expression_run(context)
+
+            if else_run:
+                return (yield from else_run(context)) if else_suspends else else_run(context)
+            return None
+        return run
+
+    def compile_suspending_ForNode(self, node : ForNode):
+        var_name = node.var_name_token.value
+        slot = self.slot_of(var_name)
+        start_run = self.compile(node.start_value_node)
+        end_run = self.compile(node.end_value_node)
+        step_run = self.compile(node.step_value_node) if node.step_value_node else None
+        body_run = self.compile_suspending_body(node.body_node, node.is_statement)
+        is_statement = node.is_statement
+        observed = var_observed(node)
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def run(context : Context):
+            elements = []
+            budget = context.budget
+
+            start_value = start_run(context)
+            end_value = end_run(context)
+            if step_run:
+                step_value = step_run(context)
+            else:
+                step_value = Number(1 if start_value.value < end_value.value else -1)
+
+            symbol_table = context.symbol_table
+            i = None
+
+            for i in loop_range(start_value.value, end_value.value, step_value.value):
+                if observed:
+                    if slot != None: symbol_table.values[slot] = Number.of(i)
+                    else: symbol_table.set(var_name, Number.of(i))
+                error = budget and budget.tick()
+                if error:
+                    raise RunFailure(RTError(
+                        pos_start, pos_end,
+                        error,
+                        context
+                    ))
+
+                try:
+                    value = yield from body_run(context)
+                except ContinueSignal:
+                    continue
+                except BreakSignal:
+                    break
+
+                if not is_statement: elements.append(value)
+
+            if not observed and i is not None:
+                if slot != None: symbol_table.values[slot] = Number.of(i)
+                else: symbol_table.set(var_name, Number.of(i))
+
+            if is_statement: return Boolean.null
+            return List(elements)
+        return run
+
+    def compile_suspending_ForInNode(self, node : ForInNode):
+        var_name = node.var_name_token.value
+        slot = self.slot_of(var_name)
+        iterated_run = self.compile(node.iterated_value_node)
+        body_run = self.compile_suspending_body(node.body_node, node.is_statement)
+        is_statement = node.is_statement
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def run(context : Context):
+            elements = []
+            budget = context.budget
+
+            iterated_value = iterated_run(context)
+            iterator = iterated_value.iterate() if isinstance(iterated_value, Value) else None
+            if iterator is None:
+                raise RunFailure(RTError(
+                    pos_start, pos_end,
+                    f"Can't iterate over {iterated_value}",
+                    context
+                ))
+
+            symbol_table = context.symbol_table
+            for element in iterator:
+                if slot != None: symbol_table.values[slot] = element
+                else: symbol_table.set(var_name, element)
+                error = budget and budget.tick()
+                if error:
+                    raise RunFailure(RTError(
+                        pos_start, pos_end,
+                        error,
+                        context
+                    ))
+
+                try:
+                    value = yield from body_run(context)
+                except ContinueSignal:
+                    continue
+                except BreakSignal:
+                    break
+
+                if not is_statement: elements.append(value)
+
+            if isinstance(iterated_value, Iterator):
+                error = iterated_value.take_error()
+                if error: raise RunFailure(error)
+
+            if is_statement: return Boolean.null
+            return List(elements)
+        return run
+
+    def compile_suspending_WhileNode(self, node : WhileNode):
+        condition_run = self.compile(node.condition_node)
+        body_run = self.compile_suspending_body(node.body_node, node.is_statement)
+        is_statement = node.is_statement
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def run(context : Context):
+            elements = []
+            budget = context.budget
+
+            while True:
+                error = budget and budget.tick()
+                if error:
+                    raise RunFailure(RTError(
+                        pos_start, pos_end,
+                        error,
+                        context
+                    ))
+
+                if not condition_run(context).is_true(): break
+
+                try:
+                    value = yield from body_run(context)
+                except ContinueSignal:
+                    continue
+                except BreakSignal:
+                    break
+
+                if not is_statement: elements.append(value)
+
+            if is_statement: return Boolean.null
+            return List(elements)
+        return run
+
+    def compile_suspending_YieldNode(self, node : YieldNode):
+        yield_run = self.compile(node.yield_node) if node.yield_node else None
+
+        def run(context : Context):
+            value = yield_run(context) if yield_run else None
+            if value is None: value = Boolean.null
+
+            yield value
+            return Boolean.null
+        return run
+
+###########
+# ! RUN ! #
+###########
+
+def _module_file_name(module_name : str, context : Context) -> str:
+    file_path = path.dirname(context.symbol_table.get("__file__").value) + "/"
+    return file_path + module_name.replace('.', '/') + '.pyl'
+
+def _import(file_name : str, reload : bool = False) -> str:
+    file_name = path.abspath(file_name)
+
+    if module_table.is_loading(file_name):
+        return f"Circular import of \"{file_name}\""
+
+    # * Run the module once, later imports reuse its symbols *
+    module = None if reload else module_table.get(file_name)
+    if module is None:
+        try:
+            with open(file_name, "r") as f:
+                script = f.read()
+            
+        except Exception as e:
+            return f"Failed to load script \"{file_name}\"\n" + str(e)
+
+        module = SymbolTable(global_symbol_table)
+        module_table.start_loading(file_name)
+        try:
+            _, error = _run(file_name, script, module)
+        finally:
+            module_table.stop_loading(file_name)
+
+        if error:
+            module_table.remove(file_name)
+            return f"Failed to finish executing script \"{file_name}\"\n {error}"
+        module_table.set(file_name, module)
+
+    # What a module defines is visible to the whole program
+    for name, value in module.symbols.items():
+        if name not in ('__name__', '__file__'):
+            global_symbol_table.set(name, value)
+    return None
+
+def _run(file_name : str, text : str, symbol_table : SymbolTable = SymbolTable(global_symbol_table), budget : Budget = None) -> tuple[Token, Error]:
+    use_cache = GLOBAL_CACHE and path.isfile(file_name)
+
+    # * Load cached AST *
+    node = load_memory_ast(file_name, text, GLOBAL_TESTING) if GLOBAL_MEMORY_CACHE else None
+    if node is None and use_cache: node = load_ast(file_name, text, GLOBAL_TESTING, GLOBAL_CACHE_DIR)
+
+    if node is None:
+        # Imported on the first file that is not cached, a program loaded from its .pylc file is never lexed nor parsed
+        from Core.FastLexer import FastLexer
+        from Core.PrattParser import PrattParser
+
+        # * Generate tokens *
+        lexer = FastLexer(file_name, text, GLOBAL_TESTING)
+        tokens, error = lexer.make_tokens()
+        if error: return None, error
+
+        #?print('> Tokens - ' + str(tokens))
+
+        # * Generate AST *
+        parser = PrattParser(tokens)
+        ast = parser.parse()
+        if ast.error: return None, ast.error
+        node = ast.node
+
+        if use_cache: save_ast(file_name, text, GLOBAL_TESTING, node, GLOBAL_CACHE_DIR)
+
+    if GLOBAL_MEMORY_CACHE: save_memory_ast(file_name, text, GLOBAL_TESTING, node)
+    
+    # The AST lives as long as the program, keep the collector from scanning it again and again
+    global _FreezeAST
+    if _FreezeAST:
+        _FreezeAST = False
+        gc.freeze()
+
+    #?print('> Nodes - ' + str(node))
+
+    # * Run program *
+    global _bound_names
+    context = _program_context(file_name, symbol_table, budget)
+    outer_budget, outer_names = Budget.running, _bound_names
+    if context.budget is not outer_budget:
+        context.budget.start()
+        Budget.running = context.budget
+    _bound_names = _run_names(symbol_table)
+    try:
+        result = _run_node(node, context)
+    finally:
+        Budget.running, _bound_names = outer_budget, outer_names
+
+
+    return result.value, result.error
+
+def _run_stream(file_name : str, file, symbol_table : SymbolTable = SymbolTable(global_symbol_table), budget : Budget = None) -> tuple[Token, Error]:
+    # Lexes, parses and runs a file object or an mmap a statement at a time,
+    # only the lines being lexed and the tokens of the statement being parsed are kept
+    from Core.FastLexer import StreamLexer
+    from Core.PrattParser import PrattParser
+    from Utils.TokenStream import TokenStream
+
+    lexer = StreamLexer(file_name, file, GLOBAL_TESTING)
+    parser = PrattParser(TokenStream(lexer.make_tokens()))
+
+    global _bound_names
+    context = _program_context(file_name, symbol_table, budget)
+    outer_budget, outer_names = Budget.running, _bound_names
+    if context.budget is not outer_budget:
+        context.budget.start()
+        Budget.running = context.budget
+    _bound_names = _run_names(symbol_table)
+    try:
+        for ast in parser.parse_statements():
+            if lexer.error: return None, lexer.error
+            if ast.error: return None, ast.error
+
+            result = _run_node(ListNode([ast.node], ast.node.pos_start, ast.node.pos_end), context)
+            if result.error: return None, result.error
+    finally:
+        Budget.running, _bound_names = outer_budget, outer_names
+
+    return None, lexer.error
+
+def _program_context(file_name : str, symbol_table : SymbolTable, budget : Budget) -> Context:
+    global _FileMain
+    context = Context('<program>')
+    context.symbol_table = symbol_table
+    if _FileMain:
+        context.symbol_table.set('__name__', String('__main__'))
+        _FileMain = False
+    else:
+        context.symbol_table.set('__name__', String(path.basename(file_name.strip('.pyl'))))
+    context.symbol_table.set('__file__', String(path.abspath(file_name)))
+
+    # Imported modules run within the budget of the program importing them
+    context.budget = budget or Budget.running or GLOBAL_BUDGET
+    return context
+
+# Names bound by the programs of the running run (Resolver.bound_names) : a program, the modules it imports
+# and the scripts it runs read each other's variables through their callers.
+# The set is kept by the table of the program, the lines of the shell run one after the other in the same table
+_bound_names : set = None
+
+def _run_names(symbol_table : SymbolTable) -> set:
+    if _bound_names != None: return _bound_names
+    if symbol_table.bound_names is None: symbol_table.bound_names = set(PROGRAM_NAMES)
+    return symbol_table.bound_names
+
+def _run_node(node, context : Context) -> RTResult:
+    if GLOBAL_FOLD: node = Folder().fold(node)
+
+    if GLOBAL_ENGINE == ENGINE_CLOSURE:
+        return ClosureCompiler(Resolver(_bound_names).resolve(node)).compile_program(node)(context)
+    elif GLOBAL_ENGINE == ENGINE_VM:
+        return VM().run(Compiler(Resolver(_bound_names).resolve(node)).compile_program(node), context)
+    elif GLOBAL_ENGINE == ENGINE_EXCEPTIONS:
+        return ExceptionCompiler(Resolver(_bound_names).resolve(node)).compile_program(node)(context)
+    return Interpreter().visit(node, context)
+        
+
+if __name__ == '__main__':
+    args = argv
+    if '-test' in args:
+        args.remove('-test')
+        GLOBAL_TESTING = True
+    
+    # Walk the AST with the Interpreter instead of compiling it to closures
+    if '-tree' in args:
+        args.remove('-tree')
+        GLOBAL_ENGINE = ENGINE_TREE
+
+    # Compile the AST to bytecode run by the VM
+    if '-vm' in args:
+        args.remove('-vm')
+        GLOBAL_ENGINE = ENGINE_VM
+
+    # Compile the AST to closures that raise errors, return, break and continue instead of returning RTResults
+    if '-exc' in args:
+        args.remove('-exc')
+        GLOBAL_ENGINE = ENGINE_EXCEPTIONS
+    
+    # Always lex and parse, without reading or writing .pylc files
+    if '-no-cache' in args:
+        args.remove('-no-cache')
+        GLOBAL_CACHE = False
+    
+    # Limits of the run : -max-steps=N -max-time=SECONDS -max-depth=N -max-memory=MB
+    GLOBAL_BUDGET = Budget.from_args(args)
+
+    # Run the AST as it is parsed, without computing its constant operations and if cases first
+    if '-no-fold' in args:
+        args.remove('-no-fold')
+        GLOBAL_FOLD = False
+
+    # Lex, parse and run the file a statement at a time, for files too big to be read at once
+    if '-stream' in args:
+        args.remove('-stream')
+        GLOBAL_STREAM = True
+
+    # Keep the .pylc files in one directory instead of __pylcache__ next to each script
+    for arg in args[:]:
+        if arg.startswith('-cache-dir='):
+            args.remove(arg)
+            GLOBAL_CACHE_DIR = arg[len('-cache-dir='):]
+
+    # Serve the scripts sent by client.py on a Unix socket, with the interpreter kept running between them
+    _server_address = None
+    for arg in args[:]:
+        if arg.startswith('-serve='):
+            args.remove(arg)
+            _server_address = arg[len('-serve='):]
+
+    if _server_address:
+        exec(open(path.join(path.dirname(path.abspath(__file__)), "server.py")).read())
+    elif len(args) == 1:
+        exec(open(path.dirname(args[0]) + "/shell.py").read())
+    elif len(args) == 2 and GLOBAL_STREAM:
+        import mmap
+        with open(args[1], 'rb') as file:
+            try:
+                source = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # An empty file can't be mapped
+                source = file
+            _, error = _run_stream(args[1], source)
+        if error: print(error)
+    elif len(args) == 2:
+        _FreezeAST = True
+        _, error = _run(args[1], open(args[1]).read())
+        if error: print(error)
 
-        _, error = _run(args[1], open(args[1]).read())
-        if error: print(error)
-    
-    for p in __import__('pathlib').Path(path.dirname(__file__)).rglob('*.py[co]'): p.unlink()
-    for p in __import__('pathlib').Path(path.dirname(__file__)).rglob('__pycache__'): p.rmdir()
         
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from sys import platform
+from time import perf_counter
+# The C part of tracemalloc, the module itself imports pickle
+from _tracemalloc import get_traced_memory, is_tracing
+
+try:
+    import resource
+except ImportError:
+    # No peak memory on Windows, max_memory is not enforced there
+    resource = None
+
+##############
+# ! BUDGET ! #
+##############
+
+class Budget:
+    # Limits of a run, None for no limit.
+    # A step is a loop iteration or a function call.
+    # Steps are counted on every tick, the clock and the memory are only read every CHECK_EVERY steps.
+    CHECK_EVERY = 1024
+
+    # Budget of the run in progress, imported modules and generators share it
+    running = None
+
+    def __init__(self, max_steps : int = None, max_time : float = None, max_depth : int = None, max_memory : int = None) -> None:
+        self.max_steps = max_steps
+        self.max_time = max_time        # seconds
+        self.max_depth = max_depth      # nested function calls
+        self.max_memory = max_memory    # peak memory of the process, or of the run when it is traced (server requests), in MB
+        self.start()
+
+    def start(self) -> None:
+        self.steps = 0
+        self.deadline = perf_counter() + self.max_time if self.max_time != None else None
+        self.next_check = self.next_check_after(0)
+
+    def next_check_after(self, steps : int) -> int:
+        next_check = steps + Budget.CHECK_EVERY
+        if self.max_steps != None: next_check = min(next_check, self.max_steps + 1)
+        return next_check
+
+    # Returns the error message of the limit reached, None while the run is within its budget
+    def tick(self) -> str:
+        self.steps += 1
+        if self.steps < self.next_check: return None
+        return self.check()
+
+    def check(self) -> str:
+        self.next_check = self.next_check_after(self.steps)
+
+        if self.max_steps != None and self.steps > self.max_steps:
+            return f"Step limit reached ({self.max_steps} steps)"
+        if self.deadline != None and perf_counter() > self.deadline:
+            return f"Time limit reached ({self.max_time} seconds)"
+        if self.max_memory != None and (resource or is_tracing()) and run_memory() > self.max_memory:
+            return f"Memory limit reached ({self.max_memory} MB)"
+        return None
+
+    def check_depth(self, depth : int) -> str:
+        if self.max_depth != None and depth > self.max_depth:
+            return f"Call depth limit reached ({self.max_depth} calls)"
+        return None
+
+    @staticmethod
+    def from_args(args : list[str]) -> Budget:
+        # -max-steps=N -max-time=SECONDS -max-depth=N -max-memory=MB, removed from args
+        limits = {}
+        for arg in args[:]:
+            for name, cast in (('steps', int), ('time', float), ('depth', int), ('memory', int)):
+                if arg.startswith(f'-max-{name}='):
+                    args.remove(arg)
+                    limits[f'max_{name}'] = cast(arg[len(f'-max-{name}='):])
+        return Budget(**limits) if limits else None
+
+# A server serves many runs, the peak of its process is the one of its heaviest run so far : it traces what each run allocates
+def run_memory() -> float:
+    if is_tracing(): return get_traced_memory()[1] / (1024 * 1024)
+    return peak_memory()
+
+def peak_memory() -> float:
+    # ru_maxrss is in KB on Linux and in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if platform == 'darwin' else peak / 1024
\ No newline at end of file
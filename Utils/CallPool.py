@@ -0,0 +1,66 @@
+from Utils.Context import Context
+from Utils.Frame import Frame
+from Utils.Position import Position
+from Utils.SymbolTable import SymbolTable
+
+#################
+# ! CALL POOL ! #
+#################
+
+# Contexts and symbol tables given back by the calls that returned, the next calls reuse them instead of making new ones.
+# Functions don't capture their scope, a call's context is only reached through the contexts made during the call :
+# a call gives it back when it succeeded and nothing made meanwhile kept a context (escapes didn't change).
+# A failed call keeps it for the traceback of its error, a generator keeps the context of its body and its callers.
+class CallPool:
+    # Deep recursions give back many contexts at once, only the last ones are kept
+    MAX_SIZE = 64
+
+    def __init__(self) -> None:
+        self.contexts = []
+        self.frames = []
+        self.tables = []
+        # Bumped whenever a context is kept past its call
+        self.escapes = 0
+
+    def acquire(self, display_name : str, parent : Context, pos_start : Position, pos_end : Position, slot_indexes : dict = None) -> Context:
+        if not self.contexts:
+            context = Context(display_name, parent, pos_start, pos_end)
+        else:
+            context = self.contexts.pop()
+            context.display_name = display_name
+            context.parent = parent
+            context.parent_entry_pos, context.parent_entry_end = pos_start, pos_end
+            context.budget = parent.budget
+            context.depth = parent.depth + 1
+
+        # Compiled functions keep their locals in the slots given by the Resolver
+        parent_table = parent.symbol_table
+        if slot_indexes != None:
+            if not self.frames: context.symbol_table = Frame(slot_indexes, parent_table)
+            else:
+                frame = context.symbol_table = self.frames.pop()
+                frame.parent, frame.root = parent_table, parent_table.root
+                frame.slot_indexes = slot_indexes
+                frame.values = [None] * len(slot_indexes)
+        elif not self.tables: context.symbol_table = SymbolTable(parent_table)
+        else:
+            table = context.symbol_table = self.tables.pop()
+            table.parent, table.root = parent_table, parent_table.root
+        return context
+
+    # Only for a context nothing else can reach, given back once
+    def release(self, context : Context) -> None:
+        table = context.symbol_table
+        table.parent = None
+        if table.symbols: table.symbols.clear()
+        if table.__class__ is Frame:
+            table.values = None
+            if table.found: table.found.clear()
+            if len(self.frames) < self.MAX_SIZE: self.frames.append(table)
+        elif table.__class__ is SymbolTable and len(self.tables) < self.MAX_SIZE:
+            self.tables.append(table)
+
+        context.parent = context.symbol_table = None
+        if len(self.contexts) < self.MAX_SIZE: self.contexts.append(context)
+
+call_pool = CallPool()
@@ -5,8 +5,12 @@ from Utils.SymbolTable import SymbolTable
 ###############
 
 class Context:
-    def __init__(self, display_name, parent=None, parent_entry_pos=None) -> None:
+    def __init__(self, display_name, parent=None, parent_entry_pos=None, parent_entry_end=None) -> None:
         self.display_name = display_name
         self.parent = parent
         self.parent_entry_pos = parent_entry_pos
-        self.symbol_table : SymbolTable = None
\ No newline at end of file
+        self.parent_entry_end = parent_entry_end
+        self.symbol_table : SymbolTable = None
+        # Limits of the run, shared by every call
+        self.budget = parent.budget if parent else None
+        self.depth = parent.depth + 1 if parent else 0
\ No newline at end of file
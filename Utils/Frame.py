@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from Utils.SymbolTable import SymbolTable
+
+#############
+# ! FRAME ! #
+#############
+
+class Frame(SymbolTable):
+    # Symbol table of a compiled function call : its locals live in slots given by the Resolver,
+    # the dict is only used for names set without a slot (string interpolation, imports)
+    def __init__(self, slot_indexes : dict, parent : SymbolTable = None) -> None:
+        super().__init__(parent)
+        self.slot_indexes = slot_indexes
+        self.values = [None] * len(slot_indexes)
+        # Values found in the parent chain, which can't change while this call runs (callers are suspended)
+        self.found = {}
+
+    def get(self, name : str):
+        index = self.slot_indexes.get(name)
+        if index != None:
+            value = self.values[index]
+            if value != None: return value
+
+        value = self.symbols.get(name, None)
+        if value != None: return value
+
+        value = self.found.get(name, None)
+        if value == None and self.parent:
+            value = self.find_in_callers(name)
+            # Imports can still change the global symbol table
+            if value != None and value is not self.root.symbols.get(name, None):
+                self.found[name] = value
+        return value
+
+    # The VM nests calls without nesting python calls, their frames are walked in a loop
+    def find_in_callers(self, name : str):
+        table = self.parent
+        while table.__class__ is Frame:
+            index = table.slot_indexes.get(name)
+            if index != None:
+                value = table.values[index]
+                if value != None: return value
+
+            value = table.symbols.get(name, None)
+            if value == None: value = table.found.get(name, None)
+            if value != None: return value
+            table = table.parent
+        return table.get(name) if table else None
+
+    def set(self, name : str, value) -> None:
+        index = self.slot_indexes.get(name)
+        if index != None:
+            self.values[index] = value
+        else:
+            self.symbols[name] = value
+
+    def remove(self, name : str) -> None:
+        index = self.slot_indexes.get(name)
+        if index != None:
+            self.values[index] = None
+        else:
+            del self.symbols[name]
+
+
+# Symbols of the functions a tail call left : the function called can still read them through its callers,
+# their frames are dropped so that a tail recursion keeps a single scope for all of them
+class TailScope(SymbolTable):
+    pass
+
+def tail_scope(frame : Frame) -> TailScope:
+    parent = frame.parent
+    if parent.__class__ is TailScope:
+        scope = TailScope(parent.parent)
+        scope.symbols.update(parent.symbols)
+    else:
+        scope = TailScope(parent)
+
+    scope.symbols.update(frame.symbols)
+    for name, index in frame.slot_indexes.items():
+        value = frame.values[index]
+        if value != None: scope.symbols[name] = value
+    return scope
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from os import path
+
+from Utils.SymbolTable import SymbolTable
+
+####################
+# ! MODULE TABLE ! #
+####################
+
+class ModuleTable:
+    # Symbols left by every imported module, keyed by absolute path like sys.modules
+    def __init__(self) -> None:
+        self.modules = {}
+        self.loading = set()
+
+    def get(self, file_name : str) -> SymbolTable:
+        return self.modules.get(path.abspath(file_name), None)
+
+    def set(self, file_name : str, symbol_table : SymbolTable) -> None:
+        self.modules[path.abspath(file_name)] = symbol_table
+
+    def remove(self, file_name : str) -> None:
+        self.modules.pop(path.abspath(file_name), None)
+
+    # A module imported again while it is still running is a circular import
+    def is_loading(self, file_name : str) -> bool:
+        return path.abspath(file_name) in self.loading
+
+    def start_loading(self, file_name : str) -> None:
+        self.loading.add(path.abspath(file_name))
+
+    def stop_loading(self, file_name : str) -> None:
+        self.loading.discard(path.abspath(file_name))
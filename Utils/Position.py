@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from bisect import bisect_right
+from itertools import accumulate
+
 ################
 # ! POSITION ! #
 ################
@@ -23,4 +26,56 @@ class Position:
         return self
     
     def copy(self) -> Position:
-        return Position(self.index, self.line, self.column, self.file_name, self.file_text)
\ No newline at end of file
+        return Position(self.index, self.line, self.column, self.file_name, self.file_text)
+
+class Source:
+    # Text of a file and where its lines start, shared by the positions of the fast lexer's tokens.
+    # A streamed file is lexed a part at a time, first_line is the line of the file its text starts on
+    def __init__(self, file_name : str, text : str, first_line : int = 0) -> None:
+        self.file_name = file_name
+        self.text = text
+        self.first_line = first_line
+        # Where lexing ended, the end of the tokens read in several characters
+        self.end_index = len(text)
+        self.line_starts = None
+
+    def line_column(self, index : int) -> tuple[int, int]:
+        if self.line_starts is None:
+            # Each line starts after the ones before it and their newline
+            self.line_starts = list(accumulate((len(line) + 1 for line in self.text.split('\n')), initial=0))[:-1]
+        line = bisect_right(self.line_starts, index) - 1
+        return self.first_line + line, index - self.line_starts[line]
+
+    def __getstate__(self) -> dict:
+        # Line starts are cheaper to find again than to unpickle
+        return {**self.__dict__, 'line_starts' : None}
+
+
+class LazyPosition(Position):
+    # Only keeps an index, the line and column are found when an error message reads them.
+    # after_char : the position right after the character before index, on its line (the end of a NEWLINE token)
+    def __init__(self, index : int, source : Source, after_char : bool = False) -> None:
+        self.index = index
+        self.source = source
+        self.after_char = after_char
+
+    def __getattr__(self, name : str):
+        if name in ('line', 'column'):
+            if self.after_char:
+                line, column = self.source.line_column(self.index - 1)
+                column += 1
+            else:
+                line, column = self.source.line_column(self.index)
+            self.line = line
+            self.column = column
+            return line if name == 'line' else column
+        if name == 'file_name':
+            return self.source.file_name
+        if name == 'file_text':
+            return self.source.text
+        raise AttributeError(name)
+
+    def copy(self) -> Position:
+        if 'line' in self.__dict__:
+            return super().copy()
+        return LazyPosition(self.index, self.source, self.after_char)
\ No newline at end of file
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from Errors.Error import Error
+from Utils.Context import Context
+from Utils.RTResult import RTResult
+
+###############
+# ! SIGNALS ! #
+###############
+
+# Runs of the ExceptionCompiler return plain values. Errors, return, break and continue are raised
+# up to the loop, function or program that handles them instead of being checked after every run.
+
+class RunFailure(Exception):
+    def __init__(self, error : Error) -> None:
+        self.error = error
+
+class ReturnSignal(Exception):
+    def __init__(self, value) -> None:
+        self.value = value
+
+class BreakSignal(Exception):
+    pass
+
+class ContinueSignal(Exception):
+    pass
+
+# Functions, builtins and programs still give and take RTResults, the signals are turned into them at their edges
+
+def result_of(run, context : Context) -> RTResult:
+    try:
+        return RTResult().success(run(context))
+    except RunFailure as failure:
+        return RTResult().failure(failure.error)
+    except ReturnSignal as signal:
+        return RTResult().success_return(signal.value)
+    except ContinueSignal:
+        return RTResult().success_continue()
+    except BreakSignal:
+        return RTResult().success_break()
+
+# Same for the body of a generator, run by a python generator stopping at its yields
+def result_of_suspended(run, context : Context):
+    try:
+        return RTResult().success((yield from run(context)))
+    except RunFailure as failure:
+        return RTResult().failure(failure.error)
+    except ReturnSignal as signal:
+        return RTResult().success_return(signal.value)
+    except ContinueSignal:
+        return RTResult().success_continue()
+    except BreakSignal:
+        return RTResult().success_break()
+
+def value_of(result : RTResult):
+    if result.error: raise RunFailure(result.error)
+    if result.func_return_value: raise ReturnSignal(result.func_return_value)
+    if result.loop_continue: raise ContinueSignal()
+    if result.loop_break: raise BreakSignal()
+    return result.value
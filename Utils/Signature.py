@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+#################
+# ! SIGNATURE ! #
+#################
+
+class Signature:
+    # Args of a function, made once per definition : their names, which ones are required (no default value)
+    # and, for a compiled function, the slot of each one
+    def __init__(self, arg_names : list[str], required : list[bool], slots : list[int] = None) -> None:
+        self.arg_names = tuple(arg_names)
+        self.required = tuple(required)
+        self.minimum_args = sum(self.required)
+        self.slots = tuple(slots) if slots != None else None
+        # Binding plans of the calls met, {(positional args count, keyword arg names) : plan}
+        self.plans = {}
+
+    # {name : default value, None when required} as functions keep their args
+    @staticmethod
+    def of(arg_names : dict, slot_indexes : dict = None) -> Signature:
+        slots = [slot_indexes[arg_name] for arg_name in arg_names] if slot_indexes != None else None
+        return Signature(list(arg_names), [default_value == None for default_value in arg_names.values()], slots)
+
+    def plan(self, positional_count : int, keyword_names : tuple) -> tuple:
+        key = (positional_count, keyword_names)
+        if key not in self.plans:
+            self.plans[key] = self.make_plan(positional_count, keyword_names)
+        return self.plans[key]
+
+    # For each arg, the index of its value among the values of a call (its positional args then its keyword args),
+    # None for its default value. The plan is None when check_args rejects the call, which then reports why
+    def make_plan(self, positional_count : int, keyword_names : tuple) -> tuple:
+        # The last value given for a keyword is the one kept
+        keyword_indexes = {arg_name : positional_count + index for index, arg_name in enumerate(keyword_names)}
+        if positional_count + len(keyword_indexes) > len(self.arg_names): return None
+        if any(arg_name not in self.arg_names for arg_name in keyword_indexes): return None
+
+        plan = []
+        for index, (arg_name, required) in enumerate(zip(self.arg_names, self.required)):
+            if index < positional_count:
+                if arg_name in keyword_indexes: return None
+                plan.append(index)
+            elif arg_name in keyword_indexes:
+                plan.append(keyword_indexes[arg_name])
+            elif required:
+                return None
+            else:
+                plan.append(None)
+        return tuple(plan)
+
+class CallSite:
+    # A call of the program, kept by its CallNode : how many positional args it gives, the names of its keyword args
+    # and the plan binding them to the args of the last signature it called
+    __slots__ = ('positional_count', 'keyword_names', 'args_count', 'cached')
+
+    def __init__(self, positional_count : int, keyword_names : list[str]) -> None:
+        self.positional_count = positional_count
+        self.keyword_names = tuple(keyword_names)
+        self.args_count = positional_count + len(self.keyword_names)
+        # (signature, plan), set at once as generators may share the site
+        self.cached = (None, None)
+
+    def plan_for(self, signature : Signature) -> tuple:
+        cached = self.cached
+        if cached[0] is signature: return cached[1]
+
+        plan = signature.plan(self.positional_count, self.keyword_names)
+        self.cached = (signature, plan)
+        return plan
+
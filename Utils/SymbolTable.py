@@ -5,9 +5,14 @@ from __future__ import annotations
 ####################
 
 class SymbolTable:
+    # Names bound by the programs run in the table (Resolver.bound_names), only set on the tables _run runs programs in
+    bound_names : set = None
+
     def __init__(self, parent : SymbolTable = None) -> None:
         self.symbols = {}
         self.parent = parent
+        # Global symbol table at the end of the parent chain
+        self.root = parent.root if parent else self
 
     def get(self, name : str):
         value = self.symbols.get(name, None)
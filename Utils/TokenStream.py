@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+from Utils.Token import Token
+
+####################
+# ! TOKEN STREAM ! #
+####################
+
+class TokenStream:
+    # Tokens pulled from a generator as the Parser reads them.
+    # Only the tokens from the last released index are kept, the Parser never goes back before it
+    def __init__(self, tokens : Iterator[Token]) -> None:
+        self.tokens = tokens
+        self.window = []
+        # Index of the first token of the window
+        self.offset = 0
+        self.finished = False
+
+    def __len__(self) -> int:
+        # One more than the tokens pulled until the generator is exhausted, so that the Parser asks for it
+        return self.offset + len(self.window) + (0 if self.finished else 1)
+
+    def __getitem__(self, index : int) -> Token:
+        if index < self.offset:
+            raise IndexError(f'Token {index} was released')
+
+        while index >= self.offset + len(self.window) and not self.finished:
+            token = next(self.tokens, None)
+            if token is None:
+                self.finished = True
+            else:
+                self.window.append(token)
+
+        # Past the end, the Parser keeps the last token (EOF) as current token
+        if index >= self.offset + len(self.window):
+            return self.window[-1]
+        return self.window[index - self.offset]
+
+    def release(self, index : int) -> None:
+        del self.window[:index - self.offset]
+        self.offset = index
@@ -1,8 +1,10 @@
 from Errors.RunTimeError import RTError
 
 from Utils.Context import Context
+from Utils.Position import Position
 from Utils.RTResult import RTResult
-from Utils.SymbolTable import SymbolTable
+from Utils.CallPool import call_pool
+from Utils.Signature import Signature, CallSite
 from Utils.Token import Token
 
 from Values.Value import Value
@@ -14,45 +16,143 @@ class BaseFunction(Value):
     def __init__(self, name : str) -> None:
         super().__init__()
         self.name = name or "<anonymous>"
-                 
-    def generate_new_context(self) -> Context:
-        new_context = Context(self.name, self.context, self.pos_start)
-        new_context.symbol_table = SymbolTable(new_context.parent.symbol_table)
-        return new_context
-    
-    def check_args(self, arg_names : dict, args : dict) -> RTResult:
+        # Set by the subclasses : {name : default value, None when required}, its Signature,
+        # the default values in the order of the args and the slots of the locals of a compiled body
+        self.arg_names : dict = None
+        self.signature : Signature = None
+        self.defaults : tuple = None
+        self.slot_indexes : dict = None
+
+    def set_args(self, arg_names : dict, signature : Signature = None) -> None:
+        self.arg_names = arg_names
+        self.signature = signature or Signature.of(arg_names, self.slot_indexes)
+        self.defaults = tuple(arg_names.values())
+
+    # Calls of the engines : the values of the call site's positional args then of its keyword args
+    def call(self, values : list, call_site : CallSite, context : Context, pos_start : Position, pos_end : Position) -> RTResult:
+        plan = call_site.plan_for(self.signature)
+        # check_args tells what is wrong with the call
+        if plan is None: return self.execute(self.args_of(values, call_site), context, pos_start, pos_end)
+
+        escapes = call_pool.escapes
+        exec_context = self.generate_new_context(context, pos_start, pos_end, self.slot_indexes)
+        if exec_context.budget:
+            result = self.check_budget(exec_context)
+            if result.error: return result
+        self.bind_args(plan, values, exec_context)
+        result = self.run_call(exec_context)
+
+        # The context goes back to the pool unless the error or a generator made by the call can still reach it
+        if not result.error and call_pool.escapes == escapes: call_pool.release(exec_context)
+        return result
+
+    # Calls given their args as {null : positional values, name : keyword value}
+    def execute(self, args : dict, context : Context, pos_start : Position, pos_end : Position) -> RTResult:
         result = RTResult()
+        exec_context = self.generate_new_context(context, pos_start, pos_end, self.slot_indexes)
 
-        minimum_args = len([0 for default_value in arg_names.values() if default_value != Boolean.null])
+        result.register(self.check_populate_args(self.arg_names, args, exec_context))
+        if result.error: return result
 
-        #* print(f"> minimum_args: {minimum_args}")
-        #* print(f"> len(args): {len(args)}")
-        #* print(f"> len(arg_names): {len(arg_names)}")
-        #* print(f"> args: {args}")
+        return self.run_call(exec_context)
 
-        
-        if len(args) > len(arg_names):
-            return result.failure(RTError(
-                self.pos_start, self.pos_end,
-                f"Too many args passed into '{self.name}'!\nNeeded {len(arg_names)}, given {len(args)}",
-                self.context
-            ))
-        elif len(args) < minimum_args:
+    # Runs the function once its args are bound in exec_context
+    def run_call(self, exec_context : Context) -> RTResult:
+        raise Exception(f'No run_call method defined for {self.name}')
+
+    def bind_args(self, plan : tuple, values : list, exec_context : Context) -> None:
+        slots = self.signature.slots
+        if slots != None:
+            frame_values = exec_context.symbol_table.values
+            for slot, index, default_value in zip(slots, plan, self.defaults):
+                frame_values[slot] = default_value if index is None else values[index]
+        else:
+            symbol_table = exec_context.symbol_table
+            for arg_name, index, default_value in zip(self.signature.arg_names, plan, self.defaults):
+                symbol_table.set(arg_name, default_value if index is None else values[index])
+
+    @staticmethod
+    def args_of(values : list, call_site : CallSite) -> dict:
+        args = {Boolean.null : values[:call_site.positional_count]}
+        for arg_name, value in zip(call_site.keyword_names, values[call_site.positional_count:]):
+            args[arg_name] = value
+        return args
+
+    # Calls pass the caller's context and position instead of setting them on a copy of the function
+    def generate_new_context(self, context : Context, pos_start : Position, pos_end : Position, slot_indexes : dict = None) -> Context:
+        return call_pool.acquire(self.name, context, pos_start, pos_end, slot_indexes)
+    
+    # Every call is a step of the run and goes one level deeper
+    def check_budget(self, execution_context : Context) -> RTResult:
+        result = RTResult()
+        budget = execution_context.budget
+        if budget:
+            error = budget.tick() or budget.check_depth(execution_context.depth)
+            if error:
+                return result.failure(RTError(
+                    execution_context.parent_entry_pos, execution_context.parent_entry_end,
+                    error,
+                    execution_context.parent
+                ))
+        return result.success(None)
+    
+    def check_args(self, arg_names : dict, args : dict, execution_context : Context) -> RTResult:
+        result = RTResult()
+
+        # Required args have no default value (None)
+        minimum_args = self.signature.minimum_args
+        positional_args = args.get(Boolean.null, [])
+        keyword_args = [name for name in args if name != Boolean.null]
+        given_args = len(positional_args) + len(keyword_args)
+
+        if given_args > len(arg_names):
             return result.failure(RTError(
-                self.pos_start, self.pos_end,
-                f"Too few args passed into '{self.name}'!\nNeeded at least {minimum_args}, given {len(args)}",
-                self.context
+                execution_context.parent_entry_pos, execution_context.parent_entry_end,
+                f"Too many args passed into '{self.name}'!\nNeeded {len(arg_names)}, given {given_args}",
+                execution_context.parent
             ))
+        
+        for index, arg_name in enumerate(arg_names):
+            if arg_name in keyword_args and index < len(positional_args):
+                return result.failure(RTError(
+                    execution_context.parent_entry_pos, execution_context.parent_entry_end,
+                    f"Multiple values for arg '{arg_name}' passed into '{self.name}'!",
+                    execution_context.parent
+                ))
+        
+        for arg_name in keyword_args:
+            if arg_name not in arg_names:
+                return result.failure(RTError(
+                    execution_context.parent_entry_pos, execution_context.parent_entry_end,
+                    f"Unexpected arg '{arg_name}' passed into '{self.name}'!",
+                    execution_context.parent
+                ))
+
+        for index, (arg_name, default_value) in enumerate(arg_names.items()):
+            if default_value == None and index >= len(positional_args) and arg_name not in keyword_args:
+                return result.failure(RTError(
+                    execution_context.parent_entry_pos, execution_context.parent_entry_end,
+                    f"Too few args passed into '{self.name}'!\nNeeded at least {minimum_args}, given {given_args}",
+                    execution_context.parent
+                ))
         return result.success(None)
     
     def populate_args(self, arg_names : dict, args : dict, execution_context : Context):
-        # TODO
-        print("TODO: populate_args")
-        pass
+        positional_args = args.get(Boolean.null, [])
+
+        for index, (arg_name, default_value) in enumerate(arg_names.items()):
+            if index < len(positional_args):
+                arg_value = positional_args[index]
+            else:
+                arg_value = args.get(arg_name, default_value)
+            
+            execution_context.symbol_table.set(arg_name, arg_value)
     
     def check_populate_args(self, arg_names : dict, args : dict, execution_context : Context) -> RTResult:
         result = RTResult()
-        result.register(self.check_args(arg_names, args))
+        result.register(self.check_budget(execution_context))
+        if result.error: return result
+        result.register(self.check_args(arg_names, args, execution_context))
         if result.error: return result
         self.populate_args(arg_names, args, execution_context)
-        return result.success(None)
\ No newline at end of file
+        return result.success(None)
@@ -5,41 +5,53 @@ from Values.Value import Value
 
 
 class Boolean(Value):
+    __slots__ = ('value',)
+
     def __init__(self, value : str) -> None:
-        super().__init__()
         self.value = value
 
+    # Result of an operation, comparisons give the shared true and false (set in Core.Constants)
+    @staticmethod
+    def of(value) -> Boolean:
+        if value is True: return Boolean.true
+        if value is False: return Boolean.false
+        return Boolean(value)
+
     def get_comparison_eq(self, other : Boolean) -> tuple[Boolean, RTError]:
         if isinstance(other, Boolean):
-            return Boolean(self.value == other.value).set_context(self.context), None
+            return Boolean.of(self.value == other.value), None
         return None, Value.illegal_operation(self, other)
     
     def get_comparison_ne(self, other : Boolean) -> tuple[Boolean, RTError]:
         if isinstance(other, Boolean):
-            return Boolean(self.value != other.value).set_context(self.context), None
+            return Boolean.of(self.value != other.value), None
         return None, Value.illegal_operation(self, other)
     
     def get_and(self, other : Boolean) -> tuple[Boolean, RTError]:
         if isinstance(other, Boolean):
-            return Boolean(self.value and other.value).set_context(self.context), None
+            return Boolean.of(self.value and other.value), None
         return None, Value.illegal_operation(self, other)
     
     def get_or(self, other : Boolean) -> tuple[Boolean, RTError]:
         if isinstance(other, Boolean):
-            return Boolean(self.value or other.value).set_context(self.context), None
+            return Boolean.of(self.value or other.value), None
         return None, Value.illegal_operation(self, other)
     
     def not_comp(self) -> tuple[Boolean, RTError]:
-        return Boolean(not self.value).set_context(self.context), None
+        return Boolean.of(not self.value), None
     
     def is_true(self) -> bool:
         return self.value
     
+    def __reduce__(self) -> tuple:
+        # null, true and false keep their identity once unpickled
+        for name in ('null', 'true', 'false'):
+            if self is getattr(Boolean, name, None):
+                return (getattr, (Boolean, name))
+        return (Boolean, (self.value,))
+    
     def copy(self) -> Boolean:
-        copy = Boolean(self.value)
-        copy.set_pos(self.pos_start, self.pos_end)
-        copy.set_context(self.context)
-        return copy
+        return Boolean(self.value)
     
     def __str__(self) -> str:
         return f"{self.value}"
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from Utils.CallPool import call_pool
+from Utils.Context import Context
+from Values.Iterator import Iterator
+
+
+class Generator(Iterator):
+    # Returned by the call of a function with a yield in its body, the body only runs when values are pulled.
+    # body is a python generator running the function's body : each engine stops it at a yield with the value
+    # (the VM keeps its frame, the other engines walk the nodes of the body with python generators)
+    # and it returns the RTResult of the body once finished
+    __slots__ = ('name', 'body', 'found')
+
+    def __init__(self, name : str, body, context : Context) -> None:
+        super().__init__(None)
+        self.name = name
+        self.body = body
+        # Values the body found in its callers, which may have changed them while it was stopped
+        self.found = getattr(context.symbol_table, 'found', None)
+        # The body runs in the context of the call and reads its callers' variables, none of them go back to the pool
+        call_pool.escapes += 1
+
+    def iterate(self):
+        return self
+
+    def __iter__(self) -> Generator:
+        return self
+
+    def __next__(self):
+        if self.found: self.found.clear()
+        try:
+            return next(self.body)
+        except StopIteration as stop:
+            if stop.value: self.error = stop.value.error
+            raise StopIteration
+
+    def copy(self) -> Iterator:
+        return Iterator(self)
+
+    def __repr__(self) -> str:
+        return f'<generator {self.name}>'
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from Errors.RunTimeError import RTError
+from Values.Value import Value
+
+
+class Iterator(Value):
+    # Values pulled one at a time by for-in loops, from a Python iterator
+    __slots__ = ('iterator', 'error', 'value')
+
+    def __init__(self, iterator) -> None:
+        self.iterator = iterator
+        # Error of the source of the values, read by the loop that pulled its last value
+        self.error : RTError = None
+        self.value = None
+
+    def iterate(self):
+        return self.iterator
+
+    def take_error(self) -> RTError:
+        error, self.error = self.error, None
+        return error
+
+    def is_true(self) -> bool:
+        return True
+
+    # Iterators are shared by reference, a copy pulls from the same source
+    def copy(self) -> Iterator:
+        return Iterator(self.iterator)
+
+    def __repr__(self) -> str:
+        return '<iterator>'
\ No newline at end of file
@@ -7,23 +7,20 @@ from Values.Value import Value
 
 
 class List(Value):
+    __slots__ = ('elements', 'value')
+
     def __init__(self, elements : list) -> None:
-        super().__init__()
         self.elements = elements
         self.value = []
     
     def multiply(self, other : Number) -> tuple[List, RTError]:
         if isinstance(other, Number):
-            new_list = self.copy()
-            new_list.elements *= other.value
-            return new_list, None
+            return List(self.elements * other.value), None
         return None, Value.illegal_operation(self, other)
     
     def add(self, other : List) -> tuple[List, RTError]:
         if isinstance(other, List):
-            new_list = self.copy()
-            new_list.elements.extend(other.elements)
-            return new_list, None
+            return List(self.elements + other.elements), None
         return None, Value.illegal_operation(self, other)
     
     def get(self, index : Number) -> tuple[Value, RTError]:
@@ -40,16 +37,18 @@ class List(Value):
                 return None, RTError(start.pos_start, start.pos_end, f'Start index {start.value} out of range', self.context)
             if end.value > len(self.elements):
                 return None, RTError(end.pos_start, end.pos_end, f'End index {end.value} out of range', self.context)
-            new_list = self.copy()
-            new_list.elements = new_list.elements[start.value:end.value]
-            return new_list, None
+            return List(self.elements[start.value:end.value]), None
         return None, Value.illegal_operation(self, start)
     
+    def length(self) -> int:
+        return len(self.elements)
+    
+    def iterate(self):
+        return iter(self.elements)
+    
+    # Lists are shared by reference, a copy is the same list at another position
     def copy(self) -> List:
-        copy = List(self.elements[:])
-        copy.set_pos(self.pos_start, self.pos_end)
-        copy.set_context(self.context)
-        return copy
+        return List(self.elements)
     
     def __repr__(self) -> str:
         return f'[{", ".join([str(element) for element in self.elements])}]'
\ No newline at end of file
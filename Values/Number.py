@@ -1,46 +1,47 @@
 from __future__ import annotations
 
-from Errors.RunTimeError import RTError
+import operator
 
-from Utils.Context import Context
-from Utils.Position import Position
+from Errors.RunTimeError import RTError
 
 from Values.Value import Value
 from Values.Boolean import Boolean
 
 
+# Ints shared by every operation that gives them
+SMALL_INT_MIN = -5
+SMALL_INT_MAX = 256
+
 class Number(Value):
+    __slots__ = ('value',)
+
     def __init__(self, value : int | float) -> None:
         self.value = value
-        self.set_pos()
-        self.set_context()
 
-    def set_pos(self, pos_start : Position = None, pos_end : Position = None) -> Number:
-        self.pos_start = pos_start
-        self.pos_end = pos_end
-        return self
-    
-    def set_context(self, context : Context = None) -> Context:
-        self.context = context
-        return self
+    # Result of an operation, small ints are the shared ones
+    @staticmethod
+    def of(value : int | float) -> Number:
+        if value.__class__ is int and SMALL_INT_MIN <= value <= SMALL_INT_MAX:
+            return SMALL_NUMBERS[value - SMALL_INT_MIN]
+        return Number(value)
 
     def add(self, other : Number) -> tuple[Number, RTError]:
         if isinstance(other, Number):
-            return Number(self.value + other.value).set_context(self.context), None
+            return Number.of(self.value + other.value), None
         else:
-            return None, Value.illegal_operation(self.pos_start, other.pos_end)
+            return None, Value.illegal_operation(self, other)
     
     def subtract(self, other : Number) -> tuple[Number, RTError]:
         if isinstance(other, Number):
-            return Number(self.value - other.value).set_context(self.context), None
+            return Number.of(self.value - other.value), None
         else:
-            return None, Value.illegal_operation(self.pos_start, other.pos_end)
+            return None, Value.illegal_operation(self, other)
     
     def multiply(self, other : Number) -> tuple[Number, RTError]:
         if isinstance(other, Number):
-            return Number(self.value * other.value).set_context(self.context), None
+            return Number.of(self.value * other.value), None
         else:
-            return None, Value.illegal_operation(self.pos_start, other.pos_end)
+            return None, Value.illegal_operation(self, other)
     
     def divide(self, other : Number) -> tuple[Number, RTError]:
         if isinstance(other, Number):
@@ -50,9 +51,9 @@ class Number(Value):
                     "Division by zero",
                     self.context
                 )
-            return Number(self.value / other.value).set_context(self.context), None
+            return Number.of(self.value / other.value), None
         else:
-            return None, Value.illegal_operation(self.pos_start, other.pos_end)
+            return None, Value.illegal_operation(self, other)
     
     def modulo(self, other : Number) -> tuple[Number, RTError]:
         if isinstance(other, Number):
@@ -62,9 +63,9 @@ class Number(Value):
                     "Division by zero",
                     self.context
                 )
-            return Number(self.value % other.value).set_context(self.context), None
+            return Number.of(self.value % other.value), None
         else:
-            return None, Value.illegal_operation(self.pos_start, other.pos_end)
+            return None, Value.illegal_operation(self, other)
     
     def quotient(self, other : Number) -> tuple[Number, RTError]:
         if isinstance(other, Number):
@@ -74,69 +75,88 @@ class Number(Value):
                     "Division by zero",
                     self.context
                 )
-            return Number(self.value // other.value).set_context(self.context), None
+            return Number.of(self.value // other.value), None
         else:
-            return None, Value.illegal_operation(self.pos_start, other.pos_end)
+            return None, Value.illegal_operation(self, other)
         
     def power(self, other) -> tuple[Number, RTError]:
         if isinstance(other, Number):
-            return Number(self.value ** other.value).set_context(self.context), None
+            return Number.of(self.value ** other.value), None
         else:
-            return None, Value.illegal_operation(self.pos_start, other.pos_end)
+            return None, Value.illegal_operation(self, other)
     
     def copy(self) -> Number:
-        copy = Number(self.value)
-        copy.set_pos(self.pos_start, self.pos_end)
-        copy.set_context(self.context)
-        return copy
+        return Number(self.value)
     
     def get_comparison_eq(self, other) -> tuple[Boolean, RTError]:
         if isinstance(other, Number):
-            return Boolean(self.value == other.value).set_context(self.context), None
+            return Boolean.of(self.value == other.value), None
         else:
-            return None, Value.illegal_operation(self.pos_start, other.pos_end)
+            return None, Value.illegal_operation(self, other)
     
     def get_comparison_ne(self, other) -> tuple[Boolean, RTError]:
         if isinstance(other, Number):
-            return Boolean(self.value != other.value).set_context(self.context), None
+            return Boolean.of(self.value != other.value), None
         else:
-            return None, Value.illegal_operation(self.pos_start, other.pos_end)
+            return None, Value.illegal_operation(self, other)
     
     def get_comparison_lt(self, other) -> tuple[Boolean, RTError]:
         if isinstance(other, Number):
-            return Boolean(self.value < other.value).set_context(self.context), None
+            return Boolean.of(self.value < other.value), None
         else:
-            return None, Value.illegal_operation(self.pos_start, other.pos_end)
+            return None, Value.illegal_operation(self, other)
     
     def get_comparison_gt(self, other) -> tuple[Boolean, RTError]:
         if isinstance(other, Number):
-            return Boolean(self.value > other.value).set_context(self.context), None
+            return Boolean.of(self.value > other.value), None
         else:
-            return None, Value.illegal_operation(self.pos_start, other.pos_end)
+            return None, Value.illegal_operation(self, other)
     
     def get_comparison_lte(self, other) -> tuple[Boolean, RTError]:
         if isinstance(other, Number):
-            return Boolean(self.value <= other.value).set_context(self.context), None
+            return Boolean.of(self.value <= other.value), None
         else:
-            return None, Value.illegal_operation(self.pos_start, other.pos_end)
+            return None, Value.illegal_operation(self, other)
     
     def get_comparison_gte(self, other) -> tuple[Boolean, RTError]:
         if isinstance(other, Number):
-            return Boolean(self.value >= other.value).set_context(self.context), None
+            return Boolean.of(self.value >= other.value), None
         else:
-            return None, Value.illegal_operation(self.pos_start, other.pos_end)
+            return None, Value.illegal_operation(self, other)
     
     def get_and(self, other) -> tuple[Boolean, RTError]:
         if isinstance(other, Number):
-            return Boolean(self.value and other.value).set_context(self.context), None
+            return Boolean.of(self.value and other.value), None
         else:
-            return None, Value.illegal_operation(self.pos_start, other.pos_end)
+            return None, Value.illegal_operation(self, other)
         
     def get_or(self, other) -> tuple[Boolean, RTError]:
         if isinstance(other, Number):
-            return Boolean(self.value or other.value).set_context(self.context), None
+            return Boolean.of(self.value or other.value), None
         else:
-            return None, Value.illegal_operation(self.pos_start, other.pos_end)
+            return None, Value.illegal_operation(self, other)
     
     def __repr__(self) -> str:
         return f'{self.value}'
+
+SMALL_NUMBERS = [Number(value) for value in range(SMALL_INT_MIN, SMALL_INT_MAX + 1)]
+
+# Operations of two numbers on their Python values and the class of their result, run by the engines instead of the methods above.
+# A ZeroDivisionError is left to the methods, which make its error
+NUMBER_OPERATIONS = {
+    'add'                   : (operator.add,        Number),
+    'subtract'              : (operator.sub,        Number),
+    'multiply'              : (operator.mul,        Number),
+    'divide'                : (operator.truediv,    Number),
+    'modulo'                : (operator.mod,        Number),
+    'quotient'              : (operator.floordiv,   Number),
+    'power'                 : (operator.pow,        Number),
+    'get_comparison_eq'     : (operator.eq,         Boolean),
+    'get_comparison_ne'     : (operator.ne,         Boolean),
+    'get_comparison_lt'     : (operator.lt,         Boolean),
+    'get_comparison_gt'     : (operator.gt,         Boolean),
+    'get_comparison_lte'    : (operator.le,         Boolean),
+    'get_comparison_gte'    : (operator.ge,         Boolean),
+    'get_and'               : (lambda a, b: a and b, Boolean),
+    'get_or'                : (lambda a, b: a or b,  Boolean),
+}
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from Errors.RunTimeError import RTError
+from Values.List import List
+from Values.Number import Number
+from Values.Value import Value
+
+# Numbers from start to end, each one the previous one plus the step : float ranges and for loops round the same way
+def stepped_range(start : int | float, end : int | float, step : int | float):
+    i = start
+    while (i < end) if step >= 0 else (i > end):
+        yield i
+        i += step
+
+class Range(List):
+    # The numbers of range() are computed when they are read, the list is only built when it is needed
+    # (printing aside, by the builtins and operations that mutate or copy elements)
+    __slots__ = ('start', 'step', 'length_', 'materialized')
+
+    def __init__(self, start : int | float, step : int | float, length : int) -> None:
+        self.start = start
+        self.step = step
+        self.length_ = length
+        self.materialized = None
+        self.value = []
+
+    @staticmethod
+    def from_bounds(start : int | float, end : int | float, step : int | float) -> Range:
+        if isinstance(start, int) and isinstance(end, int) and isinstance(step, int):
+            return Range(start, step, len(range(start, end, step)))
+
+        # start + i * step rounds differently than the additions of stepped_range, the numbers are built as for loops make them
+        numbers = [Number.of(i) for i in stepped_range(start, end, step)]
+        range_value = Range(start, step, len(numbers))
+        range_value.materialized = numbers
+        return range_value
+
+    @property
+    def elements(self) -> list:
+        if self.materialized is None:
+            self.materialized = [Number.of(self.number_at(i)) for i in range(self.length_)]
+        return self.materialized
+
+    @elements.setter
+    def elements(self, elements : list) -> None:
+        self.materialized = elements
+
+    def number_at(self, i : int) -> int | float:
+        # The first number is the start as given, like the list range() used to build
+        if i == 0: return self.start
+        return self.start + i * self.step
+
+    def length(self) -> int:
+        if self.materialized is not None: return len(self.materialized)
+        return self.length_
+
+    def iterate(self):
+        if self.materialized is not None: return iter(self.materialized)
+        return (Number.of(self.number_at(i)) for i in range(self.length_))
+
+    def get(self, index : Number) -> tuple[Value, RTError]:
+        if self.materialized is not None: return super().get(index)
+        if isinstance(index, Number):
+            if isinstance(index.value, int) and -self.length_ <= index.value < self.length_:
+                return Number.of(self.number_at(index.value % self.length_)), None
+            return None, RTError(index.pos_start, index.pos_end, f'Index {index.value} out of range', self.context)
+        return None, Value.illegal_operation(self, index)
+
+    def get_slice(self, start : Number | None, end : Number | None) -> tuple[List, RTError]:
+        if self.materialized is not None: return super().get_slice(start, end)
+        if isinstance(start, Number) and isinstance(end, Number):
+            if start.value > self.length_:
+                return None, RTError(start.pos_start, start.pos_end, f'Start index {start.value} out of range', self.context)
+            if end.value > self.length_:
+                return None, RTError(end.pos_start, end.pos_end, f'End index {end.value} out of range', self.context)
+            indexes = range(self.length_)[start.value:end.value]
+            return Range(self.number_at(indexes.start), self.step, len(indexes)), None
+        return None, Value.illegal_operation(self, start)
+
+    def copy(self) -> List:
+        if self.materialized is not None: return super().copy()
+        return Range(self.start, self.step, self.length_)
+
+    def __repr__(self) -> str:
+        return f'[{", ".join([str(element) for element in self.iterate()])}]'
@@ -8,48 +8,49 @@ from Values.Value import Value
 
 
 class String(Value):
+    __slots__ = ('value',)
+
     def __init__(self, value : str) -> None:
-        super().__init__()
         self.value = value
 
     def add(self, other : String) -> tuple[String, RTError]:
         if isinstance(other, String):
-            return String(self.value + other.value).set_context(self.context), None
+            return String(self.value + other.value), None
         return None, Value.illegal_operation(self, other)
     
     def multiply(self, other : Number) -> tuple[String, RTError]:
         if isinstance(other, Number):
-            return String(self.value * other.value).set_context(self.context), None
+            return String(self.value * other.value), None
         return None, Value.illegal_operation(self, other)
     
     def get_comparison_eq(self, other : String) -> tuple[Boolean, RTError]:
         if isinstance(other, String):
-            return Boolean(self.value == other.value).set_context(self.context), None
+            return Boolean.of(self.value == other.value), None
         return None, Value.illegal_operation(self, other)
     
     def get_comparison_ne(self, other : String) -> tuple[Boolean, RTError]:
         if isinstance(other, String):
-            return Boolean(self.value != other.value).set_context(self.context), None
+            return Boolean.of(self.value != other.value), None
         return None, Value.illegal_operation(self, other)
     
     def get_comparison_lt(self, other : String) -> tuple[Boolean, RTError]:
         if isinstance(other, String):
-            return Boolean(self.value < other.value).set_context(self.context), None
+            return Boolean.of(self.value < other.value), None
         return None, Value.illegal_operation(self, other)
     
     def get_comparison_gt(self, other : String) -> tuple[Boolean, RTError]:
         if isinstance(other, String):
-            return Boolean(self.value > other.value).set_context(self.context), None
+            return Boolean.of(self.value > other.value), None
         return None, Value.illegal_operation(self, other)
     
     def get_comparison_lte(self, other : String) -> tuple[Boolean, RTError]:
         if isinstance(other, String):
-            return Boolean(self.value <= other.value).set_context(self.context), None
+            return Boolean.of(self.value <= other.value), None
         return None, Value.illegal_operation(self, other)
     
     def get_comparison_gte(self, other : String) -> tuple[Boolean, RTError]:
         if isinstance(other, String):
-            return Boolean(self.value >= other.value).set_context(self.context), None
+            return Boolean.of(self.value >= other.value), None
         return None, Value.illegal_operation(self, other)
     
     def is_true(self) -> bool:
@@ -58,7 +59,7 @@ class String(Value):
     def get(self, index : Number) -> tuple[String, RTError]:
         if isinstance(index, Number):
             try:
-                return String(self.value[index.value]).set_context(self.context), None
+                return String(self.value[index.value]), None
             except:
                 return None, RTError(index.pos_start, index.pos_end, f'Index {index.value} out of range', self.context)
         return None, Value.illegal_operation(self, index)
@@ -70,19 +71,28 @@ class String(Value):
             end = Number(len(self.value))
         if isinstance(start, Number) and isinstance(end, Number):
             try:
-                return String(self.value[start.value:end.value]).set_context(self.context), None
+                return String(self.value[start.value:end.value]), None
             except:
                 return None, RTError(start.pos_start, end.pos_end, 'Slice index out of range', self.context)
         return None, Value.illegal_operation(self, start)
     
+    # One character at a time
+    def iterate(self):
+        return (String(char) for char in self.value)
+    
     def copy(self) -> String:
-        copy = String(self.value)
-        copy.set_pos(self.pos_start, self.pos_end)
-        copy.set_context(self.context)
-        return copy
+        return String(self.value)
     
     def __str__(self) -> str:
         return f"{self.value}"
     
     def __repr__(self) -> str:
-        return f'"{self.value}"'
\ No newline at end of file
+        return f'"{self.value}"'
+
+# Texts of an interpolated string with the values of its expressions between them, joined at once
+def interpolated(texts : list[str], values : list) -> str:
+    parts = [texts[0]]
+    for value, text in zip(values, texts[1:]):
+        parts.append(str(value))
+        parts.append(text)
+    return ''.join(parts)
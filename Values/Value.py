@@ -8,18 +8,34 @@ from Utils.Position import Position
 # ! VALUES ! #
 ##############
 
+# Positions and context of the values an error is built from, (pos_start, pos_end, context) by value.
+# Values are made without them : the engines keep the positions of the operands of each node,
+# and locate_error places copies of the operands there when an operation fails.
+LOCATIONS = {}
+NOWHERE = (None, None, None)
+
 class Value:
-    def __init__(self) -> None:
-        self.set_pos()
-        self.set_context()
-    
+    # No __dict__, and nothing set on a value once it is made, so small numbers, true and false are shared
+    __slots__ = ()
+
+    @property
+    def pos_start(self) -> Position:
+        return LOCATIONS.get(self, NOWHERE)[0]
+
+    @property
+    def pos_end(self) -> Position:
+        return LOCATIONS.get(self, NOWHERE)[1]
+
+    @property
+    def context(self) -> Context:
+        return LOCATIONS.get(self, NOWHERE)[2]
+
     def set_pos(self, pos_start : Position = None, pos_end : Position = None) -> Value:
-        self.pos_start = pos_start
-        self.pos_end = pos_end
+        LOCATIONS[self] = (pos_start, pos_end, self.context)
         return self
     
     def set_context(self, context: Context = None) -> Value:
-        self.context = context
+        LOCATIONS[self] = (self.pos_start, self.pos_end, context)
         return self
     
     def add(self, other) -> tuple[any, RTError]:
@@ -82,6 +98,26 @@ class Value:
     def is_true(self) -> bool:
         return False
     
+    # Python iterator over the values of a for-in loop, None when the value can't be iterated over
+    def iterate(self):
+        return None
+    
+    @staticmethod
+    def locate_error(method_name : str, operands : list, positions : list, context : Context) -> RTError:
+        # Values are shared instead of copied on every read, so their positions can be stale.
+        # The failed operation is run again on copies placed at the nodes the operands come from.
+        located = [
+            operand.copy().set_pos(pos_start, pos_end).set_context(context) if operand is not None else None
+            for operand, (pos_start, pos_end) in zip(operands, positions)
+        ]
+        try:
+            _, error = getattr(located[0], method_name)(*located[1:])
+        finally:
+            # The error has its positions and context, the copies are dropped
+            for operand in located:
+                LOCATIONS.pop(operand, None)
+        return error
+
     def illegal_operation(self, other = None) -> RTError:
         if not other: other = self
         return RTError(
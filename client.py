@@ -0,0 +1,25 @@
+import socket
+from os import getcwd, path
+from sys import argv, stdout
+
+##############
+# ! CLIENT ! #
+##############
+
+# python client.py SOCKET script.pyl [-max-steps=N -max-time=SECONDS -max-depth=N -max-memory=MB]
+# Runs the script on a server started with python PyLang.py -serve=SOCKET and prints what it prints.
+# Only the standard library is imported, the interpreter is already loaded by the server.
+
+server_address, file_name, *args = argv[1:]
+
+client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+client.connect(server_address)
+client.sendall('\0'.join([getcwd(), path.abspath(file_name)] + args).encode())
+client.shutdown(socket.SHUT_WR)
+
+while True:
+    data = client.recv(65536)
+    if not data: break
+    stdout.buffer.write(data)
+stdout.flush()
+client.close()
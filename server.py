@@ -0,0 +1,93 @@
+import gc
+import io
+import signal
+import socketserver
+import sys
+import traceback
+import tracemalloc
+from contextlib import redirect_stdout
+from os import chdir, getcwd, remove
+
+##############
+# ! SERVER ! #
+##############
+
+# Run by PyLang.py -serve=SOCKET (_server_address), with the interpreter, its builtins and the flags of PyLang.py already set up.
+# Every request runs one script, as python PyLang.py script.pyl would, and gets back what it prints.
+# Requests are served one at a time, each in its own SymbolTable(global_symbol_table) and module table,
+# the parsed ASTs stay in memory from one request to the next.
+
+# Request : working directory, script path and flags separated by \0, the script has no input to read
+# Only the limits of the run (-max-steps=N -max-time=SECONDS -max-depth=N -max-memory=MB) can be given per request.
+# A request with a memory limit is traced by tracemalloc, its limit is on what it allocates and not on the peak of the server
+
+GLOBAL_MEMORY_CACHE = True
+
+# Builtins as they are before any request, what imports add to global_symbol_table is removed after each request
+_builtin_symbols = dict(global_symbol_table.symbols)
+
+def _serve_request(working_dir : str, file_name : str, args : list[str]) -> None:
+    global _FileMain, _FreezeAST
+    _FileMain = _FreezeAST = True
+    budget = Budget.from_args(args)
+    chdir(working_dir)
+    try:
+        with open(file_name, "r") as f:
+            script = f.read()
+    except Exception as e:
+        print(f"Failed to load script \"{file_name}\"\n" + str(e))
+        return
+
+    budget = budget or GLOBAL_BUDGET
+    traced = budget != None and budget.max_memory != None
+    if traced: tracemalloc.start()
+    try:
+        _, error = _run(file_name, script, SymbolTable(global_symbol_table), budget)
+    finally:
+        if traced: tracemalloc.stop()
+    if error: print(error)
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        working_dir, file_name, *args = self.rfile.read().decode().split('\0')
+        output = io.TextIOWrapper(self.wfile, write_through=True)
+
+        server_dir = getcwd()
+        old_stdin, sys.stdin = sys.stdin, io.StringIO()
+        try:
+            with redirect_stdout(output):
+                _serve_request(working_dir, file_name, args)
+        except Exception:
+            # A crash of the interpreter ends the request, not the server
+            output.write(traceback.format_exc())
+        finally:
+            sys.stdin = old_stdin
+            chdir(server_dir)
+            global_symbol_table.symbols.clear()
+            global_symbol_table.symbols.update(_builtin_symbols)
+            module_table.modules.clear()
+            module_table.loading.clear()
+            output.flush()
+            output.detach()
+
+class _Server(socketserver.UnixStreamServer):
+    # Run after each request, once its client has its output.
+    # Every request freezes what is alive once its program is parsed, the garbage it left would never be collected.
+    def service_actions(self) -> None:
+        if gc.get_freeze_count():
+            gc.unfreeze()
+            gc.collect()
+
+if path.exists(_server_address): remove(_server_address)
+
+# Stopped by kill as by Ctrl-C, the socket file is removed
+signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+with _Server(_server_address, _RequestHandler) as _server:
+    print(f'PyLang server listening on {_server_address}')
+    try:
+        _server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        remove(_server_address)